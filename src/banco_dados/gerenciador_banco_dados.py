@@ -7,11 +7,15 @@ import logging
 import json
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Union, Tuple
 from datetime import datetime
 
 from src.esquemas.esquemas_tabelas import TABLE_SCHEMAS, INDEXES, EXPORT_QUERIES
 
+# Limite de parâmetros por comando SQL (SQLITE_MAX_VARIABLE_NUMBER): 32766 a partir do
+# SQLite 3.32, 999 nas versões anteriores
+LIMITE_PARAMETROS_SQLITE = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
 
 class GerenciadorBancoDados:
     """Gerenciador de banco de dados SQLite para migração eSocial"""
@@ -164,26 +168,54 @@ class GerenciadorBancoDados:
             self.logger.debug(f"Nenhum dado fornecido para inserção na tabela {nome_tabela}")
             return 0
         
+        # Converter dados para lista se for um único dicionário
+        if isinstance(dados, dict):
+            dados = [dados]
+        
+        # Todos os registros usam as colunas do primeiro
+        colunas = list(dados[0].keys())
+        return self.inserir_linhas(nome_tabela, colunas, [tuple(map(registro.get, colunas)) for registro in dados])
+    
+    def inserir_linhas(self, nome_tabela: str, colunas: Sequence[str], linhas: List[Sequence[Any]]) -> int:
+        """
+        Insere registros já organizados como tuplas de valores na ordem das colunas
+        
+        Evita montar um dicionário por registro quando os dados já estão em linhas,
+        como nas inserções acumuladas pelo processador de XML.
+        
+        Args:
+            nome_tabela: Nome da tabela a ser inserida
+            colunas: Nomes das colunas, na ordem dos valores de cada linha
+            linhas: Lista de tuplas de valores
+            
+        Returns:
+            Número de registros inseridos
+        """
+        if not linhas:
+            self.logger.debug(f"Nenhum dado fornecido para inserção na tabela {nome_tabela}")
+            return 0
+        
         # Validar se a tabela existe
         tabelas_existentes = self.obter_tabelas()
         if nome_tabela not in tabelas_existentes:
             self.logger.error(f"Erro ao inserir dados: Tabela '{nome_tabela}' não existe")
             return 0
         
-        # Converter dados para lista se for um único dicionário
-        if isinstance(dados, dict):
-            dados = [dados]
-        
+        colunas = list(colunas)
         conn = self._obter_conexao()
         cursor = conn.cursor()
         registros_inseridos = 0
         
         try:
+            # Carga em massa: sem fsync a cada commit e com o journal em memória. Os dados
+            # podem ser reimportados dos XMLs, então a durabilidade em caso de queda de
+            # energia não compensa o custo de sincronizar o disco a cada lote
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            
             # Comecar uma transacao explicita para melhor performance com muitos registros
             conn.execute("BEGIN TRANSACTION")
             
-            # Verificar se todos os dados tem as mesmas colunas
-            colunas = list(dados[0].keys())
             marcadores = ["?" for _ in colunas]
             
             # Obter informacoes sobre as colunas da tabela para validacao
@@ -204,61 +236,75 @@ class GerenciadorBancoDados:
             # Verificar se a tabela tem UNIQUE constraint para determinar se podemos usar UPSERT
             if table_sql and "UNIQUE(" in table_sql.upper():
                 # Usar UPSERT se houver UNIQUE constraint
-                sql = f"INSERT INTO {nome_tabela} ({', '.join(colunas)}) VALUES ({', '.join(marcadores)}) " + \
-                      "ON CONFLICT DO UPDATE SET " + \
+                sufixo_sql = " ON CONFLICT DO UPDATE SET " + \
                       ", ".join([f"{col} = excluded.{col}" for col in colunas if col != 'id'])
                 self.logger.debug(f"Usando UPSERT para tabela {nome_tabela} com UNIQUE constraint")
             else:
                 # Caso contrario, usar INSERT simples
-                sql = f"INSERT INTO {nome_tabela} ({', '.join(colunas)}) VALUES ({', '.join(marcadores)})"
+                sufixo_sql = ""
                 self.logger.debug(f"Usando INSERT simples para tabela {nome_tabela} sem UNIQUE constraint")
             
+            # Cada comando insere várias linhas (VALUES (...), (...), ...), respeitando o limite
+            # de parâmetros do SQLite; o comando de cada quantidade de linhas é montado uma vez
+            grupo_marcadores = f"({', '.join(marcadores)})"
+            comandos_sql = {}
+            
+            def sql_para(quantidade_linhas: int) -> str:
+                if quantidade_linhas not in comandos_sql:
+                    comandos_sql[quantidade_linhas] = (
+                        f"INSERT INTO {nome_tabela} ({', '.join(colunas)}) VALUES "
+                        + ", ".join([grupo_marcadores] * quantidade_linhas) + sufixo_sql
+                    )
+                return comandos_sql[quantidade_linhas]
+            
+            # Conversões de tipo de cada coluna, resolvidas uma única vez para todas as linhas
+            conversoes = [
+                ('INTEGER' in colunas_tabela[coluna]['type'], 'REAL' in colunas_tabela[coluna]['type'])
+                for coluna in colunas
+            ]
+            
             # Construir lista de valores para inserção - com lote de 1000 para melhor performance
-            lote_size = 1000
+            lote_size = max(1, min(1000, LIMITE_PARAMETROS_SQLITE // len(colunas)))
             valores = []
+            linhas_lote = 0
             erros = 0
             
-            for idx, registro in enumerate(dados):
-                valores_linha = []
-                for coluna in colunas:
-                    valor = registro.get(coluna)
+            for idx, linha in enumerate(linhas):
+                for valor, coluna, (inteiro, real) in zip(linha, colunas, conversoes):
                     
                     # Converter valores complexos para JSON
                     if isinstance(valor, (dict, list)):
                         valor = json.dumps(valor)
                     
-                    # Validar formato de dados
-                    if coluna in colunas_tabela:
-                        coluna_info = colunas_tabela[coluna]
-                        # Validar tipos numéricos
-                        if 'INTEGER' in coluna_info['type'] and valor and not isinstance(valor, (int, type(None))):
-                            try:
-                                valor = int(valor)
-                            except (ValueError, TypeError):
-                                self.logger.warning(f"Conversao automática para inteiro: '{valor}' para coluna '{coluna}'")
-                                valor = 0
-                        
-                        # Validar tipos reais
-                        if 'REAL' in coluna_info['type'] and valor and not isinstance(valor, (float, type(None))):
-                            try:
-                                valor = float(valor)
-                            except (ValueError, TypeError):
-                                self.logger.warning(f"Conversao automática para float: '{valor}' para coluna '{coluna}'")
-                                valor = 0.0
+                    # Validar tipos numéricos
+                    if inteiro and valor and not isinstance(valor, (int, type(None))):
+                        try:
+                            valor = int(valor)
+                        except (ValueError, TypeError):
+                            self.logger.warning(f"Conversao automática para inteiro: '{valor}' para coluna '{coluna}'")
+                            valor = 0
                     
-                    valores_linha.append(valor)
-                
-                valores.append(tuple(valores_linha))
+                    # Validar tipos reais
+                    if real and valor and not isinstance(valor, (float, type(None))):
+                        try:
+                            valor = float(valor)
+                        except (ValueError, TypeError):
+                            self.logger.warning(f"Conversao automática para float: '{valor}' para coluna '{coluna}'")
+                            valor = 0.0
+                    
+                    valores.append(valor)
+                linhas_lote += 1
                 
                 # Processar em lotes para evitar problemas de memória com grandes volumes de dados
-                if len(valores) >= lote_size or idx == len(dados) - 1:
+                if linhas_lote >= lote_size or idx == len(linhas) - 1:
                     try:
-                        cursor.executemany(sql, valores)
-                        registros_inseridos += len(valores)
-                        valores = []
+                        cursor.execute(sql_para(linhas_lote), valores)
+                        registros_inseridos += linhas_lote
                     except Exception as e:
                         erros += 1
                         self.logger.error(f"Erro ao inserir lote de dados na tabela {nome_tabela}: {e}", exc_info=True)
+                    valores = []
+                    linhas_lote = 0
             
             # Commit das alterações
             conn.commit()
@@ -49,6 +49,8 @@ class Configuracoes:
             'tamanho_lote': 1000,  # Tamanho do lote para inserção em massa
             'tempo_limite_segundos': 300,  # Tempo limite para operações de BD
             'processamento_paralelo': False,  # Processamento paralelo
+            'num_processos': None,  # Processos de trabalho no modo paralelo (None: um por CPU)
+            'armazenar_json': True,  # Gravar o evento completo em json_data (usado pelos exportadores)
         }
         
         # Templates de exportação
@@ -291,6 +293,17 @@ class Configuracoes:
         parallel = os.getenv('ESOCIAL_PARALLEL_PROCESSING')
         if parallel:
             self.CONFIG_PROCESSAMENTO['processamento_paralelo'] = parallel.lower() == 'true'
+            
+        num_processes = os.getenv('ESOCIAL_NUM_PROCESSES')
+        if num_processes:
+            try:
+                self.CONFIG_PROCESSAMENTO['num_processos'] = int(num_processes)
+            except ValueError:
+                pass
+            
+        store_json = os.getenv('ESOCIAL_STORE_JSON')
+        if store_json:
+            self.CONFIG_PROCESSAMENTO['armazenar_json'] = store_json.lower() == 'true'
     
     def _carregar_logging_conf(self) -> dict:
         """Carrega configurações do arquivo logging.conf."""
@@ -349,3 +362,8 @@ class Configuracoes:
         if args.get('database'):
             self.CAMINHO_BANCO_DADOS = Path(args['database'])
             self.CAMINHO_BANCO_DADOS.parent.mkdir(parents=True, exist_ok=True)
+            
+        # Informar o número de processos habilita o processamento paralelo dos XMLs
+        if args.get('processos'):
+            self.CONFIG_PROCESSAMENTO['processamento_paralelo'] = args['processos'] > 1
+            self.CONFIG_PROCESSAMENTO['num_processos'] = args['processos']
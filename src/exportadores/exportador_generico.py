@@ -11,6 +11,13 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from tqdm import tqdm
 
+# Exportação colunar opcional: o Parquet é gravado pelo pandas, que depende do pyarrow
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
 
 class ExportadorGenerico:
     """
@@ -295,6 +302,46 @@ class ExportadorGenerico:
             self.logger.error(f"Erro na exportação personalizada: {e}", exc_info=True)
             return False
     
+    def exportar_parquet(self, consulta_sql: str, nome_arquivo: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Exporta o resultado de uma consulta SQL para um arquivo Parquet (compressão snappy)
+        
+        As tabelas do eSocial têm dezenas de colunas de texto com valores repetidos;
+        no formato colunar o arquivo fica bem menor que o CSV e é lido mais rápido
+        por ferramentas de análise. Requer o pacote opcional pyarrow.
+        
+        Args:
+            consulta_sql: Consulta SQL a ser executada
+            nome_arquivo: Nome do arquivo de saída
+            params: Parâmetros para a consulta (opcional)
+            
+        Returns:
+            True se a exportação for bem-sucedida, False caso contrário
+        """
+        if not PARQUET_DISPONIVEL:
+            self.logger.error("Exportação Parquet indisponível: instale o pacote pyarrow")
+            return False
+        
+        try:
+            self.logger.info(f"Executando exportação Parquet: {nome_arquivo}")
+            
+            params_tuple = tuple(params.values()) if params else ()
+            dados = self.gerenciador_bd.executar_query(consulta_sql, params_tuple)
+            
+            if not dados:
+                self.logger.warning("Exportação Parquet: Nenhum dado encontrado")
+                return False
+            
+            caminho_arquivo = Path(self.caminho_saida) / nome_arquivo
+            pd.DataFrame(dados).to_parquet(caminho_arquivo, engine='pyarrow', compression='snappy', index=False)
+            self.logger.info(f"Exportação Parquet: Exportado {len(dados)} registros para {caminho_arquivo}")
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erro na exportação Parquet: {e}", exc_info=True)
+            return False
+    
     def aplicar_formatacao(self, dados, formatos):
         """
         Aplica formatação simples: datas para DD/MM/AAAA se formato for data, números para 2 casas e vírgula.
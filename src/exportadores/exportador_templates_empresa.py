@@ -183,8 +183,10 @@ class ExportadorTemplatesEmpresa:
             return valor
         # 3. Valor padrão
         mapeamento = self.mapeador.mapeamentos.get(chave_template, {})
-        campos = mapeamento.get("campos", {})
-        return campos.get(coluna, {}).get("valor_padrao", "")
+        definicao = mapeamento.get("campos", {}).get(coluna)
+        if definicao is None or definicao.valor_padrao is None:
+            return ""
+        return definicao.valor_padrao
 
     def _extrair_array_para_template(self, dados, colunas, chave_template, metodo_extracao, array_nome_log):
         """
@@ -283,18 +285,17 @@ class ExportadorTemplatesEmpresa:
             self.logger.warning(f"Nenhum registro encontrado para {nome_template}")
             return []
         registros_processados = []
-        for idx, registro in enumerate(dados):
+        campos = mapeador.mapeamentos[nome_template_sem_ext]['campos']
+        for registro in dados:
+            # Os campos do json_data já vêm da projeção com caminhos alternativos e valor padrão;
+            # colunas do banco vazias recebem aqui o valor padrão do campo
+            projecao = mapeador.projetar_registro(nome_template_sem_ext, registro)
             linha = {}
-            json_str = registro.get("json_data", "{}")
-            try:
-                import json
-                json_data = json.loads(json_str) if isinstance(json_str, str) else json_str
-            except Exception:
-                json_data = {}
             for coluna in colunas:
-                valor = mapeador.obter_valor_campo(nome_template_sem_ext, coluna, registro)
+                valor = projecao.get(coluna)
                 if valor is None or (isinstance(valor, str) and not valor.strip()):
-                    valor = mapeador._extrair_valor_json_com_alternativos(json_data, mapeador.mapeamentos.get(nome_template_sem_ext, {}).get('campos', {}).get(coluna, {}))
+                    definicao = campos.get(coluna)
+                    valor = definicao.valor_padrao if definicao is not None else None
                 linha[coluna] = valor if valor is not None else ""
             registros_processados.append(linha)
         self.logger.info(f"[DEBUG] {nome_template}: {len(registros_processados)} registros processados/exportados.")
@@ -1829,7 +1830,7 @@ class ExportadorTemplatesEmpresa:
         
         if mapeamento and 'campos' in mapeamento:
             for campo, definicao in mapeamento['campos'].items():
-                if definicao.get('obrigatorio'):
+                if definicao.obrigatorio:
                     colunas_obrigatorias.append(campo)
         
         if colunas_obrigatorias:
@@ -22,16 +22,27 @@ from banco_dados.gerenciador_banco_dados import GerenciadorBancoDados
 from processadores.processador_xml import ProcessadorXML
 from exportadores.exportador_templates_empresa import ExportadorTemplatesEmpresa
 
+# Níveis de log aceitos na linha de comando
+_NIVEIS_LOG = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+}
+
+# Diretório e arquivo de log da aplicação
+_DIRETORIO_LOGS = Path("logs")
+_ARQUIVO_LOG = _DIRETORIO_LOGS / 'application.log'
+
 def configurar_logging(nivel_log: str = "INFO"):
     """Configura o sistema de logging da aplicação e retorna o logger principal"""
-    nivel_numerico = getattr(logging, nivel_log.upper(), logging.INFO)
-    diretorio_logs = Path("logs")
-    diretorio_logs.mkdir(exist_ok=True)
+    nivel_numerico = _NIVEIS_LOG.get(nivel_log.upper(), logging.INFO)
+    _DIRETORIO_LOGS.mkdir(exist_ok=True)
     logging.basicConfig(
         level=nivel_numerico,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(diretorio_logs / 'application.log'),
+            logging.FileHandler(_ARQUIVO_LOG),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -66,6 +77,12 @@ def analisar_argumentos() -> Dict[str, Any]:
         help='Caminho do banco de dados SQLite (padrão: data/db/esocial.db)'
     )
     
+    parser.add_argument(
+        '--processos', '-p',
+        type=int,
+        help='Número de processos para analisar os XMLs em paralelo (padrão: processamento sequencial)'
+    )
+    
     parser.add_argument(
         '--log-level', '-l',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
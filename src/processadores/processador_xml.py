@@ -3,19 +3,581 @@ Processador de arquivos XML do eSocial
 """
 
 import os
+import re
+import sys
 import logging
+import threading
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-import xml.etree.ElementTree as ET
 import json
 from datetime import datetime
+import pandas as pd
 from tqdm import tqdm
 
 from utils.validador_dados import ValidadorDados
 
+# Parser XML: lxml (libxml2, em C) quando disponível, com fallback para a biblioteca padrão
+try:
+    from lxml import etree as ET
+    LXML_DISPONIVEL = True
+except ImportError:  # pragma: no cover - lxml é dependência declarada
+    import xml.etree.ElementTree as ET
+    LXML_DISPONIVEL = False
+
+# Serializador JSON: orjson (em Rust) quando disponível, com fallback para a biblioteca padrão
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
+# Classe dos elementos lxml; elementos da biblioteca padrão também são aceitos pelas funções de busca
+ElementoLxml = ET._Element if LXML_DISPONIVEL else ()
+
+
+def serializar_json(dados) -> str:
+    """
+    Serializa dados em JSON para a coluna json_data
+    
+    Os dois caminhos produzem o mesmo formato compacto, sem espaços e sem escapar
+    caracteres acentuados, independentemente de o orjson estar instalado.
+    
+    Args:
+        dados: Estrutura de dicionários, listas e strings
+    
+    Returns:
+        Texto JSON
+    """
+    if ORJSON_DISPONIVEL:
+        return orjson.dumps(dados).decode()
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':'))
+
+
+# Opções do parser lxml. Comentários e instruções de processamento são descartados:
+# no lxml o tag desses nós não é uma string, e nenhum processador os utiliza
+OPCOES_PARSER = dict(
+    huge_tree=True,
+    recover=False,
+    remove_blank_text=True,
+    resolve_entities=False,
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+) if LXML_DISPONIVEL else {}
+
+
+def _criar_parser_xml(encoding=None):
+    """
+    Cria o parser XML usado na leitura dos arquivos do eSocial
+    
+    Args:
+        encoding: Encoding que substitui o declarado no arquivo (opcional)
+    
+    Returns:
+        Instância de XMLParser (lxml), ou None para usar o parser padrão
+    """
+    if not LXML_DISPONIVEL:
+        return ET.XMLParser(encoding=encoding) if encoding else None
+    return ET.XMLParser(encoding=encoding, **OPCOES_PARSER)
+
+
+# Parsers reaproveitados entre arquivos, um por thread (parsers lxml não podem ser
+# usados por duas threads ao mesmo tempo) e por encoding forçado; o dicionário de
+# nomes do parser é reaproveitado
+_parsers_por_thread = threading.local()
+
+
+def obter_parser_xml(encoding=None):
+    """
+    Retorna o parser XML da thread atual, criando-o na primeira chamada
+    
+    Args:
+        encoding: Encoding que substitui o declarado no arquivo (opcional)
+    
+    Returns:
+        Instância de XMLParser (lxml), ou None para usar o parser padrão
+    """
+    if not LXML_DISPONIVEL:
+        # Parsers da biblioteca padrão não podem ser reutilizados após a leitura
+        return _criar_parser_xml(encoding)
+    try:
+        parsers = _parsers_por_thread.parsers
+    except AttributeError:
+        parsers = _parsers_por_thread.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = _criar_parser_xml(encoding)
+    return parser
+
+
+def carregar_xml(caminho_arquivo, parser=None):
+    """
+    Carrega um arquivo XML e retorna a árvore
+    
+    Args:
+        caminho_arquivo: Caminho do arquivo XML
+        parser: Parser alternativo (padrão: parser reaproveitado da thread atual)
+        
+    Returns:
+        ElementTree do arquivo
+    """
+    return ET.parse(str(caminho_arquivo), parser=parser or obter_parser_xml())
+
+
+# Encoding informado na declaração XML (<?xml ... encoding="..."?>)
+_ENCODING_DECLARADO_RE = re.compile(rb'<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+
+
+def detectar_encoding_xml(dados: bytes) -> Optional[str]:
+    """
+    Verifica se o conteúdo de um arquivo XML é válido no encoding declarado
+    
+    Args:
+        dados: Conteúdo do arquivo em bytes
+        
+    Returns:
+        None se o conteúdo é válido no encoding declarado (UTF-8 se não houver
+        declaração); caso contrário 'iso-8859-1', comum em arquivos exportados por
+        sistemas legados
+    """
+    declaracao = _ENCODING_DECLARADO_RE.match(dados.lstrip(b'\xef\xbb\xbf'))
+    encoding = declaracao.group(1).decode('ascii') if declaracao else 'utf-8'
+    try:
+        dados.decode(encoding)
+        return None
+    except (UnicodeDecodeError, LookupError):
+        return 'iso-8859-1'
+
+
+def carregar_xml_com_encoding_detectado(caminho_arquivo):
+    """
+    Carrega um arquivo XML cujo conteúdo não corresponde ao encoding declarado
+    
+    O arquivo é lido uma única vez em bytes e analisado com o encoding detectado.
+    
+    Args:
+        caminho_arquivo: Caminho do arquivo XML
+        
+    Returns:
+        Elemento raiz do XML, ou None se o encoding declarado já estava correto
+    """
+    dados = Path(caminho_arquivo).read_bytes()
+    encoding = detectar_encoding_xml(dados)
+    if encoding is None:
+        return None
+    return ET.fromstring(dados, obter_parser_xml(encoding))
+
+
+# Arquivos até este tamanho são lidos de uma vez em bytes e analisados em uma única
+# chamada ao parser, bem mais rápida que o iterparse com eventos de início e fim
+LIMITE_LEITURA_INTEGRAL = 1024 * 1024
+
+
+def iterar_eventos_esocial(caminho_arquivo, tamanho_arquivo: Optional[int] = None):
+    """
+    Percorre um arquivo XML em streaming, entregando cada evento do eSocial
+    
+    Quando a raiz é <eSocial>, cada filho direto é entregue assim que termina de ser
+    lido e, após o processamento, é limpo e removido da árvore. Para qualquer outra
+    raiz, a árvore completa é entregue ao final da leitura.
+    
+    Se o tamanho informado não passar de LIMITE_LEITURA_INTEGRAL, o arquivo é lido
+    inteiro em bytes e os eventos são entregues a partir da árvore já montada; a
+    memória de arquivos pequenos não justifica o custo do streaming.
+
+    A leitura não usa filtro de tag por layout (iterparse(tag=...)): eventos não
+    suportados também precisam ser entregues, para que o layout e os avisos do
+    arquivo continuem sendo reportados, e o filtro não distingue a profundidade.
+
+    Args:
+        caminho_arquivo: Caminho do arquivo XML
+        tamanho_arquivo: Tamanho do arquivo em bytes, se já conhecido (opcional)
+        
+    Yields:
+        Tuplas (raiz, evento); evento é a própria raiz quando ela não é <eSocial>
+    """
+    if tamanho_arquivo is not None and tamanho_arquivo <= LIMITE_LEITURA_INTEGRAL:
+        raiz = ET.fromstring(Path(caminho_arquivo).read_bytes(), obter_parser_xml())
+        if raiz.tag.endswith('eSocial'):
+            for evento in raiz:
+                yield raiz, evento
+        else:
+            yield raiz, raiz
+        return
+    
+    raiz = None
+    profundidade = 0
+    for acao, elem in ET.iterparse(str(caminho_arquivo), events=('start', 'end'), **OPCOES_PARSER):
+        if acao == 'start':
+            if raiz is None:
+                raiz = elem
+            profundidade += 1
+            continue
+        profundidade -= 1
+        if profundidade == 1 and raiz.tag.endswith('eSocial'):
+            yield raiz, elem
+            # Liberar o evento já processado e os irmãos anteriores
+            elem.clear()
+            while raiz[0] is not elem:
+                del raiz[0]
+    if raiz is not None and not raiz.tag.endswith('eSocial'):
+        yield raiz, raiz
+
 # Base de namespaces do eSocial - versão agnóstica
 NAMESPACE_BASE = 'http://www.esocial.gov.br/schema/evt'
 
+# Escopos extraídos de cada bloco do S-1020 ({escopo: escopo pai}), por tipo de bloco
+_ESCOPOS_S1020_DADOS = {
+    'dadosLotacao': None,
+    'fpasLotacao': 'dadosLotacao',
+    'infoProcJudTerceiros': 'fpasLotacao',
+    'procJudTerceiro': 'infoProcJudTerceiros',
+    'infoEmprParcial': 'dadosLotacao',
+    'dadosOpPort': 'dadosLotacao',
+}
+ESCOPOS_S1020 = {
+    'inclusao': {'ideLotacao': None, **_ESCOPOS_S1020_DADOS},
+    'alteracao': {'ideLotacao': None, 'novaValidade': None, **_ESCOPOS_S1020_DADOS},
+    'exclusao': {'ideLotacao': None},
+}
+# Elementos categóricos do S-1020 (tipos, FPAS, códigos e validades), que se repetem
+# entre as lotações e por isso são internados na extração
+CATEGORICOS_S1020 = frozenset((
+    'iniValid', 'fimValid', 'tpLotacao', 'tpInsc', 'fpas', 'codTercs',
+    'codTercsSusp', 'codSusp', 'codTerc', 'tpInscContrat', 'tpInscProp',
+))
+
+# Escopos extraídos do evento S-2200 ({escopo: escopo pai})
+ESCOPOS_S2200 = {
+    'ideEmpregador': None,
+    'trabalhador': None,
+    'nascimento': 'trabalhador',
+    'endereco': 'trabalhador',
+    'brasil': 'endereco',
+    'exterior': 'endereco',
+    'trabImig': 'trabalhador',
+    'infoDeficiencia': 'trabalhador',
+    'contato': 'trabalhador',
+    'documentos': 'trabalhador',
+    'rg': 'documentos',
+    'ctps': 'documentos',
+    'cnh': 'documentos',
+    'rne': 'documentos',
+    'passaporte': 'documentos',
+    'ric': 'documentos',
+    'tituloEleitor': 'documentos',
+    'certidaoMilitar': 'documentos',
+    'conselho': 'documentos',
+    'trabEstrangeiro': 'trabalhador',
+    'vinculo': None,
+    'infoRegimeTrab': 'vinculo',
+    'infoCeletista': 'infoRegimeTrab',
+    'FGTS': 'infoCeletista',
+    'trabTemporario': 'infoCeletista',
+    'infoEstatutario': 'infoRegimeTrab',
+    'infoContrato': 'vinculo',
+    'remuneracao': 'infoContrato',
+    'duracao': 'infoContrato',
+    'observacoes': 'infoContrato',
+    'sucessaoVinc': 'vinculo',
+    'transfDom': 'vinculo',
+    'mudancaCPF': 'vinculo',
+    'afastamento': 'vinculo',
+    'desligamento': 'vinculo',
+    'cessao': 'vinculo',
+}
+
+# Campos do registro S-2200, na ordem das colunas: (escopo, elemento, coluna)
+CAMPOS_S2200 = (
+    # Dados básicos do trabalhador
+    ('trabalhador', 'cpfTrab', 'cpf_trabalhador'),
+    ('trabalhador', 'nmTrab', 'nome_trabalhador'),
+    ('trabalhador', 'sexo', 'sexo'),
+    ('trabalhador', 'racaCor', 'raca_cor'),
+    ('trabalhador', 'estCiv', 'estado_civil'),
+    ('trabalhador', 'grauInstr', 'grau_instrucao'),
+    ('trabalhador', 'nmSoc', 'nome_social'),
+    # Nascimento
+    ('nascimento', 'dtNascto', 'data_nascimento'),
+    ('nascimento', 'nmMae', 'nm_mae'),
+    ('nascimento', 'nmPai', 'nm_pai'),
+    ('nascimento', 'uf', 'uf_nasc'),
+    ('nascimento', 'paisNascto', 'pais_nasc'),
+    ('nascimento', 'paisNac', 'pais_nac'),
+    # Endereço Brasil
+    ('brasil', 'tpLograd', 'tp_lograd'),
+    ('brasil', 'dscLograd', 'dsc_lograd'),
+    ('brasil', 'nrLograd', 'nr_lograd'),
+    ('brasil', 'complemento', 'complemento'),
+    ('brasil', 'cep', 'cep'),
+    ('brasil', 'bairro', 'bairro'),
+    ('brasil', 'codMunic', 'cod_munic'),
+    ('brasil', 'nmCid', 'nm_cidade'),
+    ('brasil', 'uf', 'uf_resid'),
+    # Endereço Exterior
+    ('exterior', 'paisResid', 'pais_resid'),
+    ('exterior', 'bairro', 'bairro_ext'),
+    ('exterior', 'dscLograd', 'dsc_lograd_ext'),
+    ('exterior', 'nrLograd', 'nr_lograd_ext'),
+    ('exterior', 'complemento', 'complemento_ext'),
+    ('exterior', 'nmCid', 'nm_cidade_ext'),
+    ('exterior', 'codPostal', 'cod_postal_ext'),
+    # Trabalhador Imigrante
+    ('trabImig', 'tmpResid', 'tmp_resid'),
+    ('trabImig', 'condIng', 'cond_ing'),
+    # InfoDeficiencia
+    ('infoDeficiencia', 'defFisica', 'def_fisica'),
+    ('infoDeficiencia', 'defVisual', 'def_visual'),
+    ('infoDeficiencia', 'defAuditiva', 'def_auditiva'),
+    ('infoDeficiencia', 'defMental', 'def_mental'),
+    ('infoDeficiencia', 'defIntelectual', 'def_intelectual'),
+    ('infoDeficiencia', 'reabReadap', 'reab_readap'),
+    ('infoDeficiencia', 'infoCota', 'info_cota'),
+    ('infoDeficiencia', 'observacao', 'observacao_def'),
+    # Contato
+    ('contato', 'fonePrinc', 'fone_princ'),
+    ('contato', 'foneAlternativo', 'fone_alt'),
+    ('contato', 'emailPrinc', 'email_princ'),
+    ('contato', 'emailAlternativo', 'email_alt'),
+    ('contato', 'contatoEmergencia', 'contato_emerg'),
+    ('contato', 'foneEmergencia', 'fone_emerg'),
+    ('contato', 'parentescoEmergencia', 'parentesco_emerg'),
+    # Documentos - Enhanced
+    ('trabalhador', 'nisTrab', 'nis_trabalhador'),
+    ('rg', 'nrRg', 'nr_rg'),
+    ('rg', 'orgaoEmissor', 'orgao_emissor_rg'),
+    ('rg', 'dtExped', 'dt_exped_rg'),
+    ('rg', 'uf', 'uf_rg'),
+    ('ctps', 'nrCtps', 'nr_ctps'),
+    ('ctps', 'serieCtps', 'serie_ctps'),
+    ('ctps', 'ufCtps', 'uf_ctps'),
+    ('ctps', 'dtExped', 'dt_exped_ctps'),
+    ('cnh', 'nrRegCnh', 'nr_reg_cnh'),
+    ('cnh', 'categoriaCnh', 'categoria_cnh'),
+    ('cnh', 'ufCnh', 'uf_cnh'),
+    ('cnh', 'dtExped', 'dt_exped_cnh'),
+    ('cnh', 'dtPriHab', 'dt_pri_hab'),
+    ('cnh', 'dtValid', 'dt_valid_cnh'),
+    ('rne', 'nrRne', 'nr_rne'),
+    ('rne', 'orgaoEmissor', 'orgao_emissor_rne'),
+    ('rne', 'uf', 'uf_rne'),
+    ('rne', 'dtExped', 'dt_exped_rne'),
+    ('passaporte', 'nrPassaporte', 'nr_passaporte'),
+    ('passaporte', 'paisOrigem', 'pais_origem_passaporte'),
+    ('passaporte', 'dtExped', 'dt_exped_passaporte'),
+    ('passaporte', 'dtValid', 'dt_valid_passaporte'),
+    ('ric', 'nrRic', 'nr_ric'),
+    ('ric', 'orgaoEmissor', 'orgao_emissor_ric'),
+    ('ric', 'uf', 'uf_ric'),
+    ('ric', 'dtExped', 'dt_exped_ric'),
+    ('tituloEleitor', 'nrTitulo', 'nr_titulo'),
+    ('tituloEleitor', 'zona', 'zona_titulo'),
+    ('tituloEleitor', 'secao', 'secao_titulo'),
+    ('tituloEleitor', 'codMunic', 'cod_munic_titulo'),
+    ('tituloEleitor', 'nmCid', 'nm_cidade_titulo'),
+    ('tituloEleitor', 'uf', 'uf_titulo'),
+    ('tituloEleitor', 'dtExped', 'dt_exped_titulo'),
+    ('certidaoMilitar', 'nrCertidao', 'nr_certidao'),
+    ('certidaoMilitar', 'dtExped', 'dt_exped_certidao'),
+    ('certidaoMilitar', 'regiaoMilitar', 'regiao_militar'),
+    ('certidaoMilitar', 'tipoCertidao', 'tipo_certidao'),
+    ('certidaoMilitar', 'nrCertidao2', 'nr_certidao2'),
+    ('certidaoMilitar', 'nrSerie', 'nr_serie'),
+    ('certidaoMilitar', 'dtExped2', 'dt_exped_certidao2'),
+    ('certidaoMilitar', 'categoria', 'categoria_certidao'),
+    ('conselho', 'nrRegistro', 'nr_registro_conselho'),
+    ('conselho', 'orgaoEmissor', 'orgao_emissor_conselho'),
+    ('conselho', 'uf', 'uf_conselho'),
+    ('conselho', 'dtExped', 'dt_exped_conselho'),
+    ('conselho', 'dtValidade', 'dt_validade_conselho'),
+    # Trabalhador Estrangeiro
+    ('trabEstrangeiro', 'dtChegada', 'dt_chegada'),
+    ('trabEstrangeiro', 'classTrabEstrang', 'class_trab_estrang'),
+    ('trabEstrangeiro', 'casadoBr', 'casado_br'),
+    ('trabEstrangeiro', 'filhosBr', 'filhos_br'),
+    # Vínculo
+    ('vinculo', 'matricula', 'matricula'),
+    ('vinculo', 'tpRegTrab', 'tp_reg_trab'),
+    ('vinculo', 'tpRegPrev', 'tp_reg_prev'),
+    ('vinculo', 'cadIni', 'cad_ini'),
+    # InfoCeletista
+    ('infoCeletista', 'dtAdm', 'dt_adm'),
+    ('infoCeletista', 'tpAdmissao', 'tp_admissao'),
+    ('infoCeletista', 'indAdmissao', 'ind_admissao'),
+    ('infoCeletista', 'nrProcTrab', 'nr_proc_trab'),
+    ('infoCeletista', 'tpRegJor', 'tp_reg_jor'),
+    ('infoCeletista', 'natAtividade', 'nat_atividade'),
+    ('infoCeletista', 'dtBase', 'dt_base'),
+    ('infoCeletista', 'cnpjSindCategProf', 'cnpj_sind_categ_prof'),
+    ('infoCeletista', 'matAnotJud', 'mat_anot_jud'),
+    ('FGTS', 'dtOpcFGTS', 'dt_opc_fgts'),
+    # Trabalho Temporário
+    ('trabTemporario', 'hipLeg', 'hip_leg'),
+    ('trabTemporario', 'justContr', 'just_contr'),
+    ('trabTemporario', 'tpInscEstab', 'tp_insc_estab'),
+    ('trabTemporario', 'nrInscEstab', 'nr_insc_estab'),
+    ('trabTemporario', 'cpfTrabSubst', 'cpf_trab_subst'),
+    # InfoEstatutario
+    ('infoEstatutario', 'tpProv', 'tp_prov'),
+    ('infoEstatutario', 'dtExercicio', 'dt_exercicio'),
+    ('infoEstatutario', 'tpPlanRP', 'tp_plan_rp'),
+    ('infoEstatutario', 'indTetoRGPS', 'ind_teto_rgps'),
+    ('infoEstatutario', 'indAbonoPerm', 'ind_abono_perm'),
+    ('infoEstatutario', 'dtIniAbono', 'dt_ini_abono'),
+    # InfoContrato
+    ('infoContrato', 'nmCargo', 'nm_cargo'),
+    ('infoContrato', 'CBOCargo', 'cbo_cargo'),
+    ('infoContrato', 'dtIngrCargo', 'dt_ingr_cargo'),
+    ('infoContrato', 'nmFuncao', 'nm_funcao'),
+    ('infoContrato', 'CBOFuncao', 'cbo_funcao'),
+    ('infoContrato', 'acumCargo', 'acum_cargo'),
+    ('infoContrato', 'codCateg', 'cod_categoria'),
+    ('remuneracao', 'vrSalFx', 'salario_contratual'),
+    ('remuneracao', 'undSalFixo', 'und_sal_fixo'),
+    ('duracao', 'tpContr', 'tipo_contrato'),
+    ('duracao', 'dtTerm', 'duracao_contrato'),
+    ('duracao', 'clauAssec', 'clau_assec'),
+    ('duracao', 'objDet', 'obj_det'),
+    # Sucessão de Vínculo
+    ('sucessaoVinc', 'tpInsc', 'sucessao_tp_insc'),
+    ('sucessaoVinc', 'nrInsc', 'sucessao_nr_insc'),
+    ('sucessaoVinc', 'matricAnt', 'sucessao_matric_ant'),
+    ('sucessaoVinc', 'dtTransf', 'sucessao_dt_transf'),
+    ('sucessaoVinc', 'observacao', 'sucessao_observacao'),
+    # Transferência Doméstica
+    ('transfDom', 'cpfSubstituido', 'cpf_substituido'),
+    ('transfDom', 'matricAnt', 'transf_matric_ant'),
+    ('transfDom', 'dtTransf', 'transf_dt_transf'),
+    # Mudança de CPF
+    ('mudancaCPF', 'cpfAnt', 'cpf_ant'),
+    ('mudancaCPF', 'matricAnt', 'mudanca_matric_ant'),
+    ('mudancaCPF', 'dtAltCPF', 'dt_alt_cpf'),
+    ('mudancaCPF', 'observacao', 'mudanca_observacao'),
+    # Afastamento
+    ('afastamento', 'dtIniAfast', 'dt_ini_afast'),
+    ('afastamento', 'codMotAfast', 'cod_mot_afast'),
+    # Desligamento
+    ('desligamento', 'dtDeslig', 'dt_deslig'),
+    # Cessão
+    ('cessao', 'dtIniCessao', 'dt_ini_cessao'),
+    # Dados do empregador
+    ('ideEmpregador', 'nrInsc', 'cnpj_empregador'),
+)
+
+# Escopos e campos do evento S-2205, montados uma única vez para todos os eventos
+ESCOPOS_S2205 = {
+    None: None,
+    'ideEmpregador': None,
+    'ideTrabalhador': None,
+    'alteracao': None,
+    'dadosTrabalhador': 'alteracao',
+    'nascimento': 'dadosTrabalhador',
+}
+CAMPOS_S2205 = (
+    ('ideTrabalhador', 'cpfTrab', 'cpf_trabalhador'),
+    ('dadosTrabalhador', 'nmTrab', 'nome_trabalhador'),
+    ('alteracao', 'dtAlteracao', 'data_alteracao'),
+    ('dadosTrabalhador', 'sexo', 'sexo'),
+    ('dadosTrabalhador', 'racaCor', 'raca_cor'),
+    ('dadosTrabalhador', 'estCiv', 'estado_civil'),
+    ('dadosTrabalhador', 'grauInstr', 'grau_instrucao'),
+    ('nascimento', 'dtNascto', 'data_nascimento'),
+    ('ideEmpregador', 'nrInsc', 'cnpj_empregador'),
+    # S-2205 may not have matricula at root, try alteracao/matricula
+    (None, 'matricula', 'matricula'),
+)
+
+# Escopo de cada <dependente> do S-2200: os textos são lidos do próprio bloco
+ESCOPOS_DEPENDENTE = {None: None}
+
+# Escopos do evento S-2230 (a chave None é o próprio evento)
+ESCOPOS_S2230 = {
+    None: None,
+    'infoAfastamento': None,
+    'iniAfastamento': 'infoAfastamento',
+    'fimAfastamento': 'infoAfastamento',
+}
+
+# Escopos do evento S-2299 ({escopo: escopo pai})
+ESCOPOS_S2299 = {
+    'ideEmpregador': None,
+    'ideVinculo': None,
+    'infoDeslig': None,
+    'infoAvPrevio': 'infoDeslig',
+}
+
+# Escopos do evento S-2206 e do seu bloco infoContrato (a chave None é o próprio bloco)
+ESCOPOS_S2206 = {
+    'ideEmpregador': None,
+    'ideVinculo': None,
+    'ideTrabalhador': None,
+    'altContratual': None,
+}
+ESCOPOS_INFO_CONTRATO_S2206 = {
+    None: None,
+    'remuneracao': None,
+    'duracao': None,
+}
+
+# Escopos e campos de cada bloco do S-1030 (inclusao, alteracao, exclusao)
+ESCOPOS_S1030 = {'ideCargo': None, 'dadosCargo': None}
+CAMPOS_S1030 = (
+    # Dados de identificação do cargo
+    ('ideCargo', 'codCargo', 'codigo'),
+    ('ideCargo', 'iniValid', 'inicio_validade'),
+    ('ideCargo', 'fimValid', 'fim_validade'),
+    # Dados básicos do cargo
+    ('dadosCargo', 'nmCargo', 'descricao'),
+    ('dadosCargo', 'codCBO', 'cbo'),
+    ('dadosCargo', 'cargoPublico', 'cargo_publico'),
+    # Dados complementares do cargo
+    ('dadosCargo', 'nivelCargo', 'nivel_cargo'),
+    ('dadosCargo', 'descSumar', 'desc_sumaria'),
+    ('dadosCargo', 'dtCriacao', 'dt_criacao'),
+    ('dadosCargo', 'dtExtincao', 'dt_extincao'),
+    ('dadosCargo', 'situacao', 'situacao'),
+    ('dadosCargo', 'permiteAcumulo', 'permite_acumulo'),
+    ('dadosCargo', 'permiteContagemEspecial', 'permite_contagem_esp'),
+    ('dadosCargo', 'dedicacaoExclusiva', 'dedicacao_exclusiva'),
+    ('dadosCargo', 'numLei', 'num_lei'),
+    ('dadosCargo', 'dtLei', 'dt_lei'),
+    ('dadosCargo', 'situacaoLei', 'situacao_lei'),
+    ('dadosCargo', 'temFuncao', 'tem_funcao'),
+)
+
+# Descrições dos motivos de afastamento do S-2230 (codMotAfast)
+DESCRICOES_MOTIVO_AFASTAMENTO = {
+    '01': 'Acidente/Doença do trabalho',
+    '03': 'Acidente/Doença não relacionada ao trabalho',
+    '05': 'Afastamento/Licença prevista em regime próprio, sem remuneração',
+    '06': 'Aposentadoria por invalidez',
+    '07': 'Acompanhamento de membro da família enfermo',
+    '08': 'Afastamento/Licença prevista em regime próprio, com remuneração',
+    '10': 'Licença-maternidade',
+    '11': 'Licença-maternidade - (prorrogação)',
+    '12': 'Licença-paternidade',
+    '13': 'Licença-paternidade - (prorrogação)',
+    '14': 'Licença remunerada prevista em CCT/ACT',
+    '15': 'Serviço militar obrigatório',
+    '16': 'Sustação do contrato de trabalho em virtude de inquérito',
+    '17': 'Aposentadoria por invalidez',
+    '18': 'Afastamento pelo INSS por acidente ou doença',
+    '19': 'Afastamento sem remuneração',
+    '20': 'Férias',
+    '21': 'Férias coletivas',
+    '22': 'Licença-prêmio',
+    '23': 'Mandato eleitoral',
+    '24': 'Mandato sindical',
+    '25': 'Suspensão temporária do contrato',
+}
+
+# Quantidade mínima de registros S-1030 de um evento para validar em lote com pandas;
+# abaixo disso, montar o DataFrame custa mais que validar registro a registro
+MINIMO_VALIDACAO_EM_LOTE = 50
+
 # Padrões de eventos eSocial independentes de versão
 ESOCIAL_EVENT_PATTERNS = {
     'evtTabLotacao': 'S-1020', 
@@ -27,6 +589,76 @@ ESOCIAL_EVENT_PATTERNS = {
     'evtAfastTemp': 'S-2230'
 }
 
+# Nomes de arquivo aceitos: contêm S1020, S-1020, S_1020 etc. para cada layout suportado
+_NOME_ARQUIVO_SUPORTADO_RE = re.compile(r'S[-_]?(1020|1030|1200|2200|2205|2206|2230)', re.IGNORECASE)
+
+# Localiza qualquer um dos eventos suportados em um URI de namespace em uma única busca
+_EVENTO_RE = re.compile('|'.join(map(re.escape, ESOCIAL_EVENT_PATTERNS)))
+
+# Cache de namespace por tag qualificado ({uri}nome -> uri)
+_NAMESPACES_POR_TAG: Dict[str, str] = {}
+
+# Cache de expressões de busca por (namespace, nome do elemento)
+_CAMINHOS_BUSCA: Dict[Tuple[str, str], str] = {}
+
+# Cache de tags qualificados ({namespace}nome) por (namespace, nome do elemento)
+_TAGS_QUALIFICADOS: Dict[Tuple[str, str], str] = {}
+
+
+def _caminho_busca(namespace, nome_elemento):
+    """
+    Retorna a expressão de busca './/{namespace}nome', montada uma única vez
+    
+    Args:
+        namespace: URI do namespace (ou None)
+        nome_elemento: Nome do elemento
+        
+    Returns:
+        Expressão de busca para find/findall
+    """
+    chave = (namespace, nome_elemento)
+    caminho = _CAMINHOS_BUSCA.get(chave)
+    if caminho is None:
+        caminho = f".//{{{namespace}}}{nome_elemento}" if namespace else f".//{nome_elemento}"
+        _CAMINHOS_BUSCA[chave] = caminho
+    return caminho
+
+def _tag_qualificado(namespace, nome_elemento):
+    """
+    Retorna o tag '{namespace}nome', montado uma única vez
+    
+    Args:
+        namespace: URI do namespace (ou None)
+        nome_elemento: Nome do elemento
+        
+    Returns:
+        Tag qualificado para iter/iterdescendants
+    """
+    chave = (namespace, nome_elemento)
+    tag = _TAGS_QUALIFICADOS.get(chave)
+    if tag is None:
+        tag = f"{{{namespace}}}{nome_elemento}" if namespace else nome_elemento
+        _TAGS_QUALIFICADOS[chave] = tag
+    return tag
+
+
+def _nome_local(tag):
+    """
+    Retorna o nome local de um tag ('{uri}nome' -> 'nome')
+    
+    Sem namespace, rpartition devolve o tag inteiro no último item. Uma única busca
+    em C, sem a lista de split nem o fatiamento sobre o índice de rfind.
+    """
+    return tag.rpartition('}')[2]
+
+
+def _namespace_do_tag(tag):
+    """
+    Retorna o URI do namespace de um tag qualificado ('{uri}nome' -> 'uri')
+    """
+    return tag[:tag.find('}')].lstrip('{')
+
+
 def extrair_namespace_dinamico(root):
     """
     Extrai o namespace de um elemento XML de forma dinâmica
@@ -40,9 +672,13 @@ def extrair_namespace_dinamico(root):
     if root is None:
         return None
         
-    # Verificar se o tag contém namespace
-    if '}' in root.tag:
-        namespace = root.tag.split('}')[0].strip('{')
+    # Verificar se o tag contém namespace (resultado em cache por tag)
+    tag = root.tag
+    namespace = _NAMESPACES_POR_TAG.get(tag)
+    if namespace is not None:
+        return namespace
+    if '}' in tag:
+        namespace = _NAMESPACES_POR_TAG[tag] = _namespace_do_tag(tag)
         return namespace
     
     # Verificar nos atributos do elemento
@@ -53,7 +689,7 @@ def extrair_namespace_dinamico(root):
     # Procurar nos elementos filhos
     for child in root:
         if '}' in child.tag:
-            namespace = child.tag.split('}')[0].strip('{')
+            namespace = _namespace_do_tag(child.tag)
             if 'esocial.gov.br' in namespace:
                 return namespace
     
@@ -102,27 +738,13 @@ def encontrar_elemento(root, nome_elemento, usar_namespace_dinamico=True):
     """
     if root is None:
         return None
-        
-    # Primeiro, tentar encontrar diretamente (sem namespace)
-    try:
-        elem = root.find(f".//{nome_elemento}")
-        if elem is not None:
-            return elem
-    except Exception:
-        pass
-    
-    if usar_namespace_dinamico:
-        # Extrair namespace do elemento raiz
-        namespace = extrair_namespace_dinamico(root)
-        if namespace:
-            try:
-                elem = root.find(f".//{{{namespace}}}{nome_elemento}")
-                if elem is not None:
-                    return elem
-            except Exception:
-                pass
     
-    return None
+    # Uma única busca: com o namespace do documento (em cache) ou sem namespace
+    namespace = extrair_namespace_dinamico(root) if usar_namespace_dinamico else None
+    if isinstance(root, ElementoLxml):
+        # No lxml o filtro por tag roda em C e a iteração para no primeiro resultado
+        return next(root.iterdescendants(_tag_qualificado(namespace, nome_elemento)), None)
+    return root.find(_caminho_busca(namespace, nome_elemento))
 
 def encontrar_todos_elementos(root, nome_elemento, usar_namespace_dinamico=True):
     """
@@ -136,40 +758,14 @@ def encontrar_todos_elementos(root, nome_elemento, usar_namespace_dinamico=True)
     Returns:
         Lista de elementos encontrados
     """
-    resultados = []
-    
     if root is None:
-        return resultados
-        
-    # Tenta encontrar diretamente
-    try:
-        elems = root.findall(f".//{nome_elemento}")
-        if elems:
-            return elems
-    except Exception:
-        pass
-    
-    if usar_namespace_dinamico:
-        # Obter namespaces dinâmicos
-        namespaces = obter_namespaces_dinamicos(root)
-        
-        # Tenta com diferentes namespaces
-        for prefix, uri in namespaces.items():
-            try:
-                elems = root.findall(f".//{{{uri}}}{nome_elemento}")
-                if elems:
-                    return elems
-            except Exception:
-                pass
-                
-            try:
-                elems = root.findall(f".//{prefix}:{nome_elemento}", namespaces)
-                if elems:
-                    return elems
-            except Exception:
-                pass
+        return []
     
-    return resultados
+    # Uma única busca, como em encontrar_elemento: com o namespace do documento (em cache) ou sem namespace
+    namespace = extrair_namespace_dinamico(root) if usar_namespace_dinamico else None
+    if isinstance(root, ElementoLxml):
+        return list(root.iterdescendants(_tag_qualificado(namespace, nome_elemento)))
+    return root.findall(_caminho_busca(namespace, nome_elemento))
 
 def obter_texto_elemento(root, nome_elemento, usar_namespace_dinamico=True):
     """
@@ -181,8 +777,18 @@ def obter_texto_elemento(root, nome_elemento, usar_namespace_dinamico=True):
         usar_namespace_dinamico: Se True, detecta namespaces automaticamente
         
     Returns:
-        Texto do elemento ou string vazia
+        Texto do elemento ou string vazia (também quando root é None, de modo que os
+        chamadores não precisam testar o elemento pai antes de cada campo)
     """
+    if root is None:
+        return ""
+    if isinstance(root, ElementoLxml):
+        # Caminho direto do lxml: o tag qualificado fica em cache e a busca para no primeiro descendente
+        namespace = extrair_namespace_dinamico(root) if usar_namespace_dinamico else None
+        for elemento in root.iterdescendants(_tag_qualificado(namespace, nome_elemento)):
+            texto = elemento.text
+            return texto.strip() if texto else ""
+        return ""
     elemento = encontrar_elemento(root, nome_elemento, usar_namespace_dinamico)
     if elemento is not None and elemento.text:
         return elemento.text.strip()
@@ -200,19 +806,17 @@ def extrair_tipo_evento(root):
     """
     # Extrair do namespace
     if '}' in root.tag:
-        namespace = root.tag.split('}')[0].strip('{')
+        namespace = _namespace_do_tag(root.tag)
         # Verificar se é um namespace do eSocial
         if 'esocial.gov.br' in namespace:
             # Extrair tipo de evento do namespace
-            for evento in ESOCIAL_EVENT_PATTERNS.keys():
-                if evento in namespace:
-                    return evento
+            correspondencia = _EVENTO_RE.search(namespace)
+            if correspondencia:
+                return correspondencia.group(0)
     
     # Verificar elementos filhos diretos
     for child in root:
-        tag_name = child.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}')[1]
+        tag_name = _nome_local(child.tag)
         
         # Verificar se é um evento conhecido
         if tag_name in ESOCIAL_EVENT_PATTERNS:
@@ -226,18 +830,236 @@ def extrair_tipo_evento(root):
     
     return None
 
-def encontrar_primeiro_esocial(root):
+def extrair_textos_por_escopo(raiz, escopos, internar=frozenset()):
+    """
+    Coleta, em uma única passagem pela subárvore, o texto do primeiro descendente
+    de cada nome dentro de cada escopo
+    
+    Equivale a obter_texto_elemento(encontrar_elemento(raiz, escopo), nome) para
+    cada par (escopo, nome), mas percorre a árvore uma única vez.
+    
+    Args:
+        raiz: Elemento a ser percorrido
+        escopos: Dicionário {nome do escopo: nome do escopo pai}; pai None indica
+            que o escopo é buscado diretamente a partir da raiz, e a chave None
+            representa a própria raiz
+        internar: Nomes de elementos categóricos cujos textos são internados com
+            sys.intern; os demais (nomes, endereços, CPFs) são mantidos como lidos
+    
+    Returns:
+        Dicionário {nome do escopo: {nome do elemento: texto}} contendo apenas os
+        escopos encontrados
+    """
+    textos = {}
+    intern = sys.intern
+    # Cada item da pilha leva os nomes dos escopos ativos (para testar o escopo pai)
+    # e os próprios dicionários desses escopos (para gravar sem consultar textos)
+    ativos_raiz = dicionarios_raiz = ()
+    if None in escopos:
+        textos[None] = {}
+        ativos_raiz = (None,)
+        dicionarios_raiz = (textos[None],)
+    pilha = [(filho, ativos_raiz, dicionarios_raiz) for filho in reversed(raiz)]
+    desempilhar = pilha.pop
+    empilhar = pilha.append
+    while pilha:
+        elem, ativos, dicionarios = desempilhar()
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        nome = tag.rpartition('}')[2]
+        if dicionarios:
+            texto = elem.text
+            texto = texto.strip() if texto else ""
+            if nome in internar:
+                texto = intern(texto)
+            for dicionario in dicionarios:
+                if nome not in dicionario:
+                    dicionario[nome] = texto
+        # Somente a primeira ocorrência de cada escopo, dentro do seu escopo pai, é considerada
+        if nome in escopos and nome not in textos:
+            pai = escopos[nome]
+            if pai is None or pai in ativos:
+                dicionario = textos[nome] = {}
+                ativos = ativos + (nome,)
+                dicionarios = dicionarios + (dicionario,)
+        if len(elem):
+            for filho in reversed(elem):
+                empilhar((filho, ativos, dicionarios))
+    return textos
+
+@lru_cache(maxsize=8192)
+def converter_decimal(valor: str) -> float:
+    """
+    Converte um valor decimal do XML (com ponto ou vírgula) para float
+    
+    Valores como "0.00" e salários se repetem em muitas rubricas; o cache limitado
+    evita reconverter os mais frequentes.
+    
+    Args:
+        valor: Texto do valor
+    
+    Returns:
+        Valor convertido, ou 0.0 se estiver vazio ou não for numérico
+    """
+    if not valor:
+        return 0.0
+    try:
+        # Decimais válidos têm no máximo um separador: basta trocar a primeira vírgula
+        return float(valor if valor.find(',') < 0 else valor.replace(',', '.', 1))
+    except ValueError:
+        return 0.0
+
+# Escopo ausente: todos os seus campos ficam vazios
+_TEXTOS_VAZIOS = {}
+
+def mapear_campos(textos, campos):
+    """
+    Monta um registro a partir dos textos coletados por extrair_textos_por_escopo
+    
+    Args:
+        textos: Dicionário {escopo: {nome do elemento: texto}}
+        campos: Sequência de tuplas (escopo, nome do elemento, coluna)
+    
+    Returns:
+        Dicionário {coluna: texto}, na ordem dos campos; campos ausentes ficam vazios
+    """
+    return {coluna: textos.get(escopo, _TEXTOS_VAZIOS).get(nome, "") for escopo, nome, coluna in campos}
+
+# Blocos do S-1200 lidos uma única vez por evento (primeira ocorrência)
+_ESCOPOS_CONTEXTO_S1200 = ('ideEmpregador', 'ideEvento', 'ideTrabalhador')
+
+def coletar_itens_remuneracao(raiz):
+    """
+    Percorre um evento S-1200 (evtRemun) em uma única passagem, no estilo de um leitor SAX
+    
+    Equivale às buscas aninhadas dmDev → infoPerApur (o primeiro de cada dmDev) →
+    ideEstabLot → remunPerApur → itensRemun, coletando durante a mesma passagem o
+    texto do primeiro descendente de cada nome em cada nível.
+    
+    Args:
+        raiz: Elemento do evento
+    
+    Returns:
+        Tupla (contexto, itens): contexto é {ideEmpregador/ideEvento/ideTrabalhador:
+        {nome: texto}}; itens é uma lista, em ordem de documento, de tuplas (textos do
+        dmDev, textos do ideEstabLot, textos do remunPerApur, textos do itensRemun,
+        elemento itensRemun)
     """
-    Busca recursivamente o primeiro elemento <eSocial> em qualquer profundidade.
+    contexto = {}
+    itens = []
+    intern = sys.intern
+    # Estado de cada nó: (elemento, textos ativos, [textos do dmDev, infoPerApur já visto],
+    # dentro do infoPerApur, textos do ideEstabLot, textos do remunPerApur)
+    pilha = [(filho, (), None, False, None, None) for filho in reversed(raiz)]
+    while pilha:
+        elem, ativos, dm_dev, em_info_per_apur, estab_lot, remun = pilha.pop()
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        nome = tag.rpartition('}')[2]
+        if ativos:
+            # Rubricas, códigos e valores se repetem entre trabalhadores; internados, as
+            # linhas acumuladas para gravação compartilham uma única instância de cada
+            texto = elem.text
+            texto = intern(texto.strip()) if texto else ""
+            for textos in ativos:
+                textos.setdefault(nome, texto)
+        
+        if nome in _ESCOPOS_CONTEXTO_S1200:
+            if nome not in contexto:
+                contexto[nome] = {}
+                ativos = ativos + (contexto[nome],)
+        elif nome == 'dmDev':
+            dm_dev = [{}, False]
+            ativos = ativos + (dm_dev[0],)
+            em_info_per_apur, estab_lot, remun = False, None, None
+        elif nome == 'infoPerApur':
+            if dm_dev is not None and not dm_dev[1]:
+                dm_dev[1] = True
+                em_info_per_apur = True
+        elif nome == 'ideEstabLot':
+            if em_info_per_apur:
+                estab_lot, remun = {}, None
+                ativos = ativos + (estab_lot,)
+        elif nome == 'remunPerApur':
+            if estab_lot is not None:
+                remun = {}
+                ativos = ativos + (remun,)
+        elif nome == 'itensRemun':
+            if remun is not None:
+                item = {}
+                ativos = ativos + (item,)
+                itens.append((dm_dev[0], estab_lot, remun, item, elem))
+        
+        if len(elem):
+            pilha.extend((filho, ativos, dm_dev, em_info_per_apur, estab_lot, remun) for filho in reversed(elem))
+    return contexto, itens
+
+def coletar_rubricas_rescisao(verbas_resc):
+    """
+    Percorre as verbas rescisórias de um S-2299 (verbasResc) em uma única passagem
+    
+    Equivale às buscas aninhadas dmDev → itensRemun seguidas de obter_texto_elemento
+    para cada nome do item, sem percorrer a subárvore de cada dmDev e de cada item
+    novamente.
+    
+    Args:
+        verbas_resc: Elemento verbasResc
+    
+    Returns:
+        Lista, em ordem de documento, com os textos {nome: texto} do primeiro
+        descendente de cada nome de cada itensRemun contido em um dmDev
+    """
+    itens = []
+    intern = sys.intern
+    # Estado de cada nó: (elemento, dentro de um dmDev, textos dos itensRemun ativos)
+    pilha = [(filho, False, ()) for filho in reversed(verbas_resc)]
+    while pilha:
+        elem, em_dm_dev, ativos = pilha.pop()
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        nome = tag.rpartition('}')[2]
+        if ativos:
+            # Textos internados, como em coletar_itens_remuneracao
+            texto = elem.text
+            texto = intern(texto.strip()) if texto else ""
+            for textos in ativos:
+                textos.setdefault(nome, texto)
+        
+        if nome == 'dmDev':
+            em_dm_dev = True
+        elif nome == 'itensRemun' and em_dm_dev:
+            item = {}
+            ativos = ativos + (item,)
+            itens.append(item)
+        
+        if len(elem):
+            pilha.extend((filho, em_dm_dev, ativos) for filho in reversed(elem))
+    return itens
+
+# Profundidade máxima em que <eSocial> é procurado (envelopes de lote/retorno ficam perto da raiz)
+PROFUNDIDADE_MAXIMA_ESOCIAL = 3
+
+def encontrar_primeiro_esocial(root, profundidade_maxima=PROFUNDIDADE_MAXIMA_ESOCIAL):
+    """
+    Busca o primeiro elemento <eSocial> (em ordem de documento) até a profundidade informada.
     Retorna o elemento encontrado ou None.
+    
+    O elemento <eSocial> fica na raiz ou logo abaixo dos envelopes de lote, então a
+    busca não desce até as folhas do evento.
     """
     if root is None:
         return None
-    if root.tag.endswith('eSocial') or root.tag.endswith('eSocial>'):
-        return root
-    for el in root.iter():
-        if el.tag.endswith('eSocial') or el.tag.endswith('eSocial>'):
+    pilha = [(root, 0)]
+    while pilha:
+        el, profundidade = pilha.pop()
+        tag = el.tag
+        if isinstance(tag, str) and (tag.endswith('eSocial') or tag.endswith('eSocial>')):
             return el
+        if profundidade < profundidade_maxima:
+            pilha.extend((filho, profundidade + 1) for filho in reversed(el))
     return None
 
 def identificar_layout(root):
@@ -258,33 +1080,273 @@ def identificar_layout(root):
     # Se o root for <eSocial>, procurar filhos
     if root.tag.endswith('eSocial'):
         for child in root:
-            tag_name = child.tag
-            if '}' in tag_name:
-                tag_name = tag_name.split('}')[1]
-            if tag_name in mapeamento:
-                return mapeamento[tag_name]
+            tag_name = _nome_local(child.tag)
+            layout = mapeamento.get(tag_name)
+            if layout:
+                return layout
     else:
         # Se o root já for um evento
-        tag_name = root.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}')[1]
-        if tag_name in mapeamento:
-            return mapeamento[tag_name]
-    # Fallback: procurar recursivamente
-    for el in root.iter():
-        tag_name = el.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}')[1]
-        if tag_name in mapeamento:
-            return mapeamento[tag_name]
-    # NOVO: Se não encontrou, retorna o nome do primeiro evento eSocial encontrado (para layouts futuros)
+        tag_name = _nome_local(root.tag)
+        layout = mapeamento.get(tag_name)
+        if layout:
+            return layout
+    # Fallback: procurar recursivamente, guardando o primeiro evento eSocial encontrado
+    # (para layouts futuros, ex: evtTabRubrica, evtTSVInicio) caso nenhum seja suportado
+    primeiro_evento = None
     for el in root.iter():
-        tag_name = el.tag
-        if '}' in tag_name:
-            tag_name = tag_name.split('}')[1]
-        if tag_name.startswith('evt'):
-            return tag_name  # Ex: evtTabRubrica, evtTSVInicio, etc.
-    return None
+        tag_name = _nome_local(el.tag)
+        layout = mapeamento.get(tag_name)
+        if layout:
+            return layout
+        if primeiro_evento is None and tag_name.startswith('evt'):
+            primeiro_evento = tag_name
+    return primeiro_evento
+
+def identificar_layout_arquivo(caminho_arquivo) -> Optional[str]:
+    """
+    Identifica o layout de um arquivo XML lendo-o em streaming
+    
+    Equivale a identificar_layout sobre a árvore completa, mas a leitura para no
+    primeiro evento suportado, sem montar o restante do documento (lotes grandes).
+    
+    Args:
+        caminho_arquivo: Caminho do arquivo XML
+        
+    Returns:
+        Código do layout (ex: S-1020), o nome do primeiro evento não suportado
+        (ex: evtTabRubrica) ou None
+    """
+    primeiro_evento = None
+    for _, elem in ET.iterparse(str(caminho_arquivo), events=('start',), **OPCOES_PARSER):
+        tag_name = _nome_local(elem.tag)
+        layout = ESOCIAL_EVENT_PATTERNS.get(tag_name)
+        if layout:
+            return layout
+        if primeiro_evento is None and tag_name.startswith('evt'):
+            primeiro_evento = tag_name
+    return primeiro_evento
+
+# Layouts já identificados por arquivo, consultados por detectar_layout_xml
+TAMANHO_CACHE_LAYOUTS = 4096
+
+@lru_cache(maxsize=TAMANHO_CACHE_LAYOUTS)
+def _identificar_layout_arquivo_em_cache(caminho_arquivo: str, modificado_em_ns: int, tamanho: int) -> Optional[str]:
+    """
+    identificar_layout_arquivo com o resultado guardado por arquivo
+    
+    A data de modificação e o tamanho fazem parte da chave: um arquivo alterado é
+    lido novamente. Erros de leitura não ficam em cache.
+    """
+    return identificar_layout_arquivo(caminho_arquivo)
+
+def layout_pelo_nome_arquivo(nome_arquivo: str) -> Optional[str]:
+    """
+    Obtém o layout indicado no nome do arquivo (ex: S2200, S-2200, S_2200)
+    
+    Args:
+        nome_arquivo: Nome do arquivo
+        
+    Returns:
+        Código do layout (ex: S-2200) ou None
+    """
+    correspondencia = _NOME_ARQUIVO_SUPORTADO_RE.search(nome_arquivo)
+    return f"S-{correspondencia.group(1)}" if correspondencia else None
+
+def identificar_layout_com_dica(root, layout_dica=None):
+    """
+    Identifica o layout de um evento usando o layout indicado pelo nome do arquivo
+    
+    A dica só é aceita quando o próprio tag do evento corresponde a ela (uma
+    consulta ao dicionário); caso contrário a árvore é inspecionada normalmente.
+    
+    Args:
+        root: Elemento do evento
+        layout_dica: Layout indicado pelo nome do arquivo (opcional)
+        
+    Returns:
+        Código do layout (ex: S-1020) ou None
+    """
+    if layout_dica:
+        tag = root.tag
+        if isinstance(tag, str) and ESOCIAL_EVENT_PATTERNS.get(_nome_local(tag)) == layout_dica:
+            return layout_dica
+    return identificar_layout(root)
+
+def listar_arquivos_xml(diretorio, padrao_nome=None) -> List[Path]:
+    """
+    Lista recursivamente os arquivos .xml de um diretório
+    
+    Usa os.scandir, que obtém o tipo de cada entrada da própria listagem do
+    diretório, sem uma chamada stat por arquivo. O filtro de nome é aplicado
+    durante a listagem, então só os arquivos aceitos viram objetos Path.
+    
+    Args:
+        diretorio: Caminho do diretório
+        padrao_nome: Expressão regular compilada que o nome do arquivo deve conter (opcional)
+    
+    Returns:
+        Lista de caminhos dos arquivos XML
+    """
+    arquivos = []
+    pendentes = [str(diretorio)]
+    while pendentes:
+        try:
+            entradas = os.scandir(pendentes.pop())
+        except OSError:
+            continue
+        with entradas:
+            for entrada in entradas:
+                if entrada.is_dir(follow_symlinks=False):
+                    pendentes.append(entrada.path)
+                elif entrada.name.endswith('.xml') and (padrao_nome is None or padrao_nome.search(entrada.name)):
+                    arquivos.append(Path(entrada.path))
+    return arquivos
+
+def obter_config_processamento(configuracoes) -> Dict[str, Any]:
+    """
+    Obtém o dicionário de configurações de processamento
+    
+    Args:
+        configuracoes: Objeto Configuracoes ou dicionário de configurações
+    
+    Returns:
+        Dicionário CONFIG_PROCESSAMENTO (vazio se não houver)
+    """
+    if isinstance(configuracoes, dict):
+        return configuracoes.get('CONFIG_PROCESSAMENTO', configuracoes)
+    config = getattr(configuracoes, 'CONFIG_PROCESSAMENTO', None)
+    return config if isinstance(config, dict) else {}
+
+
+def _dict_sem_filhos(elem) -> Dict[str, Any]:
+    """
+    Monta o dicionário de um elemento apenas com atributos e texto (sem os filhos)
+    
+    Args:
+        elem: Elemento XML
+    
+    Returns:
+        Dicionário com os atributos e, se houver texto, a chave '_text'
+    """
+    # A maioria dos elementos do eSocial não tem atributos: items() devolve uma lista
+    # vazia sem criar o proxy de atributos do lxml, e o dict só é copiado se preciso
+    atributos = elem.items()
+    resultado = dict(atributos) if atributos else {}
+    texto = elem.text
+    if texto:
+        texto = texto.strip()
+        if texto:
+            resultado['_text'] = texto
+    return resultado
+
+
+def _arvore_para_dict(raiz) -> Dict[str, Any]:
+    """
+    Converte uma árvore XML inteira em dicionário aninhado, usado por extrair_dados_xml
+    
+    Percurso iterativo com pilha explícita, sem um frame Python por elemento e sem
+    limite de profundidade. O dicionário de cada filho é ligado ao pai na ordem do
+    documento e preenchido quando o filho é desempilhado; no próprio dicionário, as
+    chaves dos filhos vêm antes de '_text' e dos atributos, que as sobrescrevem.
+    
+    Args:
+        raiz: Elemento raiz
+    
+    Returns:
+        Dicionário {nome da raiz: conteúdo}; filhos repetidos viram listas
+    """
+    raiz_dict = {}
+    pilha = [(raiz, raiz_dict)]
+    while pilha:
+        elem, elem_dict = pilha.pop()
+        for filho in elem:
+            nome = _nome_local(filho.tag)
+            filho_dict = {}
+            existente = elem_dict.get(nome)
+            if existente is None:
+                elem_dict[nome] = filho_dict
+            elif isinstance(existente, list):
+                existente.append(filho_dict)
+            else:
+                elem_dict[nome] = [existente, filho_dict]
+            pilha.append((filho, filho_dict))
+        texto = elem.text
+        if texto:
+            texto = texto.strip()
+            if texto:
+                elem_dict['_text'] = texto
+        atributos = elem.items()
+        if atributos:
+            elem_dict.update(atributos)
+    return {_nome_local(raiz.tag): raiz_dict}
+
+
+class _ColetorInsercoes:
+    """
+    Substitui o gerenciador de banco de dados nos processos de trabalho,
+    acumulando as inserções para que sejam gravadas pelo processo principal
+    
+    Os registros são guardados como tuplas de valores junto às colunas, o que
+    reduz o volume serializado entre os processos em relação a dicionários.
+    """
+    
+    def __init__(self):
+        self.insercoes: List[Tuple[str, Tuple[str, ...], List[tuple]]] = []
+    
+    def inserir_dados(self, tabela: str, dados: List[Dict[str, Any]]) -> int:
+        if dados:
+            colunas = tuple(dados[0])
+            self.insercoes.append((tabela, colunas, [tuple(map(registro.get, colunas)) for registro in dados]))
+        return len(dados)
+    
+    def inserir_linhas(self, tabela: str, colunas: Tuple[str, ...], linhas: List[tuple]) -> int:
+        if linhas:
+            self.insercoes.append((tabela, colunas, linhas))
+        return len(linhas)
+
+
+# Processador de cada processo de trabalho, criado uma única vez pelo inicializador do pool
+_PROCESSADOR_DO_PROCESSO = None
+
+
+def _inicializar_processo_trabalho(config_processamento: Dict[str, Any]):
+    """
+    Cria o processador de um processo de trabalho
+    
+    Executado uma vez por processo do pool: a configuração, os processadores de
+    layout e os caches de módulo (validações, parsers, conversões) são montados
+    uma só vez e reaproveitados por todos os arquivos que o processo recebe.
+    
+    Args:
+        config_processamento: Configurações de processamento
+    """
+    global _PROCESSADOR_DO_PROCESSO
+    _PROCESSADOR_DO_PROCESSO = ProcessadorXML(_ColetorInsercoes(), config_processamento)
+
+
+def _processar_arquivo_em_processo(caminho_arquivo: Path):
+    """
+    Processa um arquivo XML em um processo de trabalho
+    
+    Args:
+        caminho_arquivo: Caminho do arquivo XML
+    
+    Returns:
+        Tupla (layout ou None, inserções, arquivos processados, arquivos com erro)
+    """
+    processador = _PROCESSADOR_DO_PROCESSO
+    coletor = processador.gerenciador_bd
+    coletor.insercoes = []
+    processador.arquivos_processados = processador.arquivos_com_erro = 0
+    # Como no processo principal, os registros do arquivo são acumulados e, se a
+    # leitura falhar, _processar_arquivo descarta os dos eventos já processados
+    processador._acumular_insercoes = True
+    try:
+        resultado = processador._processar_arquivo(caminho_arquivo)
+    finally:
+        processador._acumular_insercoes = False
+        processador._descarregar_insercoes(forcar=True)
+    return resultado, coletor.insercoes, processador.arquivos_processados, processador.arquivos_com_erro
 
 
 class ProcessadorXML:
@@ -292,6 +1354,24 @@ class ProcessadorXML:
     Classe para processamento de arquivos XML do eSocial
     """
     
+    # Descrições dos motivos de desligamento do S-2299 (mtvDeslig)
+    _DESCRICOES_MOTIVO_DESLIGAMENTO = {
+        '01': 'Rescisão com justa causa por iniciativa do empregador',
+        '02': 'Rescisão sem justa causa por iniciativa do empregador',
+        '03': 'Rescisão antecipada do contrato a termo por iniciativa do empregador',
+        '04': 'Rescisão por culpa recíproca',
+        '05': 'Rescisão por força maior',
+        '06': 'Rescisão por término de contrato a termo',
+        '07': 'Rescisão do contrato de trabalho por iniciativa do empregado',
+        '08': 'Rescisão do contrato de trabalho por interesse do empregado',
+        '09': 'Rescisão por falecimento do empregado',
+        '10': 'Rescisão por falecimento do empregador individual',
+        '11': 'Transferência de empregado para empresa do mesmo grupo',
+        '12': 'Transferência de empregado para outra empresa',
+        '13': 'Rescisão contratual a pedido do empregado, durante o período de experiência',
+        '14': 'Rescisão contratual por encerramento da empresa',
+    }
+    
     def __init__(self, gerenciador_bd, configuracoes):
         """
         Inicializa o processador XML
@@ -308,6 +1388,17 @@ class ProcessadorXML:
         self.arquivos_processados = 0
         self.arquivos_com_erro = 0
         
+        # Inserções acumuladas entre arquivos durante o processamento de um diretório,
+        # agrupadas por (tabela, colunas) e gravadas em lotes de 'tamanho_lote' registros;
+        # cada registro fica guardado como tupla de valores na ordem das colunas
+        self._insercoes_pendentes = defaultdict(list)
+        self._total_pendente = 0
+        self._acumular_insercoes = False
+        self._tamanho_lote = obter_config_processamento(configuracoes).get('tamanho_lote') or 1000
+        
+        # Serialização do evento completo na coluna json_data (usada pelos exportadores)
+        self._armazenar_json = obter_config_processamento(configuracoes).get('armazenar_json', True)
+        
         # Inicializar processadores de layouts
         self._inicializar_processadores()
     
@@ -326,172 +1417,366 @@ class ProcessadorXML:
         # Layouts obrigatorios que devem estar presentes
         self.layouts_obrigatorios = list(self.processadores.keys())
     
-    def processar_arquivo(self, caminho_arquivo: str) -> bool:
+    def processar_arquivo(self, caminho_arquivo: str) -> bool:
+        """
+        Processa um arquivo XML individual - método público
+        
+        Args:
+            caminho_arquivo: Caminho do arquivo XML como string
+            
+        Returns:
+            True se o processamento foi bem-sucedido, False caso contrário
+        """
+        self.logger.info("Processando arquivo XML: %s", caminho_arquivo)
+        if self._acumular_insercoes:
+            return self._processar_arquivo(Path(caminho_arquivo)) is not None
+        
+        # Os registros dos eventos de um mesmo arquivo (lotes com vários <eSocial>)
+        # são gravados juntos ao final, em vez de uma inserção por evento
+        self._acumular_insercoes = True
+        try:
+            return self._processar_arquivo(Path(caminho_arquivo)) is not None
+        finally:
+            self._acumular_insercoes = False
+            self._descarregar_insercoes(forcar=True)
+    
+    def processar_diretorio(self, caminho_diretorio: Path) -> int:
+        """
+        Processa todos os arquivos XML em um diretório
+        
+        Args:
+            caminho_diretorio: Caminho do diretório com arquivos XML
+            
+        Returns:
+            Número de arquivos processados com sucesso
+        """
+        self.logger.info(f"Processando arquivos XML em: {caminho_diretorio}")
+        
+        # Resetar contadores
+        self.arquivos_processados = 0
+        self.arquivos_com_erro = 0
+        
+        # Criar contadores por tipo de layout para verificar layouts obrigatórios
+        layouts_encontrados = {layout: 0 for layout in self.layouts_obrigatorios}
+        
+        # Encontrar os arquivos XML cujo nome contenha S2200, S-2200, S_2200, etc. para cada layout suportado
+        arquivos_suportados = listar_arquivos_xml(caminho_diretorio, _NOME_ARQUIVO_SUPORTADO_RE)
+        self.logger.info(f"Arquivos suportados: {len(arquivos_suportados)}")
+        if len(arquivos_suportados) == 0:
+            self.logger.warning("Nenhum arquivo suportado encontrado pelo padrão de nome.")
+            return 0
+        
+        # Processar todos os arquivos suportados com barra de progresso
+        self._acumular_insercoes = True
+        try:
+            for caminho_arquivo, layout in self._iterar_resultados(arquivos_suportados):
+                self._descarregar_insercoes()
+                if layout in layouts_encontrados:
+                    layouts_encontrados[layout] += 1
+        finally:
+            self._acumular_insercoes = False
+            self._descarregar_insercoes(forcar=True)
+        layouts_faltando = [layout for layout, count in layouts_encontrados.items() if count == 0]
+        if layouts_faltando:
+            self.logger.warning(f"ATENÇÃO: Os seguintes layouts obrigatórios não foram encontrados: {', '.join(layouts_faltando)}")
+        self.logger.info(f"Processamento concluído: {self.arquivos_processados} arquivos processados, "
+                       f"{self.arquivos_com_erro} arquivos com erro")
+        for layout, count in layouts_encontrados.items():
+            self.logger.info(f"  {layout}: {count} arquivos")
+        return self.arquivos_processados
+    
+    def _iterar_resultados(self, arquivos: List[Path]):
+        """
+        Processa os arquivos, em paralelo quando habilitado, na ordem recebida
+        
+        Com 'processamento_paralelo' ativo, a análise dos XMLs é distribuída entre
+        processos; as inserções voltam como dicionários e são gravadas aqui, no
+        processo principal, que mantém a única conexão com o banco de dados.
+        
+        Args:
+            arquivos: Lista de arquivos XML
+        
+        Returns:
+            Gerador de tuplas (caminho do arquivo, layout retornado por _processar_arquivo)
+        """
+        config = obter_config_processamento(self.configuracoes)
+        num_processos = config.get('num_processos') or os.cpu_count() or 1
+        progresso = dict(total=len(arquivos), desc="Processando arquivos XML", unit="arquivo")
+        
+        if not config.get('processamento_paralelo') or num_processos < 2 or len(arquivos) < 2:
+            for caminho_arquivo in tqdm(arquivos, **progresso):
+                yield caminho_arquivo, self._processar_arquivo(caminho_arquivo)
+            return
+        
+        config_trabalho = {chave: valor for chave, valor in config.items() if chave != 'processamento_paralelo'}
+        tamanho_bloco = max(1, min(16, len(arquivos) // (num_processos * 4)))
+        with ProcessPoolExecutor(max_workers=num_processos, initializer=_inicializar_processo_trabalho,
+                                 initargs=(config_trabalho,)) as executor:
+            resultados = executor.map(_processar_arquivo_em_processo, arquivos, chunksize=tamanho_bloco)
+            for caminho_arquivo, (resultado, insercoes, processados, com_erro) in tqdm(
+                    zip(arquivos, resultados), **progresso):
+                for tabela, colunas, linhas in insercoes:
+                    self._inserir_linhas(tabela, colunas, linhas)
+                self.arquivos_processados += processados
+                self.arquivos_com_erro += com_erro
+                yield caminho_arquivo, resultado
+    
+    def _inserir_dados(self, tabela: str, dados: List[Dict[str, Any]]) -> int:
+        """
+        Insere registros no banco de dados ou os acumula para gravação em lote
+        
+        Durante processar_diretorio os registros de vários arquivos são acumulados
+        e gravados juntos, reduzindo o número de transações no banco.
+        
+        Args:
+            tabela: Nome da tabela
+            dados: Lista de dicionários com os registros
+        
+        Returns:
+            Número de registros inseridos (ou acumulados)
+        """
+        if not self._acumular_insercoes:
+            return self.gerenciador_bd.inserir_dados(tabela, dados)
+        if not dados:
+            return 0
+        # O gerenciador usa as colunas do primeiro registro de cada chamada,
+        # então só são agrupados registros com as mesmas colunas. Enquanto aguardam
+        # a gravação, os registros ficam como tuplas, bem menores que dicionários
+        colunas = tuple(dados[0])
+        return self._inserir_linhas(tabela, colunas, [tuple(map(registro.get, colunas)) for registro in dados])
+    
+    def _inserir_linhas(self, tabela: str, colunas: Tuple[str, ...], linhas: List[tuple]) -> int:
+        """
+        Insere ou acumula registros já convertidos em tuplas de valores
+        
+        Args:
+            tabela: Nome da tabela
+            colunas: Colunas, na ordem dos valores de cada linha
+            linhas: Lista de tuplas de valores
+        
+        Returns:
+            Número de registros inseridos (ou acumulados)
+        """
+        if not self._acumular_insercoes:
+            return self._gravar_linhas(tabela, colunas, linhas)
+        self._insercoes_pendentes[(tabela, colunas)].extend(linhas)
+        self._total_pendente += len(linhas)
+        return len(linhas)
+    
+    def _marcar_insercoes_pendentes(self) -> Tuple[Dict[Tuple[str, Tuple[str, ...]], int], int]:
+        """
+        Registra quantos registros aguardam gravação em cada (tabela, colunas)
+        
+        Returns:
+            Tupla (quantidade por (tabela, colunas), total pendente)
+        """
+        return {chave: len(linhas) for chave, linhas in self._insercoes_pendentes.items()}, self._total_pendente
+    
+    def _descartar_insercoes_desde(self, marca: Tuple[Dict[Tuple[str, Tuple[str, ...]], int], int]):
+        """
+        Descarta os registros acumulados depois da marca (os de um arquivo que falhou)
+        
+        Args:
+            marca: Retorno de _marcar_insercoes_pendentes
+        """
+        quantidades, total = marca
+        for chave in list(self._insercoes_pendentes):
+            quantidade = quantidades.get(chave, 0)
+            if quantidade:
+                del self._insercoes_pendentes[chave][quantidade:]
+            else:
+                del self._insercoes_pendentes[chave]
+        self._total_pendente = total
+    
+    def _descarregar_insercoes(self, forcar: bool = False):
+        """
+        Grava no banco os registros acumulados quando atingem o tamanho do lote
+        
+        Args:
+            forcar: Grava os registros pendentes independentemente do tamanho do lote
+        """
+        if not self._total_pendente or (not forcar and self._total_pendente < self._tamanho_lote):
+            return
+        pendentes = self._insercoes_pendentes
+        self._insercoes_pendentes = defaultdict(list)
+        self._total_pendente = 0
+        for (tabela, colunas), linhas in pendentes.items():
+            self._gravar_linhas(tabela, colunas, linhas)
+    
+    def _gravar_linhas(self, tabela: str, colunas: Tuple[str, ...], linhas: List[tuple]) -> int:
+        """
+        Grava no banco registros em tuplas de valores
+        
+        Args:
+            tabela: Nome da tabela
+            colunas: Colunas, na ordem dos valores de cada linha
+            linhas: Lista de tuplas de valores
+        
+        Returns:
+            Número de registros inseridos
+        """
+        return self.gerenciador_bd.inserir_linhas(tabela, colunas, linhas)
+    
+    def _processar_arquivo(self, caminho_arquivo: Path) -> Optional[str]:
+        """
+        Processa um arquivo XML individual
+        
+        Args:
+            caminho_arquivo: Caminho do arquivo XML
+        
+        Returns:
+            Código do layout do arquivo se o processamento foi bem-sucedido (string
+            vazia se nenhum layout foi identificado), None caso contrário
+        """
+        # Verificar se o arquivo existe (uma única chamada stat para existência e tamanho)
+        try:
+            tamanho_arquivo = caminho_arquivo.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            self.logger.error(f"Arquivo não encontrado: {caminho_arquivo}")
+            self.arquivos_com_erro += 1
+            return None
+        
+        # Verificar tamanho mínimo do arquivo
+        if tamanho_arquivo < 50:  # Menos de 50 bytes provavelmente está vazio ou corrompido
+            self.logger.error(f"Arquivo XML muito pequeno ou vazio: {caminho_arquivo} ({tamanho_arquivo} bytes)")
+            self.arquivos_com_erro += 1
+            return None
+        
+        # Estado antes do arquivo: se a leitura falhar no meio de um arquivo grande, os
+        # registros e contadores dos eventos já processados são descartados
+        marca = self._marcar_insercoes_pendentes()
+        contadores = (self.arquivos_processados, self.arquivos_com_erro)
+        try:
+            # Leitura em streaming: cada evento filho de <eSocial> é processado assim que
+            # termina de ser lido e liberado em seguida, mantendo só um evento em memória
+            sucesso = True
+            layouts = []
+            layout_dica = layout_pelo_nome_arquivo(caminho_arquivo.name)
+            for raiz, evento in iterar_eventos_esocial(caminho_arquivo, tamanho_arquivo):
+                layout = identificar_layout_com_dica(evento, layout_dica)
+                layouts.append(layout)
+                if evento is raiz:
+                    sucesso = self._processar_evento_unico(raiz, caminho_arquivo, layout)
+                else:
+                    sucesso = self._processar_evento(evento, caminho_arquivo, layout) and sucesso
+            return self._layout_do_arquivo(layouts) if sucesso else None
+        except (ET.ParseError, UnicodeDecodeError) as e:
+            # Arquivos em ISO-8859-1 sem declaração (ou declarados como UTF-8) falham na
+            # leitura: o arquivo é relido uma única vez com o encoding detectado e o
+            # processamento continua a partir do primeiro evento ainda não processado
+            try:
+                raiz = carregar_xml_com_encoding_detectado(caminho_arquivo)
+            except Exception:
+                raiz = None
+            if raiz is None:
+                self.logger.error(f"Erro ao analisar XML: {caminho_arquivo}: {e}")
+                self._descartar_insercoes_desde(marca)
+                self.arquivos_processados, self.arquivos_com_erro = contadores
+                self.arquivos_com_erro += 1
+                return None
+            return self._processar_raiz(raiz, caminho_arquivo, layouts, sucesso)
+        except Exception as e:
+            self.logger.error(f"Erro ao processar arquivo {caminho_arquivo}: {e}")
+            self._descartar_insercoes_desde(marca)
+            self.arquivos_processados, self.arquivos_com_erro = contadores
+            self.arquivos_com_erro += 1
+            return None
+    
+    def _layout_do_arquivo(self, layouts: List[Optional[str]]) -> str:
         """
-        Processa um arquivo XML individual - método público
+        Escolhe o layout que representa o arquivo entre os layouts de seus eventos
         
         Args:
-            caminho_arquivo: Caminho do arquivo XML como string
-            
+            layouts: Layouts identificados para os eventos, na ordem do arquivo
+        
         Returns:
-            True se o processamento foi bem-sucedido, False caso contrário
+            Primeiro layout suportado, senão o primeiro identificado, senão string vazia
         """
-        self.logger.info(f"Processando arquivo XML: {caminho_arquivo}")
-        return self._processar_arquivo(Path(caminho_arquivo))
+        for layout in layouts:
+            if layout in self.processadores:
+                return layout
+        return next((layout for layout in layouts if layout), "")
     
-    def processar_diretorio(self, caminho_diretorio: Path) -> int:
+    def _processar_raiz(self, root, caminho_arquivo: Path, layouts: Optional[List[Optional[str]]] = None,
+                        sucesso: bool = True) -> Optional[str]:
         """
-        Processa todos os arquivos XML em um diretório
+        Processa a árvore completa de um arquivo XML já carregado
         
         Args:
-            caminho_diretorio: Caminho do diretório com arquivos XML
-            
+            root: Elemento raiz do XML
+            caminho_arquivo: Caminho do arquivo XML
+            layouts: Layouts dos eventos de <eSocial> já processados (que são ignorados)
+            sucesso: Resultado do processamento dos eventos já processados
+        
         Returns:
-            Número de arquivos processados com sucesso
+            Código do layout do arquivo se o processamento foi bem-sucedido, None caso contrário
         """
-        self.logger.info(f"Processando arquivos XML em: {caminho_diretorio}")
-        
-        # Resetar contadores
-        self.arquivos_processados = 0
-        self.arquivos_com_erro = 0
-        
-        # Criar contadores por tipo de layout para verificar layouts obrigatórios
-        layouts_encontrados = {layout: 0 for layout in self.layouts_obrigatorios}
-        
-        # Encontrar todos os arquivos XML
-        arquivos_xml = list(caminho_diretorio.glob('**/*.xml'))
-        total_arquivos = len(arquivos_xml)
-        self.logger.info(f"Encontrados {total_arquivos} arquivos XML")
-        if total_arquivos == 0:
-            return 0
+        layouts = list(layouts or [])
+        layout_dica = layout_pelo_nome_arquivo(caminho_arquivo.name)
+        if root.tag.endswith('eSocial'):
+            for evento in list(root)[len(layouts):]:
+                layout = identificar_layout_com_dica(evento, layout_dica)
+                layouts.append(layout)
+                sucesso = self._processar_evento(evento, caminho_arquivo, layout) and sucesso
+        else:
+            layouts = [identificar_layout_com_dica(root, layout_dica)]
+            sucesso = self._processar_evento_unico(root, caminho_arquivo, layouts[0])
+        return self._layout_do_arquivo(layouts) if sucesso else None
+    
+    def _processar_evento(self, evento, caminho_arquivo: Path, layout: Optional[str]) -> bool:
+        """
+        Processa um evento filho de <eSocial>
         
-        # Filtro: aceitar arquivos cujo nome contenha S2200, S-2200, S_2200, etc. para cada layout suportado
-        def gera_variacoes(layout):
-            base = layout.replace('S-', 'S') if layout.startswith('S-') else layout
-            return [base, base.replace('S', 'S-'), base.replace('S', 'S_')]
-        # Definir explicitamente os 7 layouts suportados
-        layouts_suportados = ['S-1020', 'S-1030', 'S-1200', 'S-2200', 'S-2205', 'S-2206', 'S-2230']
-        padroes = []
-        for layout in layouts_suportados:
-            padroes.extend(gera_variacoes(layout))
-        arquivos_suportados = [arq for arq in arquivos_xml if any(pat.lower() in arq.name.lower() for pat in padroes)]
-        self.logger.info(f"Arquivos suportados: {len(arquivos_suportados)}")
-        if len(arquivos_suportados) == 0:
-            self.logger.warning("Nenhum arquivo suportado encontrado pelo padrão de nome.")
-            return 0
+        Args:
+            evento: Elemento do evento
+            caminho_arquivo: Caminho do arquivo XML
+            layout: Layout identificado para o evento
         
-        # Processar todos os arquivos suportados com barra de progresso
-        for caminho_arquivo in tqdm(arquivos_suportados, desc="Processando arquivos XML", unit="arquivo"):
-            resultado = self._processar_arquivo(caminho_arquivo)
-            if resultado and caminho_arquivo:
-                try:
-                    tree = ET.parse(caminho_arquivo)
-                    root = tree.getroot()
-                    layout = identificar_layout(root)
-                    if layout in layouts_encontrados:
-                        layouts_encontrados[layout] += 1
-                except:
-                    pass
-        layouts_faltando = [layout for layout, count in layouts_encontrados.items() if count == 0]
-        if layouts_faltando:
-            self.logger.warning(f"ATENÇÃO: Os seguintes layouts obrigatórios não foram encontrados: {', '.join(layouts_faltando)}")
-        self.logger.info(f"Processamento concluído: {self.arquivos_processados} arquivos processados, "
-                       f"{self.arquivos_com_erro} arquivos com erro")
-        for layout, count in layouts_encontrados.items():
-            self.logger.info(f"  {layout}: {count} arquivos")
-        return self.arquivos_processados
+        Returns:
+            False se o processador do layout falhar, True caso contrário
+            (eventos não identificados ou não suportados são ignorados)
+        """
+        if not layout:
+            self.logger.warning(f"Layout não identificado para evento em {caminho_arquivo.name}")
+            return True
+        if layout not in self.processadores:
+            self.logger.warning(f"Layout não suportado: {layout} para {caminho_arquivo.name}")
+            return True
+        processador = self.processadores[layout]
+        if processador(evento, caminho_arquivo):
+            self.arquivos_processados += 1
+            return True
+        self.arquivos_com_erro += 1
+        return False
     
-    def _processar_arquivo(self, caminho_arquivo: Path) -> bool:
+    def _processar_evento_unico(self, root, caminho_arquivo: Path, codigo_layout: Optional[str]) -> bool:
         """
-        Processa um arquivo XML individual
+        Processa um arquivo cujo elemento raiz não é <eSocial>
         
         Args:
+            root: Elemento raiz do XML
             caminho_arquivo: Caminho do arquivo XML
+            codigo_layout: Layout identificado para o elemento raiz
         
         Returns:
             True se o processamento foi bem-sucedido, False caso contrário
         """
-        # Verificar se o arquivo existe
-        if not caminho_arquivo.exists():
-            self.logger.error(f"Arquivo não encontrado: {caminho_arquivo}")
-            self.arquivos_com_erro += 1
-            return False
-        
-        # Verificar tamanho mínimo do arquivo
-        if caminho_arquivo.stat().st_size < 50:  # Menos de 50 bytes provavelmente está vazio ou corrompido
-            self.logger.error(f"Arquivo XML muito pequeno ou vazio: {caminho_arquivo} ({caminho_arquivo.stat().st_size} bytes)")
+        if not codigo_layout:
+            self.logger.warning(f"Layout não identificado para {caminho_arquivo.name}")
             self.arquivos_com_erro += 1
             return False
-        
-        try:
-            # Tentar carregar XML diretamente - mais eficiente que validar conteúdo primeiro
-            try:
-                tree = ET.parse(caminho_arquivo)
-                root = tree.getroot()
-            except ET.ParseError as e:
-                self.logger.error(f"Erro ao analisar XML: {caminho_arquivo}: {e}")
-                self.arquivos_com_erro += 1
-                return False
-            except UnicodeDecodeError:
-                # Tentar com encoding alternativo apenas se necessário
-                try:
-                    tree = ET.parse(caminho_arquivo, parser=ET.XMLParser(encoding='latin-1'))
-                    root = tree.getroot()
-                except Exception as e:
-                    self.logger.error(f"Erro ao ler arquivo XML (problema de codificação): {caminho_arquivo}: {e}")
-                    self.arquivos_com_erro += 1
-                    return False
-            except Exception as e:
-                self.logger.error(f"Erro desconhecido ao carregar XML: {caminho_arquivo}: {e}")
-                self.arquivos_com_erro += 1
-                return False
             
-            # --- NOVO: iterar sobre todos os eventos filhos de <eSocial> ---
-            if root.tag.endswith('eSocial'):
-                sucesso = True
-                for evento in list(root):
-                    layout = identificar_layout(evento)
-                    if not layout:
-                        self.logger.warning(f"Layout não identificado para evento em {caminho_arquivo.name}")
-                        continue
-                    if layout not in self.processadores:
-                        self.logger.warning(f"Layout não suportado: {layout} para {caminho_arquivo.name}")
-                        continue
-                    processador = self.processadores[layout]
-                    resultado = processador(evento, caminho_arquivo)
-                    if resultado:
-                        self.arquivos_processados += 1
-                    else:
-                        self.arquivos_com_erro += 1
-                        sucesso = False
-                return sucesso
-            # --- FIM NOVO ---
-            
-            # Identificar o layout normalmente para arquivos de evento único
-            codigo_layout = identificar_layout(root)
-            if not codigo_layout:
-                self.logger.warning(f"Layout não identificado para {caminho_arquivo.name}")
-                self.arquivos_com_erro += 1
-                return False
-                
-            if codigo_layout not in self.processadores:
-                self.logger.warning(f"Layout não suportado: {codigo_layout} para {caminho_arquivo.name}")
-                self.arquivos_com_erro += 1
-                return False
-                
-            processador = self.processadores[codigo_layout]
-            resultado = processador(root, caminho_arquivo)
-            if resultado:
-                self.arquivos_processados += 1
-                return True
-            else:
-                self.arquivos_com_erro += 1
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Erro ao processar arquivo {caminho_arquivo}: {e}")
+        if codigo_layout not in self.processadores:
+            self.logger.warning(f"Layout não suportado: {codigo_layout} para {caminho_arquivo.name}")
             self.arquivos_com_erro += 1
             return False
+            
+        processador = self.processadores[codigo_layout]
+        if processador(root, caminho_arquivo):
+            self.arquivos_processados += 1
+            return True
+        self.arquivos_com_erro += 1
+        return False
     
     # Implementações dos processadores específicos para cada layout
     
@@ -500,7 +1785,7 @@ class ProcessadorXML:
         try:
             # Extrair CNPJ do empregador
             ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
+            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc")
             
             # Encontrar as lotações no XML
             lotacoes_list = []
@@ -510,54 +1795,56 @@ class ProcessadorXML:
             if info_lotacao is not None:
                 for bloco in ["inclusao", "alteracao", "exclusao"]:
                     for evento in encontrar_todos_elementos(info_lotacao, bloco):
-                        ide_lotacao = encontrar_elemento(evento, "ideLotacao")
-                        dados_lotacao = encontrar_elemento(evento, "dadosLotacao") if bloco != "exclusao" else None
-                        nova_validade = encontrar_elemento(evento, "novaValidade") if bloco == "alteracao" else None
+                        # Uma única passagem pelo evento coleta os textos de todos os escopos
+                        textos = extrair_textos_por_escopo(evento, ESCOPOS_S1020[bloco], CATEGORICOS_S1020)
+                        ide_lotacao = textos.get('ideLotacao', {})
+                        nova_validade = textos.get('novaValidade', {})
+                        dados_lotacao = textos.get('dadosLotacao', {})
+                        fpas_lotacao = textos.get('fpasLotacao', {})
+                        info_proc_jud_terceiros = textos.get('infoProcJudTerceiros', {})
+                        proc_jud_terceiro = textos.get('procJudTerceiro', {})
+                        info_empr_parcial = textos.get('infoEmprParcial', {})
+                        dados_op_port = textos.get('dadosOpPort', {})
 
                         # ideLotacao
-                        cod_lotacao = obter_texto_elemento(ide_lotacao, "codLotacao") if ide_lotacao else ""
-                        ini_valid = obter_texto_elemento(ide_lotacao, "iniValid") if ide_lotacao else ""
-                        fim_valid = obter_texto_elemento(ide_lotacao, "fimValid") if ide_lotacao else ""
+                        cod_lotacao = ide_lotacao.get("codLotacao", "")
+                        ini_valid = ide_lotacao.get("iniValid", "")
+                        fim_valid = ide_lotacao.get("fimValid", "")
 
                         # novaValidade (only for alteracao)
-                        nova_ini_valid = obter_texto_elemento(nova_validade, "iniValid") if nova_validade else ""
-                        nova_fim_valid = obter_texto_elemento(nova_validade, "fimValid") if nova_validade else ""
+                        nova_ini_valid = nova_validade.get("iniValid", "")
+                        nova_fim_valid = nova_validade.get("fimValid", "")
 
                         # dadosLotacao
-                        tipo_lotacao = obter_texto_elemento(dados_lotacao, "tpLotacao") if dados_lotacao else ""
-                        tipo_inscricao = obter_texto_elemento(dados_lotacao, "tpInsc") if dados_lotacao else ""
-                        nr_inscricao = obter_texto_elemento(dados_lotacao, "nrInsc") if dados_lotacao else ""
-                        desc_lotacao = obter_texto_elemento(dados_lotacao, "descLotacao") if dados_lotacao else ""
+                        tipo_lotacao = dados_lotacao.get("tpLotacao", "")
+                        tipo_inscricao = dados_lotacao.get("tpInsc", "")
+                        nr_inscricao = dados_lotacao.get("nrInsc", "")
+                        desc_lotacao = dados_lotacao.get("descLotacao", "")
 
                         # fpasLotacao
-                        fpas_lotacao = encontrar_elemento(dados_lotacao, "fpasLotacao") if dados_lotacao else None
-                        fpas = obter_texto_elemento(fpas_lotacao, "fpas") if fpas_lotacao else ""
-                        cod_tercs = obter_texto_elemento(fpas_lotacao, "codTercs") if fpas_lotacao else ""
-                        cod_tercs_susp = obter_texto_elemento(fpas_lotacao, "codTercsSusp") if fpas_lotacao else ""
+                        fpas = fpas_lotacao.get("fpas", "")
+                        cod_tercs = fpas_lotacao.get("codTercs", "")
+                        cod_tercs_susp = fpas_lotacao.get("codTercsSusp", "")
                         
                         # infoProcJudTerceiros
-                        info_proc_jud_terceiros = encontrar_elemento(fpas_lotacao, "infoProcJudTerceiros") if fpas_lotacao else None
-                        proc_jud_terceiros_cod_susp = obter_texto_elemento(info_proc_jud_terceiros, "codSusp") if info_proc_jud_terceiros else ""
-                        proc_jud_terceiros_cod_terc = obter_texto_elemento(info_proc_jud_terceiros, "codTerc") if info_proc_jud_terceiros else ""
-                        proc_jud_terceiros_nr_proc_jud = obter_texto_elemento(info_proc_jud_terceiros, "nrProcJud") if info_proc_jud_terceiros else ""
+                        proc_jud_terceiros_cod_susp = info_proc_jud_terceiros.get("codSusp", "")
+                        proc_jud_terceiros_cod_terc = info_proc_jud_terceiros.get("codTerc", "")
+                        proc_jud_terceiros_nr_proc_jud = info_proc_jud_terceiros.get("nrProcJud", "")
                         
                         # procJudTerceiro
-                        proc_jud_terceiro = encontrar_elemento(info_proc_jud_terceiros, "procJudTerceiro") if info_proc_jud_terceiros else None
-                        proc_jud_terceiro_cod_susp = obter_texto_elemento(proc_jud_terceiro, "codSusp") if proc_jud_terceiro else ""
-                        proc_jud_terceiro_cod_terc = obter_texto_elemento(proc_jud_terceiro, "codTerc") if proc_jud_terceiro else ""
-                        proc_jud_terceiro_nr_proc_jud = obter_texto_elemento(proc_jud_terceiro, "nrProcJud") if proc_jud_terceiro else ""
+                        proc_jud_terceiro_cod_susp = proc_jud_terceiro.get("codSusp", "")
+                        proc_jud_terceiro_cod_terc = proc_jud_terceiro.get("codTerc", "")
+                        proc_jud_terceiro_nr_proc_jud = proc_jud_terceiro.get("nrProcJud", "")
 
                         # infoEmprParcial
-                        info_empr_parcial = encontrar_elemento(dados_lotacao, "infoEmprParcial") if dados_lotacao else None
-                        tp_insc_contrat = obter_texto_elemento(info_empr_parcial, "tpInscContrat") if info_empr_parcial else ""
-                        nr_insc_contrat = obter_texto_elemento(info_empr_parcial, "nrInscContrat") if info_empr_parcial else ""
-                        tp_insc_prop = obter_texto_elemento(info_empr_parcial, "tpInscProp") if info_empr_parcial else ""
-                        nr_insc_prop = obter_texto_elemento(info_empr_parcial, "nrInscProp") if info_empr_parcial else ""
+                        tp_insc_contrat = info_empr_parcial.get("tpInscContrat", "")
+                        nr_insc_contrat = info_empr_parcial.get("nrInscContrat", "")
+                        tp_insc_prop = info_empr_parcial.get("tpInscProp", "")
+                        nr_insc_prop = info_empr_parcial.get("nrInscProp", "")
 
                         # dadosOpPort
-                        dados_op_port = encontrar_elemento(dados_lotacao, "dadosOpPort") if dados_lotacao else None
-                        aliq_rat = obter_texto_elemento(dados_op_port, "aliqRat") if dados_op_port else ""
-                        fap = obter_texto_elemento(dados_op_port, "fap") if dados_op_port else ""
+                        aliq_rat = dados_op_port.get("aliqRat", "")
+                        fap = dados_op_port.get("fap", "")
 
                         # Montar dicionário com TODOS os dados (100% coverage)
                         lotacao_dict = {
@@ -603,7 +1890,7 @@ class ProcessadorXML:
                             'cnpj_empregador': cnpj_empregador,
                             
                             # JSON completo para análise
-                            'json_data': json.dumps(self._elemento_para_dict(evento))
+                            'json_data': self._json_elemento(evento)
                         }
                         lotacoes_list.append(lotacao_dict)
 
@@ -617,10 +1904,12 @@ class ProcessadorXML:
                         self.logger.warning(f"Validação para lotação {lotacao_dict.get('codigo')}, arquivo {caminho_arquivo}: {erro}")
                     
                     # Tentar corrigir dados problemáticos
-                    lotacao_dict = ValidadorDados.sanitizar_dados(lotacao_dict, 'S-1020')
+                    lotacao_sanitizada = ValidadorDados.sanitizar_dados(lotacao_dict, 'S-1020')
                     
-                    # Revalidar após correções
-                    valido, mensagens_erro = ValidadorDados.validar_registro_s1020(lotacao_dict)
+                    # Revalidar após correções (se a sanitização não alterou nada, o resultado é o mesmo)
+                    if lotacao_sanitizada != lotacao_dict:
+                        lotacao_dict = lotacao_sanitizada
+                        valido, mensagens_erro = ValidadorDados.validar_registro_s1020(lotacao_dict)
                     if not valido:
                         self.logger.warning(f"Dados ainda apresentam problemas após correções: {', '.join(mensagens_erro)}")
                     else:
@@ -630,7 +1919,7 @@ class ProcessadorXML:
                 
             # Inserir no banco de dados
             if lotacoes_validadas:
-                self.gerenciador_bd.inserir_dados("esocial_s1020", lotacoes_validadas)
+                self._inserir_dados("esocial_s1020", lotacoes_validadas)
                 return True
                 
             return False
@@ -643,248 +1932,174 @@ class ProcessadorXML:
         try:
             # Extrair dados do empregador
             ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
-            tipo_inscricao = obter_texto_elemento(ide_empregador, "tpInsc") if ide_empregador else ""
+            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc")
+            tipo_inscricao = obter_texto_elemento(ide_empregador, "tpInsc")
             
             # Extrair dados do evento
             ide_evento = encontrar_elemento(root, "ideEvento")
-            tipo_ambiente = obter_texto_elemento(ide_evento, "tpAmb") if ide_evento else ""
-            processo_emissor = obter_texto_elemento(ide_evento, "procEmi") if ide_evento else ""
-            versao_processo = obter_texto_elemento(ide_evento, "verProc") if ide_evento else ""
+            tipo_ambiente = obter_texto_elemento(ide_evento, "tpAmb")
+            processo_emissor = obter_texto_elemento(ide_evento, "procEmi")
+            versao_processo = obter_texto_elemento(ide_evento, "verProc")
             
-            cargos_list = []
-
             # Encontrar todos os blocos de inclusao, alteracao e exclusao
             info_cargo = encontrar_elemento(root, "infoCargo")
-            if info_cargo is not None:
-                for bloco in ["inclusao", "alteracao", "exclusao"]:
-                    for evento in encontrar_todos_elementos(info_cargo, bloco):
-                        ide_cargo = encontrar_elemento(evento, "ideCargo")
-                        dados_cargo = encontrar_elemento(evento, "dadosCargo")
-                        
-                        if ide_cargo is not None:
-                            # Dados de identificação do cargo
-                            codigo = obter_texto_elemento(ide_cargo, "codCargo")
-                            inicio_validade = obter_texto_elemento(ide_cargo, "iniValid")
-                            fim_validade = obter_texto_elemento(ide_cargo, "fimValid")
-                            
-                            # Dados do cargo (apenas para inclusao e alteracao)
-                            descricao = ""
-                            cbo = ""
-                            cargo_publico = ""
-                            nivel_cargo = ""
-                            desc_sumaria = ""
-                            dt_criacao = ""
-                            dt_extincao = ""
-                            situacao = ""
-                            permite_acumulo = ""
-                            permite_contagem_esp = ""
-                            dedicacao_exclusiva = ""
-                            num_lei = ""
-                            dt_lei = ""
-                            situacao_lei = ""
-                            tem_funcao = ""
-                            
-                            if dados_cargo is not None:
-                                # Dados básicos do cargo
-                                descricao = obter_texto_elemento(dados_cargo, "nmCargo")
-                                cbo = obter_texto_elemento(dados_cargo, "codCBO")
-                                cargo_publico = obter_texto_elemento(dados_cargo, "cargoPublico")
-                                
-                                # Dados complementares do cargo
-                                nivel_cargo = obter_texto_elemento(dados_cargo, "nivelCargo")
-                                desc_sumaria = obter_texto_elemento(dados_cargo, "descSumar")
-                                dt_criacao = obter_texto_elemento(dados_cargo, "dtCriacao")
-                                dt_extincao = obter_texto_elemento(dados_cargo, "dtExtincao")
-                                situacao = obter_texto_elemento(dados_cargo, "situacao")
-                                permite_acumulo = obter_texto_elemento(dados_cargo, "permiteAcumulo")
-                                permite_contagem_esp = obter_texto_elemento(dados_cargo, "permiteContagemEspecial")
-                                dedicacao_exclusiva = obter_texto_elemento(dados_cargo, "dedicacaoExclusiva")
-                                num_lei = obter_texto_elemento(dados_cargo, "numLei")
-                                dt_lei = obter_texto_elemento(dados_cargo, "dtLei")
-                                situacao_lei = obter_texto_elemento(dados_cargo, "situacaoLei")
-                                tem_funcao = obter_texto_elemento(dados_cargo, "temFuncao")
-                            
-                            cargo_dict = {
-                                # Dados do evento
-                                'tipo_ambiente': tipo_ambiente,
-                                'processo_emissor': processo_emissor,
-                                'versao_processo': versao_processo,
-                                'tipo_inscricao': tipo_inscricao,
-                                
-                                # Dados de identificação do cargo
-                                'codigo': codigo,
-                                'inicio_validade': inicio_validade,
-                                'fim_validade': fim_validade,
-                                
-                                # Dados básicos do cargo
-                                'descricao': descricao,
-                                'cbo': cbo,
-                                'cargo_publico': cargo_publico,
-                                
-                                # Dados complementares do cargo
-                                'nivel_cargo': nivel_cargo,
-                                'desc_sumaria': desc_sumaria,
-                                'dt_criacao': dt_criacao,
-                                'dt_extincao': dt_extincao,
-                                'situacao': situacao,
-                                'permite_acumulo': permite_acumulo,
-                                'permite_contagem_esp': permite_contagem_esp,
-                                'dedicacao_exclusiva': dedicacao_exclusiva,
-                                'num_lei': num_lei,
-                                'dt_lei': dt_lei,
-                                'situacao_lei': situacao_lei,
-                                'tem_funcao': tem_funcao,
-                                
-                                # Dados do empregador
-                                'cnpj_empregador': cnpj_empregador,
-                                
-                                # JSON completo para análise
-                                'json_data': json.dumps(self._elemento_para_dict(evento))
-                            }
-                            cargos_list.append(cargo_dict)
-
-            # Validar e sanitizar dados antes de inserir
+            blocos = [
+                evento
+                for bloco in ("inclusao", "alteracao", "exclusao")
+                for evento in encontrar_todos_elementos(info_cargo, bloco)
+            ]
+            
+            # Cada cargo é validado (e sanitizado) logo após ser montado; em lotes grandes,
+            # a validação vetorizada roda ao final e só as linhas reprovadas são revalidadas
+            validar_em_lote = len(blocos) >= MINIMO_VALIDACAO_EM_LOTE
             cargos_validados = []
-            for cargo_dict in cargos_list:
-                valido, mensagens_erro = ValidadorDados.validar_registro_s1030(cargo_dict)
-                if not valido:
-                    for erro in mensagens_erro:
-                        self.logger.warning(f"Validação para cargo {cargo_dict.get('codigo')}, arquivo {caminho_arquivo}: {erro}")
-                    cargo_dict = ValidadorDados.sanitizar_dados(cargo_dict, 'S-1030')
-                    valido, mensagens_erro = ValidadorDados.validar_registro_s1030(cargo_dict)
-                    if not valido:
-                        self.logger.warning(f"Dados ainda apresentam problemas após correções: {', '.join(mensagens_erro)}")
-                    else:
-                        self.logger.info(f"Dados corrigidos com sucesso para cargo {cargo_dict.get('codigo')}")
+            for evento in blocos:
+                # Uma única passagem pelo bloco coleta ideCargo e dadosCargo
+                textos = extrair_textos_por_escopo(evento, ESCOPOS_S1030)
+                if 'ideCargo' not in textos:
+                    continue
+                
+                cargo_dict = {
+                    # Dados do evento
+                    'tipo_ambiente': tipo_ambiente,
+                    'processo_emissor': processo_emissor,
+                    'versao_processo': versao_processo,
+                    'tipo_inscricao': tipo_inscricao,
+                }
+                # Identificação do cargo e, para inclusao e alteracao, dados do cargo
+                cargo_dict.update(mapear_campos(textos, CAMPOS_S1030))
+                
+                # Dados do empregador
+                cargo_dict['cnpj_empregador'] = cnpj_empregador
+                
+                # JSON completo para análise
+                cargo_dict['json_data'] = self._json_elemento(evento)
+                if not validar_em_lote:
+                    cargo_dict = self._validar_cargo_s1030(cargo_dict, caminho_arquivo)
                 cargos_validados.append(cargo_dict)
+            
+            if validar_em_lote and cargos_validados:
+                validos = ValidadorDados.validar_s1030_df(pd.DataFrame(cargos_validados)).tolist()
+                for indice, valido in enumerate(validos):
+                    if not valido:
+                        cargos_validados[indice] = self._validar_cargo_s1030(cargos_validados[indice], caminho_arquivo)
 
             if cargos_validados:
-                self.gerenciador_bd.inserir_dados("esocial_s1030", cargos_validados)
+                self._inserir_dados("esocial_s1030", cargos_validados)
                 return True
             return False
         except Exception as e:
             self.logger.error(f"Erro ao processar S-1030 {caminho_arquivo}: {e}", exc_info=True)
             return False
     
+    def _validar_cargo_s1030(self, cargo_dict: Dict[str, Any], caminho_arquivo) -> Dict[str, Any]:
+        """
+        Valida um registro S-1030, sanitizando-o quando inválido
+        
+        Args:
+            cargo_dict: Registro do cargo
+            caminho_arquivo: Caminho do arquivo XML (usado nas mensagens)
+        
+        Returns:
+            O próprio registro, ou sua versão sanitizada
+        """
+        valido, mensagens_erro = ValidadorDados.validar_registro_s1030(cargo_dict)
+        if valido:
+            return cargo_dict
+        for erro in mensagens_erro:
+            self.logger.warning(f"Validação para cargo {cargo_dict.get('codigo')}, arquivo {caminho_arquivo}: {erro}")
+        cargo_sanitizado = ValidadorDados.sanitizar_dados(cargo_dict, 'S-1030')
+        if cargo_sanitizado != cargo_dict:
+            cargo_dict = cargo_sanitizado
+            valido, mensagens_erro = ValidadorDados.validar_registro_s1030(cargo_dict)
+        if not valido:
+            self.logger.warning(f"Dados ainda apresentam problemas após correções: {', '.join(mensagens_erro)}")
+        else:
+            self.logger.info(f"Dados corrigidos com sucesso para cargo {cargo_dict.get('codigo')}")
+        return cargo_dict
+    
     def _processar_s1200(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-1200 (Remuneração do Trabalhador)"""
         try:
-            # Extrair CNPJ do empregador
-            ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
-            
-            # Extrair dados do período
-            ide_evento = encontrar_elemento(root, "ideEvento")
-            periodo_apuracao = obter_texto_elemento(ide_evento, "perApur") if ide_evento else ""
+            # Uma única passagem pelo evento coleta os blocos de contexto e todas as rubricas
+            contexto, itens = coletar_itens_remuneracao(root)
             
-            # Extrair dados do trabalhador
-            ide_trabalhador = encontrar_elemento(root, "ideTrabalhador")
-            cpf_trabalhador = obter_texto_elemento(ide_trabalhador, "cpfTrab") if ide_trabalhador else ""
+            # Extrair CNPJ do empregador, período e trabalhador
+            cnpj_empregador = contexto.get('ideEmpregador', {}).get("nrInsc", "")
+            periodo_apuracao = contexto.get('ideEvento', {}).get("perApur", "")
+            cpf_trabalhador = contexto.get('ideTrabalhador', {}).get("cpfTrab", "")
             
             # Buscar todas as remunerações
             remuneracoes_list = []
             
-            # Processar demonstrativo de valores
-            demonstrativos = encontrar_todos_elementos(root, "dmDev")
+            # Dados contextuais do JSON, montados uma vez por demonstrativo/estabelecimento
+            dm_dev_atual = estab_lot_atual = None
             
-            for demonstrativo in demonstrativos:
-                # Dados básicos do demonstrativo
-                id_dm_dev = obter_texto_elemento(demonstrativo, "ideDmDev")
-                cod_categ = obter_texto_elemento(demonstrativo, "codCateg")
-                
-                # Buscar informações de período de apuração
-                info_per_apur = encontrar_elemento(demonstrativo, "infoPerApur")
-                if info_per_apur is not None:
-                    # Buscar estabelecimentos e lotações
-                    estab_lots = encontrar_todos_elementos(info_per_apur, "ideEstabLot")
+            # Nível de log consultado uma vez por evento, não a cada rubrica
+            depurar = self.logger.isEnabledFor(logging.DEBUG)
+            
+            for dm_dev, estab_lot, remun, item, rubrica in itens:
+                if dm_dev is not dm_dev_atual or estab_lot is not estab_lot_atual:
+                    dm_dev_atual, estab_lot_atual = dm_dev, estab_lot
                     
-                    for estab_lot in estab_lots:
-                        # Dados do estabelecimento
-                        nr_insc_estab = obter_texto_elemento(estab_lot, "nrInsc")
-                        cod_lotacao = obter_texto_elemento(estab_lot, "codLotacao")
-                        
-                        # Buscar remuneração por período de apuração
-                        remun_per_apur = encontrar_todos_elementos(estab_lot, "remunPerApur")
-                        
-                        for remun in remun_per_apur:
-                            matricula = obter_texto_elemento(remun, "matricula")
-                            
-                            # Processar todas as rubricas
-                            rubricas = encontrar_todos_elementos(remun, "itensRemun")
-                            
-                            for rubrica in rubricas:
-                                # O XML S-1200 usa "cod" em vez de "codRubr" para o código da rubrica
-                                codigo_rubrica = obter_texto_elemento(rubrica, "cod") or obter_texto_elemento(rubrica, "codRubr")
-                                valor_str = obter_texto_elemento(rubrica, "vrRubr")
-                                ide_tab_rubr = obter_texto_elemento(rubrica, "ideTabRubr") or codigo_rubrica  # Se não tiver ideTabRubr, usa o código
-                                
-                                # Converter valor para float
-                                try:
-                                    valor_rubrica = float(valor_str.replace(',', '.'))
-                                except (ValueError, AttributeError):
-                                    valor_rubrica = 0.0
-                                
-                                self.logger.debug(f"Rubrica encontrada: código={codigo_rubrica}, valor={valor_rubrica}")
-                                
-                                # Montar dicionário com os dados
-                                # Incluir dados completos no JSON para permitir acesso a todos os campos
-                                json_item = self._elemento_para_dict(rubrica)
-                                # Adicionar dados contextuais ao JSON para facilitar a extração posteriormente
-                                json_completo = {
-                                    'evtRemun': {
-                                        'ideEvento': {
-                                            'perApur': {'_text': periodo_apuracao}
-                                        },
-                                        'ideEmpregador': {
-                                            'nrInsc': {'_text': cnpj_empregador}
-                                        },
-                                        'ideTrabalhador': {
-                                            'cpfTrab': {'_text': cpf_trabalhador}
-                                        },
-                                        'dmDev': {
-                                            'ideDmDev': {'_text': id_dm_dev},
-                                            'codCateg': {'_text': cod_categ}
-                                        }
-                                    }
-                                }
-                                # Combinar o JSON do item com dados de contexto
-                                json_item.update({
-                                    'matricula': {'_text': matricula},
-                                    'perApur': {'_text': periodo_apuracao},
-                                    'ideDmDev': {'_text': id_dm_dev},
-                                    'codCateg': {'_text': cod_categ},
-                                    'nrInscEstab': {'_text': nr_insc_estab}
-                                })
-                                
-                                # Assegurar que temos o valor correto da rubrica como float
-                                try:
-                                    if isinstance(valor_rubrica, str):
-                                        valor_rubrica_float = float(valor_rubrica.replace(',', '.'))
-                                    else:
-                                        valor_rubrica_float = float(valor_rubrica) if valor_rubrica is not None else 0.0
-                                except (ValueError, AttributeError):
-                                    valor_rubrica_float = 0.0
-
-                                remuneracao_dict = {
-                                    'periodo_apuracao': periodo_apuracao,
-                                    'cpf_trabalhador': cpf_trabalhador,
-                                    'matricula': matricula,
-                                    'categoria': cod_categ,
-                                    'estabelecimento': nr_insc_estab,
-                                    'codigo_rubrica': codigo_rubrica,
-                                    'descricao_rubrica': ide_tab_rubr,  # Using ideTabRubr as description for now
-                                    'valor_rubrica': valor_rubrica_float,  # Usar float para garantir formato correto
-                                    'tipo_rubrica': 'M',  # M para Mensal como padrão
-                                    'cnpj_empregador': cnpj_empregador,
-                                    'json_data': json.dumps(json_item)  # JSON enriquecido com dados de contexto
-                                }
-                                
-                                remuneracoes_list.append(remuneracao_dict)
+                    # Dados básicos do demonstrativo
+                    id_dm_dev = dm_dev.get("ideDmDev", "")
+                    cod_categ = dm_dev.get("codCateg", "")
+                    
+                    # Dados do estabelecimento
+                    nr_insc_estab = estab_lot.get("nrInsc", "")
+                    
+                    contexto_json = {
+                        'perApur': {'_text': periodo_apuracao},
+                        'ideDmDev': {'_text': id_dm_dev},
+                        'codCateg': {'_text': cod_categ},
+                        'nrInscEstab': {'_text': nr_insc_estab}
+                    }
+                
+                matricula = remun.get("matricula", "")
+                
+                # O XML S-1200 usa "cod" em vez de "codRubr" para o código da rubrica
+                codigo_rubrica = item.get("cod", "") or item.get("codRubr", "")
+                ide_tab_rubr = item.get("ideTabRubr", "") or codigo_rubrica  # Se não tiver ideTabRubr, usa o código
+                
+                # Converter valor para float (uma única vez; 0.0 se ausente ou inválido)
+                valor_rubrica = converter_decimal(item.get("vrRubr", ""))
+                
+                if depurar:
+                    self.logger.debug("Rubrica encontrada: código=%s, valor=%s", codigo_rubrica, valor_rubrica)
+                
+                # Montar dicionário com os dados
+                # Incluir dados completos no JSON para permitir acesso a todos os campos
+                json_rubrica = None
+                if self._armazenar_json:
+                    json_item = self._elemento_para_dict(rubrica)
+                    # Combinar o JSON do item com dados de contexto
+                    json_item['matricula'] = {'_text': matricula}
+                    json_item.update(contexto_json)
+                    json_rubrica = serializar_json(json_item)  # JSON enriquecido com dados de contexto
+                # A rubrica já convertida não é mais lida: liberá-la mantém a memória do evento
+                # limitada às rubricas ainda pendentes enquanto as linhas são montadas
+                rubrica.clear()
+                
+                remuneracao_dict = {
+                    'periodo_apuracao': periodo_apuracao,
+                    'cpf_trabalhador': cpf_trabalhador,
+                    'matricula': matricula,
+                    'categoria': cod_categ,
+                    'estabelecimento': nr_insc_estab,
+                    'codigo_rubrica': codigo_rubrica,
+                    'descricao_rubrica': ide_tab_rubr,  # Using ideTabRubr as description for now
+                    'valor_rubrica': valor_rubrica,  # Já convertido para float acima
+                    'tipo_rubrica': 'M',  # M para Mensal como padrão
+                    'cnpj_empregador': cnpj_empregador,
+                    'json_data': json_rubrica
+                }
+                
+                remuneracoes_list.append(remuneracao_dict)
             
             # Inserir no banco de dados
             if remuneracoes_list:
-                self.gerenciador_bd.inserir_dados("esocial_s1200", remuneracoes_list)
+                self._inserir_dados("esocial_s1200", remuneracoes_list)
                 return True
                 
             return False
@@ -895,492 +2110,34 @@ class ProcessadorXML:
     def _processar_s2200(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-2200 (Cadastramento Inicial do Vínculo) - Enhanced Coverage"""
         try:
-            # Extrair CNPJ do empregador
-            ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
-            
-            # Extrair dados do trabalhador
-            trabalhador = encontrar_elemento(root, "trabalhador")
-            cpf_trabalhador = obter_texto_elemento(trabalhador, "cpfTrab") if trabalhador else ""
-            nome_trabalhador = obter_texto_elemento(trabalhador, "nmTrab") if trabalhador else ""
-            sexo = obter_texto_elemento(trabalhador, "sexo") if trabalhador else ""
-            raca_cor = obter_texto_elemento(trabalhador, "racaCor") if trabalhador else ""
-            estado_civil = obter_texto_elemento(trabalhador, "estCiv") if trabalhador else ""
-            grau_instrucao = obter_texto_elemento(trabalhador, "grauInstr") if trabalhador else ""
-            nome_social = obter_texto_elemento(trabalhador, "nmSoc") if trabalhador else ""
-            
-            # Data de nascimento
-            nascimento = encontrar_elemento(trabalhador, "nascimento")
-            data_nascimento = obter_texto_elemento(nascimento, "dtNascto") if nascimento else ""
-            nm_mae = obter_texto_elemento(nascimento, "nmMae") if nascimento else ""
-            nm_pai = obter_texto_elemento(nascimento, "nmPai") if nascimento else ""
-            uf_nasc = obter_texto_elemento(nascimento, "uf") if nascimento else ""
-            pais_nasc = obter_texto_elemento(nascimento, "paisNascto") if nascimento else ""
-            pais_nac = obter_texto_elemento(nascimento, "paisNac") if nascimento else ""
-            
-            # Endereço (Brasil)
-            endereco = encontrar_elemento(trabalhador, "endereco")
-            end_brasil = encontrar_elemento(endereco, "brasil") if endereco else None
-            tp_lograd = obter_texto_elemento(end_brasil, "tpLograd") if end_brasil else ""
-            dsc_lograd = obter_texto_elemento(end_brasil, "dscLograd") if end_brasil else ""
-            nr_lograd = obter_texto_elemento(end_brasil, "nrLograd") if end_brasil else ""
-            complemento = obter_texto_elemento(end_brasil, "complemento") if end_brasil else ""
-            cep = obter_texto_elemento(end_brasil, "cep") if end_brasil else ""
-            bairro = obter_texto_elemento(end_brasil, "bairro") if end_brasil else ""
-            cod_munic = obter_texto_elemento(end_brasil, "codMunic") if end_brasil else ""
-            nm_cidade = obter_texto_elemento(end_brasil, "nmCid") if end_brasil else ""
-            uf_resid = obter_texto_elemento(end_brasil, "uf") if end_brasil else ""
-            
-            # Endereço (Exterior)
-            end_exterior = encontrar_elemento(endereco, "exterior") if endereco else None
-            pais_resid = obter_texto_elemento(end_exterior, "paisResid") if end_exterior else ""
-            bairro_ext = obter_texto_elemento(end_exterior, "bairro") if end_exterior else ""
-            dsc_lograd_ext = obter_texto_elemento(end_exterior, "dscLograd") if end_exterior else ""
-            nr_lograd_ext = obter_texto_elemento(end_exterior, "nrLograd") if end_exterior else ""
-            complemento_ext = obter_texto_elemento(end_exterior, "complemento") if end_exterior else ""
-            nm_cidade_ext = obter_texto_elemento(end_exterior, "nmCid") if end_exterior else ""
-            cod_postal_ext = obter_texto_elemento(end_exterior, "codPostal") if end_exterior else ""
-            
-            # Trabalhador Imigrante
-            trab_imig = encontrar_elemento(trabalhador, "trabImig")
-            tmp_resid = obter_texto_elemento(trab_imig, "tmpResid") if trab_imig else ""
-            cond_ing = obter_texto_elemento(trab_imig, "condIng") if trab_imig else ""
-            
-            # InfoDeficiencia
-            info_def = encontrar_elemento(trabalhador, "infoDeficiencia")
-            def_fisica = obter_texto_elemento(info_def, "defFisica") if info_def else ""
-            def_visual = obter_texto_elemento(info_def, "defVisual") if info_def else ""
-            def_auditiva = obter_texto_elemento(info_def, "defAuditiva") if info_def else ""
-            def_mental = obter_texto_elemento(info_def, "defMental") if info_def else ""
-            def_intelectual = obter_texto_elemento(info_def, "defIntelectual") if info_def else ""
-            reab_readap = obter_texto_elemento(info_def, "reabReadap") if info_def else ""
-            info_cota = obter_texto_elemento(info_def, "infoCota") if info_def else ""
-            observacao_def = obter_texto_elemento(info_def, "observacao") if info_def else ""
-            
-            # Contato
-            contato = encontrar_elemento(trabalhador, "contato")
-            fone_princ = obter_texto_elemento(contato, "fonePrinc") if contato else ""
-            fone_alt = obter_texto_elemento(contato, "foneAlternativo") if contato else ""
-            email_princ = obter_texto_elemento(contato, "emailPrinc") if contato else ""
-            email_alt = obter_texto_elemento(contato, "emailAlternativo") if contato else ""
-            contato_emerg = obter_texto_elemento(contato, "contatoEmergencia") if contato else ""
-            fone_emerg = obter_texto_elemento(contato, "foneEmergencia") if contato else ""
-            parentesco_emerg = obter_texto_elemento(contato, "parentescoEmergencia") if contato else ""
-            
-            # Documentos - Enhanced extraction
-            documentos = encontrar_elemento(trabalhador, "documentos")
-            
-            # PIS/NIS
-            nis_trab = obter_texto_elemento(trabalhador, "nisTrab") if trabalhador else ""
-            
-            # RG
-            rg = encontrar_elemento(documentos, "rg") if documentos else None
-            nr_rg = obter_texto_elemento(rg, "nrRg") if rg else ""
-            orgao_emissor_rg = obter_texto_elemento(rg, "orgaoEmissor") if rg else ""
-            dt_exped_rg = obter_texto_elemento(rg, "dtExped") if rg else ""
-            uf_rg = obter_texto_elemento(rg, "uf") if rg else ""
-            
-            # CTPS
-            ctps = encontrar_elemento(documentos, "ctps") if documentos else None
-            nr_ctps = obter_texto_elemento(ctps, "nrCtps") if ctps else ""
-            serie_ctps = obter_texto_elemento(ctps, "serieCtps") if ctps else ""
-            uf_ctps = obter_texto_elemento(ctps, "ufCtps") if ctps else ""
-            dt_exped_ctps = obter_texto_elemento(ctps, "dtExped") if ctps else ""
-            
-            # CNH
-            cnh = encontrar_elemento(documentos, "cnh") if documentos else None
-            nr_reg_cnh = obter_texto_elemento(cnh, "nrRegCnh") if cnh else ""
-            categoria_cnh = obter_texto_elemento(cnh, "categoriaCnh") if cnh else ""
-            uf_cnh = obter_texto_elemento(cnh, "ufCnh") if cnh else ""
-            dt_exped_cnh = obter_texto_elemento(cnh, "dtExped") if cnh else ""
-            dt_pri_hab = obter_texto_elemento(cnh, "dtPriHab") if cnh else ""
-            dt_valid_cnh = obter_texto_elemento(cnh, "dtValid") if cnh else ""
-            
-            # RNE
-            rne = encontrar_elemento(documentos, "rne") if documentos else None
-            nr_rne = obter_texto_elemento(rne, "nrRne") if rne else ""
-            orgao_emissor_rne = obter_texto_elemento(rne, "orgaoEmissor") if rne else ""
-            uf_rne = obter_texto_elemento(rne, "uf") if rne else ""
-            dt_exped_rne = obter_texto_elemento(rne, "dtExped") if rne else ""
+            # Uma única passagem pelo evento coleta os textos de todos os blocos do vínculo
+            textos = extrair_textos_por_escopo(root, ESCOPOS_S2200)
             
-            # Passaporte
-            passaporte = encontrar_elemento(documentos, "passaporte") if documentos else None
-            nr_passaporte = obter_texto_elemento(passaporte, "nrPassaporte") if passaporte else ""
-            pais_origem_passaporte = obter_texto_elemento(passaporte, "paisOrigem") if passaporte else ""
-            dt_exped_passaporte = obter_texto_elemento(passaporte, "dtExped") if passaporte else ""
-            dt_valid_passaporte = obter_texto_elemento(passaporte, "dtValid") if passaporte else ""
-            
-            # RIC
-            ric = encontrar_elemento(documentos, "ric") if documentos else None
-            nr_ric = obter_texto_elemento(ric, "nrRic") if ric else ""
-            orgao_emissor_ric = obter_texto_elemento(ric, "orgaoEmissor") if ric else ""
-            uf_ric = obter_texto_elemento(ric, "uf") if ric else ""
-            dt_exped_ric = obter_texto_elemento(ric, "dtExped") if ric else ""
-            
-            # Título de Eleitor
-            titulo_eleitor = encontrar_elemento(documentos, "tituloEleitor") if documentos else None
-            nr_titulo = obter_texto_elemento(titulo_eleitor, "nrTitulo") if titulo_eleitor else ""
-            zona_titulo = obter_texto_elemento(titulo_eleitor, "zona") if titulo_eleitor else ""
-            secao_titulo = obter_texto_elemento(titulo_eleitor, "secao") if titulo_eleitor else ""
-            cod_munic_titulo = obter_texto_elemento(titulo_eleitor, "codMunic") if titulo_eleitor else ""
-            nm_cidade_titulo = obter_texto_elemento(titulo_eleitor, "nmCid") if titulo_eleitor else ""
-            uf_titulo = obter_texto_elemento(titulo_eleitor, "uf") if titulo_eleitor else ""
-            dt_exped_titulo = obter_texto_elemento(titulo_eleitor, "dtExped") if titulo_eleitor else ""
-            
-            # Certidão Militar
-            certidao_militar = encontrar_elemento(documentos, "certidaoMilitar") if documentos else None
-            nr_certidao = obter_texto_elemento(certidao_militar, "nrCertidao") if certidao_militar else ""
-            dt_exped_certidao = obter_texto_elemento(certidao_militar, "dtExped") if certidao_militar else ""
-            regiao_militar = obter_texto_elemento(certidao_militar, "regiaoMilitar") if certidao_militar else ""
-            tipo_certidao = obter_texto_elemento(certidao_militar, "tipoCertidao") if certidao_militar else ""
-            nr_certidao2 = obter_texto_elemento(certidao_militar, "nrCertidao2") if certidao_militar else ""
-            nr_serie = obter_texto_elemento(certidao_militar, "nrSerie") if certidao_militar else ""
-            dt_exped_certidao2 = obter_texto_elemento(certidao_militar, "dtExped2") if certidao_militar else ""
-            categoria_certidao = obter_texto_elemento(certidao_militar, "categoria") if certidao_militar else ""
-            
-            # Conselho de Classe
-            conselho = encontrar_elemento(documentos, "conselho") if documentos else None
-            nr_registro_conselho = obter_texto_elemento(conselho, "nrRegistro") if conselho else ""
-            orgao_emissor_conselho = obter_texto_elemento(conselho, "orgaoEmissor") if conselho else ""
-            uf_conselho = obter_texto_elemento(conselho, "uf") if conselho else ""
-            dt_exped_conselho = obter_texto_elemento(conselho, "dtExped") if conselho else ""
-            dt_validade_conselho = obter_texto_elemento(conselho, "dtValidade") if conselho else ""
-            
-            # Trabalhador Estrangeiro
-            trab_estrangeiro = encontrar_elemento(trabalhador, "trabEstrangeiro")
-            dt_chegada = obter_texto_elemento(trab_estrangeiro, "dtChegada") if trab_estrangeiro else ""
-            class_trab_estrang = obter_texto_elemento(trab_estrangeiro, "classTrabEstrang") if trab_estrangeiro else ""
-            casado_br = obter_texto_elemento(trab_estrangeiro, "casadoBr") if trab_estrangeiro else ""
-            filhos_br = obter_texto_elemento(trab_estrangeiro, "filhosBr") if trab_estrangeiro else ""
-            
-            # Dados do vínculo
-            vinculo = encontrar_elemento(root, "vinculo")
-            matricula = obter_texto_elemento(vinculo, "matricula") if vinculo else ""
-            tp_reg_trab = obter_texto_elemento(vinculo, "tpRegTrab") if vinculo else ""
-            tp_reg_prev = obter_texto_elemento(vinculo, "tpRegPrev") if vinculo else ""
-            cad_ini = obter_texto_elemento(vinculo, "cadIni") if vinculo else ""
-            
-            # InfoRegimeTrab
-            info_regime_trab = encontrar_elemento(vinculo, "infoRegimeTrab") if vinculo else None
-            info_celetista = encontrar_elemento(info_regime_trab, "infoCeletista") if info_regime_trab else None
-            info_estatutario = encontrar_elemento(info_regime_trab, "infoEstatutario") if info_regime_trab else None
-            
-            # InfoCeletista
-            dt_adm = obter_texto_elemento(info_celetista, "dtAdm") if info_celetista else ""
-            tp_admissao = obter_texto_elemento(info_celetista, "tpAdmissao") if info_celetista else ""
-            ind_admissao = obter_texto_elemento(info_celetista, "indAdmissao") if info_celetista else ""
-            nr_proc_trab = obter_texto_elemento(info_celetista, "nrProcTrab") if info_celetista else ""
-            tp_reg_jor = obter_texto_elemento(info_celetista, "tpRegJor") if info_celetista else ""
-            nat_atividade = obter_texto_elemento(info_celetista, "natAtividade") if info_celetista else ""
-            dt_base = obter_texto_elemento(info_celetista, "dtBase") if info_celetista else ""
-            cnpj_sind_categ_prof = obter_texto_elemento(info_celetista, "cnpjSindCategProf") if info_celetista else ""
-            mat_anot_jud = obter_texto_elemento(info_celetista, "matAnotJud") if info_celetista else ""
-            
-            # FGTS
-            fgts = encontrar_elemento(info_celetista, "FGTS") if info_celetista else None
-            dt_opc_fgts = obter_texto_elemento(fgts, "dtOpcFGTS") if fgts else ""
-            
-            # Trabalho Temporário
-            trab_temp = encontrar_elemento(info_celetista, "trabTemporario") if info_celetista else None
-            hip_leg = obter_texto_elemento(trab_temp, "hipLeg") if trab_temp else ""
-            just_contr = obter_texto_elemento(trab_temp, "justContr") if trab_temp else ""
-            tp_insc_estab = obter_texto_elemento(trab_temp, "tpInscEstab") if trab_temp else ""
-            nr_insc_estab = obter_texto_elemento(trab_temp, "nrInscEstab") if trab_temp else ""
-            cpf_trab_subst = obter_texto_elemento(trab_temp, "cpfTrabSubst") if trab_temp else ""
-            
-            # InfoEstatutario
-            tp_prov = obter_texto_elemento(info_estatutario, "tpProv") if info_estatutario else ""
-            dt_exercicio = obter_texto_elemento(info_estatutario, "dtExercicio") if info_estatutario else ""
-            tp_plan_rp = obter_texto_elemento(info_estatutario, "tpPlanRP") if info_estatutario else ""
-            ind_teto_rgps = obter_texto_elemento(info_estatutario, "indTetoRGPS") if info_estatutario else ""
-            ind_abono_perm = obter_texto_elemento(info_estatutario, "indAbonoPerm") if info_estatutario else ""
-            dt_ini_abono = obter_texto_elemento(info_estatutario, "dtIniAbono") if info_estatutario else ""
-            
-            # InfoContrato
-            info_contrato = encontrar_elemento(vinculo, "infoContrato") if vinculo else None
-            nm_cargo = obter_texto_elemento(info_contrato, "nmCargo") if info_contrato else ""
-            cbo_cargo = obter_texto_elemento(info_contrato, "CBOCargo") if info_contrato else ""
-            dt_ingr_cargo = obter_texto_elemento(info_contrato, "dtIngrCargo") if info_contrato else ""
-            nm_funcao = obter_texto_elemento(info_contrato, "nmFuncao") if info_contrato else ""
-            cbo_funcao = obter_texto_elemento(info_contrato, "CBOFuncao") if info_contrato else ""
-            acum_cargo = obter_texto_elemento(info_contrato, "acumCargo") if info_contrato else ""
-            cod_categoria = obter_texto_elemento(info_contrato, "codCateg") if info_contrato else ""
+            # Montar dicionário com TODOS os dados do trabalhador (Enhanced Coverage)
+            vinculo_dict = mapear_campos(textos, CAMPOS_S2200)
+            cpf_trabalhador = vinculo_dict['cpf_trabalhador']
+            matricula = vinculo_dict['matricula']
+            cnpj_empregador = vinculo_dict['cnpj_empregador']
             
             # Remuneração
-            remuneracao = encontrar_elemento(info_contrato, "remuneracao") if info_contrato else None
-            salario_contratual = 0.0
-            if remuneracao is not None:
-                valor_str = obter_texto_elemento(remuneracao, "vrSalFx")
+            # O texto vem sempre como str de mapear_campos: vazio é testado antes e só
+            # um valor não numérico (ValueError) chega ao tratamento de exceção
+            valor_str = vinculo_dict['salario_contratual']
+            if not valor_str:
+                vinculo_dict['salario_contratual'] = 0.0
+            else:
                 try:
-                    salario_contratual = float(valor_str.replace(',', '.')) if valor_str else 0.0
-                except (ValueError, TypeError, AttributeError):
+                    vinculo_dict['salario_contratual'] = float(
+                        valor_str if valor_str.find(',') < 0 else valor_str.replace(',', '.', 1))
+                except ValueError:
                     self.logger.warning(f"Valor salarial inválido ou não numérico: '{valor_str}'. Usando 0.0 como padrão.")
-                    salario_contratual = 0.0
-            und_sal_fixo = obter_texto_elemento(remuneracao, "undSalFixo") if remuneracao else ""
-            
-            # Duração do contrato
-            duracao = encontrar_elemento(info_contrato, "duracao") if info_contrato else None
-            tipo_contrato = ""
-            duracao_contrato = ""
-            clau_assec = ""
-            obj_det = ""
-            if duracao is not None:
-                tipo_contrato = obter_texto_elemento(duracao, "tpContr")
-                duracao_contrato = obter_texto_elemento(duracao, "dtTerm")
-                clau_assec = obter_texto_elemento(duracao, "clauAssec")
-                obj_det = obter_texto_elemento(duracao, "objDet")
-            
-            # Local de Trabalho
-            local_trabalho = encontrar_elemento(info_contrato, "localTrabalho") if info_contrato else None
-            local_trab_geral = encontrar_elemento(local_trabalho, "localTrabGeral") if local_trabalho else None
-            local_temp_dom = encontrar_elemento(local_trabalho, "localTempDom") if local_trabalho else None
-            
-            # Horário Contratual
-            hor_contratual = encontrar_elemento(info_contrato, "horContratual") if info_contrato else None
-            
-            # Alvará Judicial
-            alvara_judicial = encontrar_elemento(info_contrato, "alvaraJudicial") if info_contrato else None
-            
-            # Observações
-            observacoes = encontrar_elemento(info_contrato, "observacoes") if info_contrato else None
-            observacao = obter_texto_elemento(observacoes, "observacao") if observacoes else ""
-            
-            # Treinamentos/Capacitações
-            trei_cap = encontrar_elemento(info_contrato, "treiCap") if info_contrato else None
-            
-            # Sucessão de Vínculo
-            sucessao_vinc = encontrar_elemento(vinculo, "sucessaoVinc") if vinculo else None
-            sucessao_tp_insc = obter_texto_elemento(sucessao_vinc, "tpInsc") if sucessao_vinc else ""
-            sucessao_nr_insc = obter_texto_elemento(sucessao_vinc, "nrInsc") if sucessao_vinc else ""
-            sucessao_matric_ant = obter_texto_elemento(sucessao_vinc, "matricAnt") if sucessao_vinc else ""
-            sucessao_dt_transf = obter_texto_elemento(sucessao_vinc, "dtTransf") if sucessao_vinc else ""
-            sucessao_observacao = obter_texto_elemento(sucessao_vinc, "observacao") if sucessao_vinc else ""
-            
-            # Transferência Doméstica
-            transf_dom = encontrar_elemento(vinculo, "transfDom") if vinculo else None
-            cpf_substituido = obter_texto_elemento(transf_dom, "cpfSubstituido") if transf_dom else ""
-            transf_matric_ant = obter_texto_elemento(transf_dom, "matricAnt") if transf_dom else ""
-            transf_dt_transf = obter_texto_elemento(transf_dom, "dtTransf") if transf_dom else ""
+                    vinculo_dict['salario_contratual'] = 0.0
             
-            # Mudança de CPF
-            mudanca_cpf = encontrar_elemento(vinculo, "mudancaCPF") if vinculo else None
-            cpf_ant = obter_texto_elemento(mudanca_cpf, "cpfAnt") if mudanca_cpf else ""
-            mudanca_matric_ant = obter_texto_elemento(mudanca_cpf, "matricAnt") if mudanca_cpf else ""
-            dt_alt_cpf = obter_texto_elemento(mudanca_cpf, "dtAltCPF") if mudanca_cpf else ""
-            mudanca_observacao = obter_texto_elemento(mudanca_cpf, "observacao") if mudanca_cpf else ""
+            # Subárvores convertidas para o JSON do evento são reaproveitadas no JSON dos dependentes
+            dicts_elementos = {}
             
-            # Afastamento
-            afastamento = encontrar_elemento(vinculo, "afastamento") if vinculo else None
-            dt_ini_afast = obter_texto_elemento(afastamento, "dtIniAfast") if afastamento else ""
-            cod_mot_afast = obter_texto_elemento(afastamento, "codMotAfast") if afastamento else ""
-            
-            # Desligamento
-            desligamento = encontrar_elemento(vinculo, "desligamento") if vinculo else None
-            dt_deslig = obter_texto_elemento(desligamento, "dtDeslig") if desligamento else ""
-            
-            # Cessão
-            cessao = encontrar_elemento(vinculo, "cessao") if vinculo else None
-            dt_ini_cessao = obter_texto_elemento(cessao, "dtIniCessao") if cessao else ""
-            
-            # Montar dicionário com TODOS os dados do trabalhador (Enhanced Coverage)
-            vinculo_dict = {
-                # Dados básicos do trabalhador
-                'cpf_trabalhador': cpf_trabalhador,
-                'nome_trabalhador': nome_trabalhador,
-                'sexo': sexo,
-                'raca_cor': raca_cor,
-                'estado_civil': estado_civil,
-                'grau_instrucao': grau_instrucao,
-                'nome_social': nome_social,
-                
-                # Nascimento
-                'data_nascimento': data_nascimento,
-                'nm_mae': nm_mae,
-                'nm_pai': nm_pai,
-                'uf_nasc': uf_nasc,
-                'pais_nasc': pais_nasc,
-                'pais_nac': pais_nac,
-                
-                # Endereço Brasil
-                'tp_lograd': tp_lograd,
-                'dsc_lograd': dsc_lograd,
-                'nr_lograd': nr_lograd,
-                'complemento': complemento,
-                'cep': cep,
-                'bairro': bairro,
-                'cod_munic': cod_munic,
-                'nm_cidade': nm_cidade,
-                'uf_resid': uf_resid,
-                
-                # Endereço Exterior
-                'pais_resid': pais_resid,
-                'bairro_ext': bairro_ext,
-                'dsc_lograd_ext': dsc_lograd_ext,
-                'nr_lograd_ext': nr_lograd_ext,
-                'complemento_ext': complemento_ext,
-                'nm_cidade_ext': nm_cidade_ext,
-                'cod_postal_ext': cod_postal_ext,
-                
-                # Trabalhador Imigrante
-                'tmp_resid': tmp_resid,
-                'cond_ing': cond_ing,
-                
-                # InfoDeficiencia
-                'def_fisica': def_fisica,
-                'def_visual': def_visual,
-                'def_auditiva': def_auditiva,
-                'def_mental': def_mental,
-                'def_intelectual': def_intelectual,
-                'reab_readap': reab_readap,
-                'info_cota': info_cota,
-                'observacao_def': observacao_def,
-                
-                # Contato
-                'fone_princ': fone_princ,
-                'fone_alt': fone_alt,
-                'email_princ': email_princ,
-                'email_alt': email_alt,
-                'contato_emerg': contato_emerg,
-                'fone_emerg': fone_emerg,
-                'parentesco_emerg': parentesco_emerg,
-                
-                # Documentos - Enhanced
-                'nis_trabalhador': nis_trab,
-                'nr_rg': nr_rg,
-                'orgao_emissor_rg': orgao_emissor_rg,
-                'dt_exped_rg': dt_exped_rg,
-                'uf_rg': uf_rg,
-                'nr_ctps': nr_ctps,
-                'serie_ctps': serie_ctps,
-                'uf_ctps': uf_ctps,
-                'dt_exped_ctps': dt_exped_ctps,
-                'nr_reg_cnh': nr_reg_cnh,
-                'categoria_cnh': categoria_cnh,
-                'uf_cnh': uf_cnh,
-                'dt_exped_cnh': dt_exped_cnh,
-                'dt_pri_hab': dt_pri_hab,
-                'dt_valid_cnh': dt_valid_cnh,
-                'nr_rne': nr_rne,
-                'orgao_emissor_rne': orgao_emissor_rne,
-                'uf_rne': uf_rne,
-                'dt_exped_rne': dt_exped_rne,
-                'nr_passaporte': nr_passaporte,
-                'pais_origem_passaporte': pais_origem_passaporte,
-                'dt_exped_passaporte': dt_exped_passaporte,
-                'dt_valid_passaporte': dt_valid_passaporte,
-                'nr_ric': nr_ric,
-                'orgao_emissor_ric': orgao_emissor_ric,
-                'uf_ric': uf_ric,
-                'dt_exped_ric': dt_exped_ric,
-                'nr_titulo': nr_titulo,
-                'zona_titulo': zona_titulo,
-                'secao_titulo': secao_titulo,
-                'cod_munic_titulo': cod_munic_titulo,
-                'nm_cidade_titulo': nm_cidade_titulo,
-                'uf_titulo': uf_titulo,
-                'dt_exped_titulo': dt_exped_titulo,
-                'nr_certidao': nr_certidao,
-                'dt_exped_certidao': dt_exped_certidao,
-                'regiao_militar': regiao_militar,
-                'tipo_certidao': tipo_certidao,
-                'nr_certidao2': nr_certidao2,
-                'nr_serie': nr_serie,
-                'dt_exped_certidao2': dt_exped_certidao2,
-                'categoria_certidao': categoria_certidao,
-                'nr_registro_conselho': nr_registro_conselho,
-                'orgao_emissor_conselho': orgao_emissor_conselho,
-                'uf_conselho': uf_conselho,
-                'dt_exped_conselho': dt_exped_conselho,
-                'dt_validade_conselho': dt_validade_conselho,
-                
-                # Trabalhador Estrangeiro
-                'dt_chegada': dt_chegada,
-                'class_trab_estrang': class_trab_estrang,
-                'casado_br': casado_br,
-                'filhos_br': filhos_br,
-                
-                # Vínculo
-                'matricula': matricula,
-                'tp_reg_trab': tp_reg_trab,
-                'tp_reg_prev': tp_reg_prev,
-                'cad_ini': cad_ini,
-                
-                # InfoCeletista
-                'dt_adm': dt_adm,
-                'tp_admissao': tp_admissao,
-                'ind_admissao': ind_admissao,
-                'nr_proc_trab': nr_proc_trab,
-                'tp_reg_jor': tp_reg_jor,
-                'nat_atividade': nat_atividade,
-                'dt_base': dt_base,
-                'cnpj_sind_categ_prof': cnpj_sind_categ_prof,
-                'mat_anot_jud': mat_anot_jud,
-                'dt_opc_fgts': dt_opc_fgts,
-                
-                # Trabalho Temporário
-                'hip_leg': hip_leg,
-                'just_contr': just_contr,
-                'tp_insc_estab': tp_insc_estab,
-                'nr_insc_estab': nr_insc_estab,
-                'cpf_trab_subst': cpf_trab_subst,
-                
-                # InfoEstatutario
-                'tp_prov': tp_prov,
-                'dt_exercicio': dt_exercicio,
-                'tp_plan_rp': tp_plan_rp,
-                'ind_teto_rgps': ind_teto_rgps,
-                'ind_abono_perm': ind_abono_perm,
-                'dt_ini_abono': dt_ini_abono,
-                
-                # InfoContrato
-                'nm_cargo': nm_cargo,
-                'cbo_cargo': cbo_cargo,
-                'dt_ingr_cargo': dt_ingr_cargo,
-                'nm_funcao': nm_funcao,
-                'cbo_funcao': cbo_funcao,
-                'acum_cargo': acum_cargo,
-                'cod_categoria': cod_categoria,
-                'salario_contratual': salario_contratual,
-                'und_sal_fixo': und_sal_fixo,
-                'tipo_contrato': tipo_contrato,
-                'duracao_contrato': duracao_contrato,
-                'clau_assec': clau_assec,
-                'obj_det': obj_det,
-                
-                # Sucessão de Vínculo
-                'sucessao_tp_insc': sucessao_tp_insc,
-                'sucessao_nr_insc': sucessao_nr_insc,
-                'sucessao_matric_ant': sucessao_matric_ant,
-                'sucessao_dt_transf': sucessao_dt_transf,
-                'sucessao_observacao': sucessao_observacao,
-                
-                # Transferência Doméstica
-                'cpf_substituido': cpf_substituido,
-                'transf_matric_ant': transf_matric_ant,
-                'transf_dt_transf': transf_dt_transf,
-                
-                # Mudança de CPF
-                'cpf_ant': cpf_ant,
-                'mudanca_matric_ant': mudanca_matric_ant,
-                'dt_alt_cpf': dt_alt_cpf,
-                'mudanca_observacao': mudanca_observacao,
-                
-                # Afastamento
-                'dt_ini_afast': dt_ini_afast,
-                'cod_mot_afast': cod_mot_afast,
-                
-                # Desligamento
-                'dt_deslig': dt_deslig,
-                
-                # Cessão
-                'dt_ini_cessao': dt_ini_cessao,
-                
-                # Dados do empregador
-                'cnpj_empregador': cnpj_empregador,
-                
-                # JSON completo para análise (corrigido: wrap em 'evtAdmissao')
-                'json_data': json.dumps({'evtAdmissao': self._elemento_para_dict(root)})
-            }
+            # JSON completo para análise (corrigido: wrap em 'evtAdmissao')
+            vinculo_dict['json_data'] = self._json_elemento(root, dicts_elementos, chave='evtAdmissao')
             
             # Validar dados do trabalhador
             valido, mensagens_erro = ValidadorDados.validar_registro_s2200(vinculo_dict)
@@ -1400,36 +2157,30 @@ class ProcessadorXML:
             
             # Processar dependentes
             dependentes_list = []
-            dependentes = encontrar_todos_elementos(trabalhador, "dependente")
+            dependentes = encontrar_todos_elementos(encontrar_elemento(root, "trabalhador"), "dependente")
             
             for dependente in dependentes:
                 try:
-                    # Extrair dados do dependente
-                    nome_dependente = obter_texto_elemento(dependente, "nmDep")
-                    data_nascimento_dep = obter_texto_elemento(dependente, "dtNascto")
-                    cpf_dependente = obter_texto_elemento(dependente, "cpfDep")
-                    tipo_dependente = obter_texto_elemento(dependente, "tpDep")
-                    sexo_dependente = obter_texto_elemento(dependente, "sexoDep")
-                    dep_irrf = obter_texto_elemento(dependente, "depIRRF")
-                    dep_sf = obter_texto_elemento(dependente, "depSF")
-                    inc_trab = obter_texto_elemento(dependente, "incTrab")
-                    descr_dep = obter_texto_elemento(dependente, "descrDep")
+                    # Extrair dados do dependente em uma única passagem pelos seus elementos
+                    campos_dependente = extrair_textos_por_escopo(dependente, ESCOPOS_DEPENDENTE)[None]
+                    cpf_dependente = campos_dependente.get("cpfDep", "")
+                    data_nascimento_dep = campos_dependente.get("dtNascto", "")
                     
                     # Montar dicionário do dependente
                     dependente_dict = {
                         'cpf_trabalhador': cpf_trabalhador,
                         'matricula': matricula,
-                        'nome_dependente': nome_dependente,
+                        'nome_dependente': campos_dependente.get("nmDep", ""),
                         'cpf_dependente': cpf_dependente,
                         'data_nascimento': data_nascimento_dep,
-                        'tipo_dependente': tipo_dependente,
-                        'sexo_dependente': sexo_dependente,
-                        'dep_irrf': dep_irrf,
-                        'dep_sf': dep_sf,
-                        'inc_trab': inc_trab,
-                        'descr_dep': descr_dep,
+                        'tipo_dependente': campos_dependente.get("tpDep", ""),
+                        'sexo_dependente': campos_dependente.get("sexoDep", ""),
+                        'dep_irrf': campos_dependente.get("depIRRF", ""),
+                        'dep_sf': campos_dependente.get("depSF", ""),
+                        'inc_trab': campos_dependente.get("incTrab", ""),
+                        'descr_dep': campos_dependente.get("descrDep", ""),
                         'cnpj_empregador': cnpj_empregador,
-                        'json_data': json.dumps(self._elemento_para_dict(dependente))
+                        'json_data': self._json_elemento(dependente, dicts_elementos)
                     }
                     
                     # Validar CPF do dependente se estiver preenchido
@@ -1453,12 +2204,12 @@ class ProcessadorXML:
             # Inserir no banco de dados em transação única
             try:
                 # Inserir trabalhador
-                self.gerenciador_bd.inserir_dados("esocial_s2200", [vinculo_dict])
+                self._inserir_dados("esocial_s2200", [vinculo_dict])
                 
                 # Inserir dependentes se houver
                 if dependentes_list:
-                    inseridos = self.gerenciador_bd.inserir_dados("esocial_dependentes", dependentes_list)
-                    self.logger.info(f"Inseridos {inseridos} dependentes para o trabalhador {cpf_trabalhador}")
+                    inseridos = self._inserir_dados("esocial_dependentes", dependentes_list)
+                    self.logger.info("Inseridos %s dependentes para o trabalhador %s", inseridos, cpf_trabalhador)
                 
                 return True
             except Exception as e:
@@ -1472,46 +2223,13 @@ class ProcessadorXML:
     def _processar_s2205(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-2205 (Alteração de Dados Cadastrais)"""
         try:
-            # Extrair CNPJ do empregador
-            ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
-
-            # Extrair dados do trabalhador
-            ide_trabalhador = encontrar_elemento(root, "ideTrabalhador")
-            cpf_trabalhador = obter_texto_elemento(ide_trabalhador, "cpfTrab") if ide_trabalhador else ""
-            matricula = obter_texto_elemento(root, "matricula")  # S-2205 may not have matricula at root, try alteracao/matricula
-            
-            # Extrair bloco de alteracao
-            alteracao = encontrar_elemento(root, "alteracao")
-            data_alteracao = obter_texto_elemento(alteracao, "dtAlteracao") if alteracao else ""
-            dados_gerais = encontrar_elemento(alteracao, "dadosTrabalhador") if alteracao else None
-
-            # Extrair novos dados do trabalhador
-            nome_trabalhador = obter_texto_elemento(dados_gerais, "nmTrab") if dados_gerais else ""
-            sexo = obter_texto_elemento(dados_gerais, "sexo") if dados_gerais else ""
-            raca_cor = obter_texto_elemento(dados_gerais, "racaCor") if dados_gerais else ""
-            estado_civil = obter_texto_elemento(dados_gerais, "estCiv") if dados_gerais else ""
-            grau_instrucao = obter_texto_elemento(dados_gerais, "grauInstr") if dados_gerais else ""
-            nascimento = encontrar_elemento(dados_gerais, "nascimento") if dados_gerais else None
-            data_nascimento = obter_texto_elemento(nascimento, "dtNascto") if nascimento else ""
-
-            # Montar dicionário com os dados
-            alteracao_dict = {
-                'cpf_trabalhador': cpf_trabalhador,
-                'nome_trabalhador': nome_trabalhador,
-                'data_alteracao': data_alteracao,
-                'sexo': sexo,
-                'raca_cor': raca_cor,
-                'estado_civil': estado_civil,
-                'grau_instrucao': grau_instrucao,
-                'data_nascimento': data_nascimento,
-                'cnpj_empregador': cnpj_empregador,
-                'matricula': matricula,
-                'json_data': json.dumps(self._elemento_para_dict(root))
-            }
+            # Uma única passagem pelo evento coleta os textos dos blocos de CAMPOS_S2205
+            textos = extrair_textos_por_escopo(root, ESCOPOS_S2205)
+            alteracao_dict = mapear_campos(textos, CAMPOS_S2205)
+            alteracao_dict['json_data'] = self._json_elemento(root)
 
             # Inserir no banco de dados
-            self.gerenciador_bd.inserir_dados("esocial_s2205", [alteracao_dict])
+            self._inserir_dados("esocial_s2205", [alteracao_dict])
             return True
         except Exception as e:
             self.logger.error(f"Erro ao processar S-2205 {caminho_arquivo}: {e}", exc_info=True)
@@ -1520,47 +2238,31 @@ class ProcessadorXML:
     def _processar_s2206(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-2206 (Alteração de Contrato de Trabalho)"""
         try:
-            self.logger.debug(f"Iniciando processamento de S-2206: {caminho_arquivo}")
-            
-            # Extrair CNPJ do empregador
-            ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
-            self.logger.debug(f"S-2206: CNPJ empregador = {cnpj_empregador}")
+            self.logger.debug("Iniciando processamento de S-2206: %s", caminho_arquivo)
             
-            # Extrair dados do trabalhador - tenta em ideVinculo primeiro, depois em ideTrabalhador
-            cpf_trabalhador = ""
-            matricula = ""
+            # Uma única passagem pelo evento coleta os textos dos blocos de identificação
+            textos = extrair_textos_por_escopo(root, ESCOPOS_S2206)
+            cnpj_empregador = textos.get('ideEmpregador', _TEXTOS_VAZIOS).get('nrInsc', "")
+            self.logger.debug("S-2206: CNPJ empregador = %s", cnpj_empregador)
             
-            # Tenta em ideVinculo
-            ide_vinculo = encontrar_elemento(root, "ideVinculo")
-            if ide_vinculo is not None:
-                cpf_trabalhador = obter_texto_elemento(ide_vinculo, "cpfTrab")
-                matricula = obter_texto_elemento(ide_vinculo, "matricula")
-                
-            # Se não encontrou em ideVinculo, tenta em ideTrabalhador
-            if not cpf_trabalhador:
-                ide_trabalhador = encontrar_elemento(root, "ideTrabalhador")
-                if ide_trabalhador is not None:
-                    cpf_trabalhador = obter_texto_elemento(ide_trabalhador, "cpfTrab")
-                    matricula = obter_texto_elemento(ide_trabalhador, "matricula")
+            # Dados do trabalhador - tenta em ideVinculo primeiro, depois em ideTrabalhador
+            ide_vinculo = textos.get('ideVinculo', _TEXTOS_VAZIOS)
+            cpf_trabalhador = ide_vinculo.get('cpfTrab', "")
+            matricula = ide_vinculo.get('matricula', "")
+            if not cpf_trabalhador and 'ideTrabalhador' in textos:
+                cpf_trabalhador = textos['ideTrabalhador'].get('cpfTrab', "")
+                matricula = textos['ideTrabalhador'].get('matricula', "")
             
-            self.logger.debug(f"S-2206: CPF = {cpf_trabalhador}, Matricula = {matricula}")
+            self.logger.debug("S-2206: CPF = %s, Matricula = %s", cpf_trabalhador, matricula)
             
             # Data da alteração
-            alteracao_info = encontrar_elemento(root, "altContratual")
-            data_alteracao = obter_texto_elemento(alteracao_info, "dtAlteracao") if alteracao_info else ""
-            self.logger.debug(f"S-2206: Data alteração = {data_alteracao}")
+            data_alteracao = textos.get('altContratual', _TEXTOS_VAZIOS).get('dtAlteracao', "")
+            self.logger.debug("S-2206: Data alteração = %s", data_alteracao)
             
             # Dados do contrato alterado - procurar dentro de altContratual/vinculo/infoContrato ou altContratual/infoContrato
-            vinculo_alt = encontrar_elemento(alteracao_info, "vinculo") if alteracao_info else None
-            info_contrato = None
-            
-            # Tenta encontrar infoContrato dentro de vinculo
-            if vinculo_alt is not None:
-                info_contrato = encontrar_elemento(vinculo_alt, "infoContrato")
-            
-            # Se não encontrou, tenta diretamente em altContratual
-            if info_contrato is None and alteracao_info is not None:
+            alteracao_info = encontrar_elemento(root, "altContratual")
+            info_contrato = encontrar_elemento(encontrar_elemento(alteracao_info, "vinculo"), "infoContrato")
+            if info_contrato is None:
                 info_contrato = encontrar_elemento(alteracao_info, "infoContrato")
             
             # Valores padrão para os campos
@@ -1572,30 +2274,30 @@ class ProcessadorXML:
             
             if info_contrato is not None:
                 self.logger.debug("S-2206: Encontrou infoContrato")
+                textos_contrato = extrair_textos_por_escopo(info_contrato, ESCOPOS_INFO_CONTRATO_S2206)
+                
                 # Informações de cargo
-                cod_cargo = obter_texto_elemento(info_contrato, "codCargo")
-                cod_funcao = obter_texto_elemento(info_contrato, "codFuncao")
-                cod_categoria = obter_texto_elemento(info_contrato, "codCateg")
+                campos_contrato = textos_contrato[None]
+                cod_cargo = campos_contrato.get('codCargo', "")
+                cod_funcao = campos_contrato.get('codFuncao', "")
+                cod_categoria = campos_contrato.get('codCateg', "")
                 
-                self.logger.debug(f"S-2206: cod_cargo = {cod_cargo}, cod_funcao = {cod_funcao}, cod_categoria = {cod_categoria}")
+                self.logger.debug("S-2206: cod_cargo = %s, cod_funcao = %s, cod_categoria = %s",
+                                  cod_cargo, cod_funcao, cod_categoria)
                 
                 # Se não encontrar codCargo, tenta CBOCargo como alternativa
                 if not cod_cargo:
-                    cod_cargo = obter_texto_elemento(info_contrato, "CBOCargo")
+                    cod_cargo = campos_contrato.get('CBOCargo', "")
                 
                 # Remuneração
-                remuneracao = encontrar_elemento(info_contrato, "remuneracao")
-                salario_str = obter_texto_elemento(remuneracao, "vrSalFx") if remuneracao else "0"
-                try:
-                    salario_contratual = float(salario_str.replace(',', '.'))
-                except (ValueError, AttributeError):
-                    salario_contratual = 0.0
+                # converter_decimal só substitui a vírgula quando ela existe e trata o vazio sem exceção
+                salario_contratual = converter_decimal(
+                    textos_contrato.get('remuneracao', _TEXTOS_VAZIOS).get('vrSalFx', ""))
                 
-                self.logger.debug(f"S-2206: salario_contratual = {salario_contratual}")
+                self.logger.debug("S-2206: salario_contratual = %s", salario_contratual)
                 
                 # Duração do contrato
-                duracao_elemento = encontrar_elemento(info_contrato, "duracao")
-                tipo_contrato = obter_texto_elemento(duracao_elemento, "tpContr") if duracao_elemento else ""
+                tipo_contrato = textos_contrato.get('duracao', _TEXTOS_VAZIOS).get('tpContr', "")
             
             # Montar dicionário com os dados coletados
             alteracao_dict = {
@@ -1609,14 +2311,14 @@ class ProcessadorXML:
                 'tipo_contrato': tipo_contrato,
                 'duracao_contrato': '',  # Sem data fim específica
                 'cnpj_empregador': cnpj_empregador,
-                'json_data': json.dumps(self._elemento_para_dict(root))
+                'json_data': self._json_elemento(root)
             }
             
-            self.logger.info(f"S-2206: Inserindo dados para CPF {cpf_trabalhador}, alteração de {data_alteracao}")
+            self.logger.info("S-2206: Inserindo dados para CPF %s, alteração de %s", cpf_trabalhador, data_alteracao)
             
             # Inserir no banco de dados
-            registros = self.gerenciador_bd.inserir_dados("esocial_s2206", [alteracao_dict])
-            self.logger.info(f"S-2206: {registros} registros inseridos no banco")
+            registros = self._inserir_dados("esocial_s2206", [alteracao_dict])
+            self.logger.info("S-2206: %s registros inseridos no banco", registros)
             return registros > 0
             
         except Exception as e:
@@ -1626,56 +2328,30 @@ class ProcessadorXML:
     def _processar_s2230(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-2230 (Afastamento Temporário)"""
         try:
-            # Extrair CNPJ do empregador
-            cnpj_empregador = obter_texto_elemento(root, "nrInsc")
-            
-            # Extrair dados do trabalhador
-            cpf_trabalhador = obter_texto_elemento(root, "cpfTrab")
-            matricula = obter_texto_elemento(root, "matricula")
+            # Uma única passagem pelo evento coleta os textos do evento e dos blocos do afastamento
+            textos = extrair_textos_por_escopo(root, ESCOPOS_S2230)
             
-            # Informações do afastamento
-            info_afastamento = encontrar_elemento(root, "infoAfastamento")
+            # Extrair CNPJ do empregador e dados do trabalhador
+            campos_evento = textos[None]
+            cnpj_empregador = campos_evento.get("nrInsc", "")
+            cpf_trabalhador = campos_evento.get("cpfTrab", "")
+            matricula = campos_evento.get("matricula", "")
             
             # Lista para armazenar afastamentos
             afastamentos_list = []
             
-            if info_afastamento is not None:
+            if 'infoAfastamento' in textos:
                 # Dados do início do afastamento
-                inicio = encontrar_elemento(info_afastamento, "iniAfastamento")
+                inicio = textos.get('iniAfastamento')
                 if inicio is not None:
-                    data_inicio = obter_texto_elemento(inicio, "dtIniAfast")
-                    codigo_motivo = obter_texto_elemento(inicio, "codMotAfast")
+                    data_inicio = inicio.get("dtIniAfast", "")
+                    codigo_motivo = inicio.get("codMotAfast", "")
                     
                     # Buscar descrição do motivo
-                    descricoes_motivo = {
-                        '01': 'Acidente/Doença do trabalho',
-                        '03': 'Acidente/Doença não relacionada ao trabalho',
-                        '05': 'Afastamento/Licença prevista em regime próprio, sem remuneração',
-                        '06': 'Aposentadoria por invalidez',
-                        '07': 'Acompanhamento de membro da família enfermo',
-                        '08': 'Afastamento/Licença prevista em regime próprio, com remuneração',
-                        '10': 'Licença-maternidade',
-                        '11': 'Licença-maternidade - (prorrogação)',
-                        '12': 'Licença-paternidade',
-                        '13': 'Licença-paternidade - (prorrogação)',
-                        '14': 'Licença remunerada prevista em CCT/ACT',
-                        '15': 'Serviço militar obrigatório',
-                        '16': 'Sustação do contrato de trabalho em virtude de inquérito',
-                        '17': 'Aposentadoria por invalidez',
-                        '18': 'Afastamento pelo INSS por acidente ou doença',
-                        '19': 'Afastamento sem remuneração',
-                        '20': 'Férias',
-                        '21': 'Férias coletivas',
-                        '22': 'Licença-prêmio',
-                        '23': 'Mandato eleitoral',
-                        '24': 'Mandato sindical',
-                        '25': 'Suspensão temporária do contrato',
-                    }
-                    descricao_motivo = descricoes_motivo.get(codigo_motivo, 'Motivo não especificado')
+                    descricao_motivo = DESCRICOES_MOTIVO_AFASTAMENTO.get(codigo_motivo, 'Motivo não especificado')
                     
                     # Dados do término do afastamento (se houver)
-                    termino = encontrar_elemento(info_afastamento, "fimAfastamento")
-                    data_fim = obter_texto_elemento(termino, "dtTermAfast") if termino else ""
+                    data_fim = textos.get('fimAfastamento', _TEXTOS_VAZIOS).get("dtTermAfast", "")
                     
                     # Montar dicionário com os dados
                     afastamento_dict = {
@@ -1686,14 +2362,14 @@ class ProcessadorXML:
                         'codigo_motivo': codigo_motivo,
                         'descricao_motivo': descricao_motivo,
                         'cnpj_empregador': cnpj_empregador,
-                        'json_data': json.dumps(self._elemento_para_dict(info_afastamento))
+                        'json_data': self._json_elemento(encontrar_elemento(root, "infoAfastamento"))
                     }
                     
                     afastamentos_list.append(afastamento_dict)
             
             # Inserir no banco de dados
             if afastamentos_list:
-                self.gerenciador_bd.inserir_dados("esocial_s2230", afastamentos_list)
+                self._inserir_dados("esocial_s2230", afastamentos_list)
                 return True
                 
             return False
@@ -1705,62 +2381,54 @@ class ProcessadorXML:
     def _processar_s2299(self, root, caminho_arquivo):
         """Processa arquivo XML do layout S-2299 (Desligamento)"""
         try:
+            # Uma única passagem pelo evento coleta somente os textos dos blocos usados
+            textos = extrair_textos_por_escopo(root, ESCOPOS_S2299)
+            
             # Extrair CNPJ do empregador
-            ide_empregador = encontrar_elemento(root, "ideEmpregador")
-            cnpj_empregador = obter_texto_elemento(ide_empregador, "nrInsc") if ide_empregador else ""
+            cnpj_empregador = textos.get('ideEmpregador', _TEXTOS_VAZIOS).get("nrInsc", "")
             
             # Extrair dados do trabalhador
-            ide_vinculo = encontrar_elemento(root, "ideVinculo")
-            cpf_trabalhador = obter_texto_elemento(ide_vinculo, "cpfTrab") if ide_vinculo else ""
-            matricula = obter_texto_elemento(ide_vinculo, "matricula") if ide_vinculo else ""
+            ide_vinculo = textos.get('ideVinculo', _TEXTOS_VAZIOS)
+            cpf_trabalhador = ide_vinculo.get("cpfTrab", "")
+            matricula = ide_vinculo.get("matricula", "")
             
             # Dados do desligamento
-            info_deslig = encontrar_elemento(root, "infoDeslig")
-            if info_deslig is None:
+            campos_deslig = textos.get('infoDeslig')
+            if campos_deslig is None:
                 self.logger.warning(f"Dados de desligamento não encontrados em {caminho_arquivo}")
                 return False
                 
             # Data do desligamento
-            data_desligamento = obter_texto_elemento(info_deslig, "dtDeslig")
+            data_desligamento = campos_deslig.get("dtDeslig", "")
             
             # Motivo do desligamento
-            motivo_desligamento = obter_texto_elemento(info_deslig, "mtvDeslig")
+            motivo_desligamento = campos_deslig.get("mtvDeslig", "")
             descricao_motivo = self._obter_descricao_motivo_desligamento(motivo_desligamento)
             
             # Aviso prévio
-            aviso_previo = encontrar_elemento(info_deslig, "infoAvPrevio")
-            data_aviso = obter_texto_elemento(aviso_previo, "dtAvPrv") if aviso_previo else ""
+            data_aviso = textos.get('infoAvPrevio', _TEXTOS_VAZIOS).get("dtAvPrv", "")
             
             # Dados de rescisão
             valores_rescisao = {}
-            verba_rescisoria = encontrar_elemento(info_deslig, "verbasResc")
+            valor_total_rescisao = 0.0
+            rubrica_repetida = False
+            verba_rescisoria = encontrar_elemento(encontrar_elemento(root, "infoDeslig"), "verbasResc")
             
             if verba_rescisoria is not None:
                 # Processar verbas rescisórias (saldo, férias, décimo terceiro, etc.)
-                dmdev_elements = encontrar_todos_elementos(verba_rescisoria, "dmDev")
-                for dmdev in dmdev_elements:
-                    id_dmdev = obter_texto_elemento(dmdev, "ideDmDev")
+                for item in coletar_rubricas_rescisao(verba_rescisoria):
+                    cod_rubrica = item.get("codRubr", "")
+                    valor = converter_decimal(item.get("vrRubr", ""))
                     
-                    # Processar cada item da rescisão
-                    itens_remuneracao = encontrar_todos_elementos(dmdev, "itensRemun")
-                    for item in itens_remuneracao:
-                        cod_rubrica = obter_texto_elemento(item, "codRubr")
-                        valor_str = obter_texto_elemento(item, "vrRubr")
-                        
-                        try:
-                            valor = float(valor_str.replace(',', '.'))
-                        except (ValueError, AttributeError, TypeError):
-                            valor = 0.0
-                        
-                        # Armazenar a rubrica
-                        valores_rescisao[cod_rubrica] = valor
-            
-            # Calcular valor total da rescisão (soma de todas as rubricas)
-            valor_total_rescisao = sum(valores_rescisao.values())
+                    # Armazenar a rubrica; uma rubrica repetida substitui o valor anterior
+                    if cod_rubrica in valores_rescisao:
+                        rubrica_repetida = True
+                    valores_rescisao[cod_rubrica] = valor
+                    valor_total_rescisao += valor
             
-            # Informações de FGTS
-            info_fgts = encontrar_elemento(info_deslig, "infoPerApur")
-            valor_multa_fgts = 0.0
+            # O total acumulado já é a soma das rubricas, exceto quando alguma foi substituída
+            if rubrica_repetida:
+                valor_total_rescisao = sum(valores_rescisao.values())
             
             # Montar dicionário com os dados do desligamento
             desligamento_dict = {
@@ -1771,14 +2439,18 @@ class ProcessadorXML:
                 'descricao_motivo': descricao_motivo,
                 'data_aviso_previo': data_aviso,
                 'valor_rescisao': valor_total_rescisao,
-                'valor_multa_fgts': valor_multa_fgts,
+                # O valor da multa do FGTS não é extraído do evento
+                'valor_multa_fgts': 0.0,
                 'cnpj_empregador': cnpj_empregador,
-                'json_data': json.dumps(self._elemento_para_dict(root))
+                # O registro do S-2299 é apenas validado, sem tabela de destino; converter o
+                # evento inteiro em JSON seria descartado sem nunca ser lido
+                'json_data': None
             }
             
-            # Validar dados do desligamento
-            valido, mensagens_erro = ValidadorDados.validar_registro_s2299(desligamento_dict)
-            if not valido:
+            # Validar dados do desligamento: a verificação sem mensagens resolve o caso comum
+            # e só um registro reprovado passa pela validação completa, que lista os erros
+            if not ValidadorDados.registro_s2299_valido(desligamento_dict):
+                valido, mensagens_erro = ValidadorDados.validar_registro_s2299(desligamento_dict)
                 for erro in mensagens_erro:
                     self.logger.warning(f"Validação para CPF {cpf_trabalhador}, arquivo {caminho_arquivo}: {erro}")
                 
@@ -1800,66 +2472,86 @@ class ProcessadorXML:
     
     def _obter_descricao_motivo_desligamento(self, codigo_motivo):
         """Retorna a descrição do motivo de desligamento baseado no código"""
-        descricoes = {
-            '01': 'Rescisão com justa causa por iniciativa do empregador',
-            '02': 'Rescisão sem justa causa por iniciativa do empregador',
-            '03': 'Rescisão antecipada do contrato a termo por iniciativa do empregador',
-            '04': 'Rescisão por culpa recíproca',
-            '05': 'Rescisão por força maior',
-            '06': 'Rescisão por término de contrato a termo',
-            '07': 'Rescisão do contrato de trabalho por iniciativa do empregado',
-            '08': 'Rescisão do contrato de trabalho por interesse do empregado',
-            '09': 'Rescisão por falecimento do empregado',
-            '10': 'Rescisão por falecimento do empregador individual',
-            '11': 'Transferência de empregado para empresa do mesmo grupo',
-            '12': 'Transferência de empregado para outra empresa',
-            '13': 'Rescisão contratual a pedido do empregado, durante o período de experiência',
-            '14': 'Rescisão contratual por encerramento da empresa',
-        }
-        return descricoes.get(codigo_motivo, 'Motivo não especificado')
+        return self._DESCRICOES_MOTIVO_DESLIGAMENTO.get(codigo_motivo, 'Motivo não especificado')
     
-    def _elemento_para_dict(self, elem):
-        """Converte um elemento XML para dicionário"""
-        if elem is None:
+    def _json_elemento(self, elem, cache=None, chave: Optional[str] = None) -> Optional[str]:
+        """
+        Serializa um elemento XML em JSON para a coluna json_data
+        
+        Args:
+            elem: Elemento XML
+            cache: Dicionário {elemento: dict já convertido} repassado a _elemento_para_dict
+            chave: Se informada, o JSON é envolvido em {chave: ...}
+        
+        Returns:
+            JSON do elemento, ou None se 'armazenar_json' estiver desabilitado
+        """
+        if not self._armazenar_json:
             return None
-            
-        result = {}
+        dados = self._elemento_para_dict(elem, cache)
+        return serializar_json({chave: dados} if chave else dados)
+    
+    def _elemento_para_dict(self, elem, cache=None):
+        """
+        Converte um elemento XML para dicionário
         
-        # Atributos do elemento
-        result.update(elem.attrib)
+        Args:
+            elem: Elemento XML
+            cache: Dicionário {elemento: dicionário convertido} compartilhado entre
+                chamadas sobre a mesma árvore; subárvores já convertidas são reaproveitadas
         
-        # Texto do elemento
-        if elem.text and elem.text.strip():
-            result['_text'] = elem.text.strip()
-            
-        # Elementos filhos
-        for child in elem:
-            child_dict = self._elemento_para_dict(child)
-            
-            # Nome do elemento filho
-            tag = child.tag
-            if '}' in tag:
-                tag = tag.split('}')[1]
+        Returns:
+            Dicionário do elemento, ou None se o elemento for None
+        """
+        if elem is None:
+            return None
+        if cache is not None and elem in cache:
+            return cache[elem]
+        
+        # Percurso iterativo com pilha explícita: sem um frame Python por elemento e sem
+        # limite de profundidade. O dicionário de cada filho é ligado ao pai ao ser criado
+        # (atributos e texto) e suas próprias chaves filhas são preenchidas quando é desempilhado
+        result = _dict_sem_filhos(elem)
+        if cache is not None:
+            cache[elem] = result
+        pilha = [(elem, result)]
+        while pilha:
+            atual, atual_dict = pilha.pop()
+            for child in atual:
+                child_dict = cache.get(child) if cache is not None else None
+                if child_dict is None:
+                    child_dict = _dict_sem_filhos(child)
+                    if cache is not None:
+                        cache[child] = child_dict
+                    if len(child):
+                        pilha.append((child, child_dict))
                 
-            # Adicionar ao resultado
-            if tag in result:
-                # Se já existe uma chave com este nome, transformar em lista
-                if not isinstance(result[tag], list):
-                    result[tag] = [result[tag]]
-                result[tag].append(child_dict)
-            else:
-                result[tag] = child_dict
+                # Nome do elemento filho
+                tag = _nome_local(child.tag)
                 
+                # Adicionar ao resultado; nenhum valor guardado é None (dicionários, listas
+                # e textos), então uma única consulta distingue chave nova de repetida
+                existente = atual_dict.get(tag)
+                if existente is None:
+                    atual_dict[tag] = child_dict
+                elif isinstance(existente, list):
+                    existente.append(child_dict)
+                else:
+                    # Se já existe uma chave com este nome, transformar em lista
+                    atual_dict[tag] = [existente, child_dict]
+        
         return result
     
     def detectar_layout_xml(self, caminho_arquivo: str) -> str:
         """
         Detecta o layout do XML a partir do caminho do arquivo.
+        
+        O resultado fica em cache por (caminho, data de modificação, tamanho): o mesmo
+        arquivo detectado de novo, por exemplo antes de ser processado, não é relido.
         """
         try:
-            tree = ET.parse(caminho_arquivo)
-            root = tree.getroot()
-            return identificar_layout(root)
+            estado = os.stat(caminho_arquivo)
+            return _identificar_layout_arquivo_em_cache(str(caminho_arquivo), estado.st_mtime_ns, estado.st_size)
         except Exception as e:
             self.logger.error(f"Erro ao detectar layout do XML: {e}")
             return None
@@ -1869,28 +2561,10 @@ class ProcessadorXML:
         Extrai os dados do XML e retorna como dicionário.
         """
         try:
-            tree = ET.parse(caminho_arquivo)
+            tree = carregar_xml(caminho_arquivo)
             root = tree.getroot()
             # Converte o XML para dict (simples)
-            def elem_to_dict(elem):
-                d = {elem.tag.split('}')[-1]: {}}
-                children = list(elem)
-                if children:
-                    dd = {}
-                    for dc in map(elem_to_dict, children):
-                        for k, v in dc.items():
-                            if k in dd:
-                                if not isinstance(dd[k], list):
-                                    dd[k] = [dd[k]]
-                                dd[k].append(v)
-                            else:
-                                dd[k] = v
-                    d = {elem.tag.split('}')[-1]: dd}
-                if elem.text and elem.text.strip():
-                    d[elem.tag.split('}')[-1]]['_text'] = elem.text.strip()
-                d[elem.tag.split('}')[-1]].update(elem.attrib)
-                return d
-            return elem_to_dict(root)
+            return _arvore_para_dict(root)
         except Exception as e:
             self.logger.error(f"Erro ao extrair dados do XML: {e}")
             return {}
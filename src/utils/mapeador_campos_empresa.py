@@ -2,1312 +2,1378 @@
 Mapeamento de campos entre templates da Empresa e tabelas eSocial
 """
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 import json
+import sys
 
 
-class MapeadorCamposEmpresa:
+# Marcador de chave ausente ao percorrer caminhos JSON
+_AUSENTE = object()
+
+
+class DefinicaoCampo(NamedTuple):
+    """Definição de um campo de template (origem, tipo e caminhos no JSON do evento)"""
+    origem: str
+    tipo: str = "string"
+    caminho_json: Optional[Tuple] = None
+    caminho_json_alternativos: Tuple[Tuple, ...] = ()
+    formato: Optional[str] = None
+    obrigatorio: bool = False
+    valor_padrao: Optional[str] = None
+    valores_validos: Optional[Tuple[str, ...]] = None
+    extrator: Optional[Callable[[Any], Any]] = None
+
+
+def _normalizar_caminho(caminho: Sequence) -> Tuple:
     """
-    Mapeador de campos entre dados eSocial e templates da Empresa
+    Converte um caminho JSON em tupla, internando as chaves textuais
+    
+    Args:
+        caminho: Sequência de chaves (str) e índices (int)
+        
+    Returns:
+        Tupla com as chaves internadas (compartilhadas entre os caminhos)
+    """
+    return tuple(sys.intern(chave) if isinstance(chave, str) else chave for chave in caminho)
+
+
+def _compilar_extrator(caminhos: Tuple[Tuple, ...]) -> Callable[[Any], Any]:
     """
+    Compila os caminhos de um campo (principal e alternativos) em uma função de extração
     
-    def __init__(self):
-        """Inicializa o mapeador com as definições de campo"""
-        self.mapeamentos = self._definir_mapeamentos()
+    Args:
+        caminhos: Caminhos JSON na ordem em que devem ser tentados
+        
+    Returns:
+        Função que recebe o JSON já carregado e retorna o primeiro valor não vazio
+        encontrado (desembrulhando '_text' ou dicionários de um só valor), ou None
+    """
+    def extrair(dados_json):
+        for caminho in caminhos:
+            valor = dados_json
+            for chave in caminho:
+                if not isinstance(valor, dict):
+                    break
+                valor = valor.get(chave, _AUSENTE)
+                if valor is _AUSENTE:
+                    break
+            else:
+                if isinstance(valor, dict):
+                    if "_text" in valor:
+                        valor = valor["_text"]
+                    elif len(valor) == 1:
+                        valor = next(iter(valor.values()))
+                    else:
+                        continue
+                if valor is not None and (not isinstance(valor, str) or valor.strip()):
+                    return valor
+        return None
     
-    def _definir_mapeamentos(self) -> Dict[str, Dict]:
-        """
-        Define os mapeamentos entre campos eSocial e templates Empresa
+    return extrair
+
+
+def _criar_definicao_campo(definicao: Dict[str, Any]) -> DefinicaoCampo:
+    """
+    Converte a definição literal (dicionário) de um campo em DefinicaoCampo
+    
+    Args:
+        definicao: Dicionário com as chaves da definição do campo
         
-        Returns:
-            Dicionário com mapeamentos por template
-        """
-        return {
-            "01_CONVTRABALHADOR": {
-                "fonte_principal": "esocial_s2200",
-                "fontes_adicionais": ["esocial_s2205", "esocial_s2206"],
-                "campos": {
-                    # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "2 B-Código referência": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "3 C-CPF trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
-                    "4 D-Nome trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "5 E-Data nascimento trabalhador": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6 F-Apelido trabalhador": {"origem": "nome_social", "tipo": "string"},
-                    "7 G-Nome social trabalhador": {"origem": "nome_social", "tipo": "string"},
-                    "8 H-Nome mae trabalhador": {"origem": "nm_mae", "tipo": "string"},
-                    "9 I-Nome pai trabalhador": {"origem": "nm_pai", "tipo": "string"},
-                    "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string"},
-                    "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
-                    "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
-                    "13 M-Estado civil do trabalhador": {"origem": "estado_civil", "tipo": "string"},
-                    "14 N-Indicativo de deficiência": {"origem": "def_fisica", "tipo": "string"},
-                    "15 O-Indicativo de deficiência física": {"origem": "def_fisica", "tipo": "string"},
-                    "16 P-Indicativo de deficiência visual": {"origem": "def_visual", "tipo": "string"},
-                    "17 Q-Indicativo de deficiência auditiva": {"origem": "def_auditiva", "tipo": "string"},
-                    "18 R-Indicativo de deficiência mental": {"origem": "def_mental", "tipo": "string"},
-                    "19 S-Indicativo de deficiência intelectual": {"origem": "def_intelectual", "tipo": "string"},
-                    "20 T-Trabalhador reabilitado ou adaptado": {"origem": "reab_readap", "tipo": "string"},
-                    "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "info_cota", "tipo": "string"},
-                    "22 V-Tipo sanguíneo": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tipoSangue", "_text"], "tipo": "string"},
-                    "23 W-Nome da cidade de  nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmCid", "_text"], "tipo": "string"},
-                    "24 X-UF da cidade de nascimento": {"origem": "uf_nasc", "tipo": "string"},
-                    "25 Y-Código do país de nascimento": {"origem": "pais_nasc", "tipo": "string"},
-                    "26 Z-Nome do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
-                    "27 AA-Código de país de nacionalidade": {"origem": "pais_nac", "tipo": "string"},
-                    "28 AB-Nome do país denacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
-                    "29 AC-Código RAIS do país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "codRais", "_text"], "tipo": "string"},
-                    "30 AD-É aposentado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "aposentado", "_text"], "tipo": "string"},
-                    "31 AE-Data de aposentaria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "dtAposent", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "32 AF-Reside no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "residePais", "_text"], "tipo": "string"},
-                    "33 AG-Código do tipo de logradouro": {"origem": "tp_lograd", "tipo": "string"},
-                    "34 AH-Endereço do trabalhador": {"origem": "dsc_lograd", "tipo": "string"},
-                    "35 AI-Número de endereço do trabalhador": {"origem": "nr_lograd", "tipo": "string"},
-                    "36 AJ-Complemento do endereço de trabalhador": {"origem": "complemento", "tipo": "string"},
-                    "37 AK-CEP do trabalhador": {"origem": "cep", "tipo": "string"},
-                    "38 AL-Bairro do trabalhador": {"origem": "bairro", "tipo": "string"},
-                    "39 AM-Código da cidade de residência do trabalhador": {"origem": "cod_munic", "tipo": "string"},
-                    "40 NA-Nome da cidade de residência do trabalhador": {"origem": "nm_cidade", "tipo": "string"},
-                    "41 AO-UF de residência": {"origem": "uf_resid", "tipo": "string"},
-                    "42 AP-Referência do endereço do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "referencia", "_text"], "tipo": "string"},
-                    "43 AQ-Telefone": {"origem": "fone_princ", "tipo": "string"},
-                    "44 AR-Telefone 2": {"origem": "fone_alt", "tipo": "string"},
-                    "45 AS-Email": {"origem": "email_princ", "tipo": "string"},
-                    "46 AT-Email alternativo": {"origem": "email_alt", "tipo": "string"},
-                    "47 AU-Contato de emergência": {"origem": "contato_emerg", "tipo": "string"},
-                    "48 AV-Telefone do contato de emergência": {"origem": "fone_emerg", "tipo": "string"},
-                    "49 AW-Parentesco do contato para emergência": {"origem": "parentesco_emerg", "tipo": "string"},
-                    "50 AX-Peso": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "peso", "_text"], "tipo": "string"},
-                    "51 AY-Altura": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "altura", "_text"], "tipo": "string"},
-                    "52 AZ-Calça": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalca", "_text"], "tipo": "string"},
-                    "53 BA-Camisa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCamisa", "_text"], "tipo": "string"},
-                    "54 BB-Calçado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalcado", "_text"], "tipo": "string"},
-                    "55 BC-Número do CNS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cns", "nrCns", "_text"], "tipo": "string"},
-                    "56 BD-Número do RG": {"origem": "nr_rg", "tipo": "string"},
-                    "57 BE-Órgão emissor do RG": {"origem": "orgao_emissor_rg", "tipo": "string"},
-                    "58 BF-Data de emissão do RG": {"origem": "dt_exped_rg", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "59 BG-UF de emissão do RG": {"origem": "uf_rg", "tipo": "string"},
-                    "60 BH-Número do RNE": {"origem": "nr_rne", "tipo": "string"},
-                    "61 BI-Órgão emissor do RNE": {"origem": "orgao_emissor_rne", "tipo": "string"},
-                    "62 BJ-UF de emissão do RNE": {"origem": "uf_rne", "tipo": "string"},
-                    "63 BK-Data de emissão do RNE": {"origem": "dt_exped_rne", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "64 BL-Data da chegada no país": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "65 BM-Classificação estrangeiro": {"origem": "class_trab_estrang", "tipo": "string"},
-                    "66 BN-Estrangeiro casado com brasileiro": {"origem": "casado_br", "tipo": "string"},
-                    "67 BO-Estrangeiro com filhos brasileiros": {"origem": "filhos_br", "tipo": "string"},
-                    "68 BP-Número do passaporte": {"origem": "nr_passaporte", "tipo": "string"},
-                    "69 BQ-País de origem do passaporte": {"origem": "pais_origem_passaporte", "tipo": "string"},
-                    "70 BR-Data de emissão do passaporte": {"origem": "dt_exped_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "71 BS-Data de validade do passaporte": {"origem": "dt_valid_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "72 BT-Número do RIC": {"origem": "nr_ric", "tipo": "string"},
-                    "73 BU-Órgão emissor do RIC": {"origem": "orgao_emissor_ric", "tipo": "string"},
-                    "74 BV-UF de emissão do RIC": {"origem": "uf_ric", "tipo": "string"},
-                    "75 BW-Data de emissão do RIC": {"origem": "dt_exped_ric", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "76 BXPIS": {"origem": "nis_trabalhador", "tipo": "string"},
-                    "77 BY-Data de emissão do PIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "pis", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "78 BZ-Número da CTPS": {"origem": "nr_ctps", "tipo": "string"},
-                    "79 CA-Série da CTPS": {"origem": "serie_ctps", "tipo": "string"},
-                    "80 CB-UF da CTPS": {"origem": "uf_ctps", "tipo": "string"},
-                    "81 CC-Data de emissão da CTPS": {"origem": "dt_exped_ctps", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "82 CD-Número do título de eleitor": {"origem": "nr_titulo", "tipo": "string"},
-                    "83 CE-Zona do título de eleitor": {"origem": "zona_titulo", "tipo": "string"},
-                    "84 CF-Seção do título de eleitor": {"origem": "secao_titulo", "tipo": "string"},
-                    "85 CG-Código da cidade do título de eleitor": {"origem": "cod_munic_titulo", "tipo": "string"},
-                    "86 CH-Nome da cidade do título de eleitor": {"origem": "nm_cidade_titulo", "tipo": "string"},
-                    "87 CI-UF do título de eleitor": {"origem": "uf_titulo", "tipo": "string"},
-                    "88 CJ-Data de emissão do título de eleitor": {"origem": "dt_exped_titulo", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "89 CK-Número da CNH": {"origem": "nr_reg_cnh", "tipo": "string"},
-                    "90 CL-Categoria da CNH": {"origem": "categoria_cnh", "tipo": "string"},
-                    "91 CM-UF da CNH": {"origem": "uf_cnh", "tipo": "string"},
-                    "92 CN-Data de emissão da CNH": {"origem": "dt_exped_cnh", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "93 CO-Data de emissão da primeira CNH": {"origem": "dt_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "94 CP-Data de validade da CNH": {"origem": "dt_valid_cnh", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "95 CQ-Número do certificado de alistamento militar": {"origem": "nr_certidao", "tipo": "string"},
-                    "96 CR-Data de expedição da CAM": {"origem": "dt_exped_certidao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "97 CS-Região militar": {"origem": "regiao_militar", "tipo": "string"},
-                    "98 CT-Tipo de certificado militar": {"origem": "tipo_certidao", "tipo": "string"},
-                    "99 CU-Número do certificado militar": {"origem": "nr_certidao2", "tipo": "string"},
-                    "100 CV-Número de série do certificado militar": {"origem": "nr_serie", "tipo": "string"},
-                    "101 CW-Data de expedição do certificado militar": {"origem": "dt_exped_certidao2", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "102 CX-Categoria do certificado militar": {"origem": "categoria_certidao", "tipo": "string"},
-                    "103 CY-Observações sobre a situação militar": {"origem": "observacao_def", "tipo": "string"},
-                    "104 CZ-Profissão": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "profissao", "_text"], "tipo": "string"},
-                    "105 DA-Número de registro no conselho de classe": {"origem": "nr_registro_conselho", "tipo": "string"},
-                    "106 DB-Órgão emissor do registro de classe": {"origem": "orgao_emissor_conselho", "tipo": "string"},
-                    "107 DC-UF do conselho de classe": {"origem": "uf_conselho", "tipo": "string"},
-                    "108 DD-Data de emissão do registro no conselho": {"origem": "dt_exped_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "109 DE-Data de vencimento do registro no conselho": {"origem": "dt_validade_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "110 DF-Observações gerais": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "observacoes", "_text"], "tipo": "string"},
-                    "111 DG-País de residência no exterior": {"origem": "pais_resid", "tipo": "string"},
-                    "112 DH-Bairro de residência no exterior": {"origem": "bairro_ext", "tipo": "string"},
-                    "113 DI-Endereço de residência no exterior": {"origem": "dsc_lograd_ext", "tipo": "string"},
-                    "114 DJ-Número de residência no exterior": {"origem": "nr_lograd_ext", "tipo": "string"},
-                    "115 DK-Complemento no endereço de residência no exterior": {"origem": "complemento_ext", "tipo": "string"},
-                    "116 DL-Cidade de residência no exterior": {"origem": "nm_cidade_ext", "tipo": "string"},
-                    "117 DM-UF de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "uf", "_text"], "tipo": "string"},
-                    "118 DN-CEP de residência no exterior": {"origem": "cod_postal_ext", "tipo": "string"},
-                    "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
-                    "120 DP-Categoria": {"origem": "cod_categoria", "tipo": "string"},
-                    "121 DQ-Data de desligamento": {"origem": "dt_deslig", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "122 DR-Tipo pessoa origem": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "origem", "_text"], "tipo": "string"},
-                    "123 DS-Tipo pessoa destino": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "destino", "_text"], "tipo": "string"},
-                    "124 DT-Início de validade": {"origem": "dt_adm", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "125 DU-Forma de pagamento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "formaPagamento", "_text"], "tipo": "string"},
-                    "126 DV-Código do banco para pagamento pessoa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "codBanco", "_text"], "tipo": "string"},
-                    "127 DW-Agência sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrAgencia", "_text"], "tipo": "string"},
-                    "128 DX-Dígito da agência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvAgencia", "_text"], "tipo": "string"},
-                    "129 DY-Conta bancária sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrConta", "_text"], "tipo": "string"},
-                    "130 DZ-Dígito da conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvConta", "_text"], "tipo": "string"},
-                    "131 EA-Tipo de conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpConta", "_text"], "tipo": "string"},
-                    "132 EB-Tipo de operação": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpOperacao", "_text"], "tipo": "string"},
-                    "2 B-Código referência": {
-                        "origem": "cnpj_empregador",
-                        "caminho_json_alternativos": [
-                            ["evtAdmissao", "ideEmpregador", "nrInsc", "_text"],
-                            ["evtAltCadastral", "ideEmpregador", "nrInsc", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "3 C-CPF trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "cpfTrab", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "cpfTrab", "_text"],
-                            ["trabalhador", "cpf", "_text"],
-                            ["evtAltCadastral", "ideTrabalhador", "cpfTrab", "_text"],
-                            ["ideTrabalhador", "cpfTrab", "_text"],
-                            ["ideTrabalhador", "cpf", "_text"],
-                            ["cpfTrab", "_text"],
-                            ["cpf", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "4 D-Nome trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "nmTrab", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "nmTrab", "_text"],
-                            ["trabalhador", "nome", "_text"],
-                            ["evtAltCadastral", "alteracao", "dadosTrabalhador", "nmTrab", "_text"],
-                            ["alteracao", "dadosTrabalhador", "nmTrab", "_text"],
-                            ["evtAltContratual", "ideTrabalhador", "nmTrab", "_text"],
-                            ["ideTrabalhador", "nmTrab", "_text"],
-                            ["nome", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "5 E-Data nascimento trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "dtNascto", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "nascimento", "dtNascto", "_text"],
-                            ["trabalhador", "dtNascto", "_text"],
-                            ["nascimento", "dtNascto", "_text"],
-                            ["dtNascto", "_text"],
-                            ["trabalhador", "dataNascimento", "_text"],
-                            ["dataNascimento", "_text"]
-                        ],
-                        "tipo": "data", "formato": "YYYY-MM-DD", "valor_padrao": ""
-                    },
-                    "6 F-Apelido trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
-                    "7 G-Nome social trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
-                    "8 H-Nome mae trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmMae", "_text"], "tipo": "string"},
-                    "9 I-Nome pai trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmPai", "_text"], "tipo": "string"},
-                    "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string", "valores_validos": ["M", "F"]},
-                    "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
-                    "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
-                    "Solteiro3 M-Estado civil do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "estCiv", "_text"], "tipo": "string"},
-                    "76 BXPIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nisTrab", "_text"], "tipo": "string"},
-                    "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
-                    "120 DP-Categoria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "codCateg", "_text"], "tipo": "string"},
-                    "124 DT-Início de validade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoRegimeTrab", "infoCeletista", "dtAdm", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "33 AG-Código do tipo de logradouro": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "tpLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "tpLograd", "_text"],
-                            ["endereco", "brasil", "tpLograd", "_text"],
-                            ["trabalhador", "endereco", "tpLograd", "_text"],
-                            ["endereco", "tpLograd", "_text"],
-                            ["tpLograd", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "34 AH-Endereço do trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "dscLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "dscLograd", "_text"],
-                            ["endereco", "brasil", "dscLograd", "_text"],
-                            ["trabalhador", "endereco", "dscLograd", "_text"],
-                            ["endereco", "dscLograd", "_text"],
-                            ["dscLograd", "_text"],
-                            ["trabalhador", "endereco", "logradouro", "_text"],
-                            ["endereco", "logradouro", "_text"],
-                            ["logradouro", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "35 AI-Número de endereço do trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "nrLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "nrLograd", "_text"],
-                            ["endereco", "brasil", "nrLograd", "_text"],
-                            ["trabalhador", "endereco", "nrLograd", "_text"],
-                            ["endereco", "nrLograd", "_text"],
-                            ["nrLograd", "_text"],
-                            ["trabalhador", "endereco", "numero", "_text"],
-                            ["endereco", "numero", "_text"],
-                            ["numero", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "36 AJ-Complemento do endereço de trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "complemento", "_text"], "tipo": "string"},
-                    "37 AK-CEP do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "cep", "_text"], "tipo": "string"},
-                    "38 AL-Bairro do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "bairro", "_text"], "tipo": "string"},
-                    "39 AM-Código da cidade de residência do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "codMunic", "_text"], "tipo": "string"},
-                    "41 AO-UF de residência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "uf", "_text"], "tipo": "string"},
-                    "43 AQ-Telefone": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "fonePrinc", "_text"], "tipo": "string"},
-                    "45 AS-Email": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "emailPrinc", "_text"], "tipo": "string"},
-                    "78 BZ-Número da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "nrCtps", "_text"], "tipo": "string"},
-                    "79 CA-Série da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "serieCtps", "_text"], "tipo": "string"},
-                    "80 CB-UF da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "ufCtps", "_text"], "tipo": "string"},
-                    "56 BD-Número do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "nrRg", "_text"], "tipo": "string"},
-                    "57 BE-Órgão emissor do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "orgaoEmissor", "_text"], "tipo": "string"},
-                    "58 BF-Data de emissão do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "24 X-UF da cidade de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "uf", "_text"], "tipo": "string"},
-                    "25 Y-Código do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
-                    "27 AA-Código de país de nacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
-                    "111 DG-País de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "paisResid", "_text"], "tipo": "string"},
-                    "112 DH-Bairro de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "bairro", "_text"], "tipo": "string"},
-                    "113 DI-Endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "dscLograd", "_text"], "tipo": "string"},
-                    "114 DJ-Número de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nrLograd", "_text"], "tipo": "string"},
-                    "115 DK-Complemento no endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "complemento", "_text"], "tipo": "string"},
-                    "116 DL-Cidade de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nmCid", "_text"], "tipo": "string"},
-                    "118 DN-CEP de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "codPostal", "_text"], "tipo": "string"},
-                    "14 N-Indicativo de deficiência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
-                    "15 O-Indicativo de deficiência física": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
-                    "16 P-Indicativo de deficiência visual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defVisual", "_text"], "tipo": "string"},
-                    "17 Q-Indicativo de deficiência auditiva": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defAuditiva", "_text"], "tipo": "string"},
-                    "18 R-Indicativo de deficiência mental": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defMental", "_text"], "tipo": "string"},
-                    "19 S-Indicativo de deficiência intelectual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defIntelectual", "_text"], "tipo": "string"},
-                    "20 T-Trabalhador reabilitado ou adaptado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "reabReadap", "_text"], "tipo": "string"},
-                    "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "infoCota", "_text"], "tipo": "string"},
-                    "103 CY-Observações sobre a situação militar": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "observacao", "_text"], "tipo": "string"},
-                    "89 CK-Número da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "nrRegCnh", "_text"], "tipo": "string"},
-                    "90 CL-Categoria da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "categoriaCnh", "_text"], "tipo": "string"},
-                    "91 CM-UF da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "ufCnh", "_text"], "tipo": "string"},
-                    "92 CN-Data de emissão da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtExped", "_text"], "tipo": "string"},
-                    "93 CO-Data de emissão da primeira CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtPriHab", "_text"], "tipo": "string"},
-                    "94 CP-Data de validade da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtValid", "_text"], "tipo": "string"},
-                    "60 BH-Número do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "nrRne", "_text"], "tipo": "string"},
-                    "61 BI-Órgão emissor do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "orgaoEmissor", "_text"], "tipo": "string"},
-                    "63 BK-Data de emissão do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "64 BL-Data da chegada no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "dtChegada", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "65 BM-Classificação estrangeiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "classTrabEstrang", "_text"], "tipo": "string"},
-                    "66 BN-Estrangeiro casado com brasileiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "casadoBr", "_text"], "tipo": "string"},
-                    "67 BO-Estrangeiro com filhos brasileiros": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "filhosBr", "_text"], "tipo": "string"},
-                    # --- INÍCIO CAMPOS EXPANDIDOS S-2200 ---
-                    "cpf_trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
-                    "nis_trabalhador": {"origem": "nis_trabalhador", "tipo": "string"},
-                    "nome_trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "sexo": {"origem": "sexo", "tipo": "string"},
-                    "raca_cor": {"origem": "raca_cor", "tipo": "string"},
-                    "estado_civil": {"origem": "estado_civil", "tipo": "string"},
-                    "grau_instrucao": {"origem": "grau_instrucao", "tipo": "string"},
-                    "data_nascimento": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "nm_mae": {"origem": "nm_mae", "tipo": "string"},
-                    "nm_pai": {"origem": "nm_pai", "tipo": "string"},
-                    "uf_nasc": {"origem": "uf_nasc", "tipo": "string"},
-                    "pais_nasc": {"origem": "pais_nasc", "tipo": "string"},
-                    "pais_nac": {"origem": "pais_nac", "tipo": "string"},
-                    "tp_lograd": {"origem": "tp_lograd", "tipo": "string"},
-                    "dsc_lograd": {"origem": "dsc_lograd", "tipo": "string"},
-                    "nr_lograd": {"origem": "nr_lograd", "tipo": "string"},
-                    "complemento": {"origem": "complemento", "tipo": "string"},
-                    "cep": {"origem": "cep", "tipo": "string"},
-                    "bairro": {"origem": "bairro", "tipo": "string"},
-                    "cod_munic": {"origem": "cod_munic", "tipo": "string"},
-                    "nm_cidade": {"origem": "nm_cidade", "tipo": "string"},
-                    "uf_resid": {"origem": "uf_resid", "tipo": "string"},
-                    "pais_resid": {"origem": "pais_resid", "tipo": "string"},
-                    "bairro_ext": {"origem": "bairro_ext", "tipo": "string"},
-                    "dsc_lograd_ext": {"origem": "dsc_lograd_ext", "tipo": "string"},
-                    "nr_lograd_ext": {"origem": "nr_lograd_ext", "tipo": "string"},
-                    "complemento_ext": {"origem": "complemento_ext", "tipo": "string"},
-                    "nm_cidade_ext": {"origem": "nm_cidade_ext", "tipo": "string"},
-                    "cod_postal_ext": {"origem": "cod_postal_ext", "tipo": "string"},
-                    "fone_princ": {"origem": "fone_princ", "tipo": "string"},
-                    "fone_alt": {"origem": "fone_alt", "tipo": "string"},
-                    "email_princ": {"origem": "email_princ", "tipo": "string"},
-                    "email_alt": {"origem": "email_alt", "tipo": "string"},
-                    "contato_emerg": {"origem": "contato_emerg", "tipo": "string"},
-                    "fone_emerg": {"origem": "fone_emerg", "tipo": "string"},
-                    "parentesco_emerg": {"origem": "parentesco_emerg", "tipo": "string"},
-                    "ctps_numero": {"origem": "ctps_numero", "tipo": "string"},
-                    "ctps_serie": {"origem": "ctps_serie", "tipo": "string"},
-                    "ctps_uf": {"origem": "ctps_uf", "tipo": "string"},
-                    "rg_numero": {"origem": "rg_numero", "tipo": "string"},
-                    "rg_orgao": {"origem": "rg_orgao", "tipo": "string"},
-                    "rg_data": {"origem": "rg_data", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "rg_uf": {"origem": "rg_uf", "tipo": "string"},
-                    "rne_numero": {"origem": "rne_numero", "tipo": "string"},
-                    "rne_orgao": {"origem": "rne_orgao", "tipo": "string"},
-                    "rne_uf": {"origem": "rne_uf", "tipo": "string"},
-                    "cnh_numero": {"origem": "cnh_numero", "tipo": "string"},
-                    "cnh_categoria": {"origem": "cnh_categoria", "tipo": "string"},
-                    "cnh_uf": {"origem": "cnh_uf", "tipo": "string"},
-                    "cnh_data": {"origem": "cnh_data", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cnh_pri_hab": {"origem": "cnh_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cnh_validade": {"origem": "cnh_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "def_fisica": {"origem": "def_fisica", "tipo": "string"},
-                    "def_visual": {"origem": "def_visual", "tipo": "string"},
-                    "def_auditiva": {"origem": "def_auditiva", "tipo": "string"},
-                    "def_mental": {"origem": "def_mental", "tipo": "string"},
-                    "def_intelectual": {"origem": "def_intelectual", "tipo": "string"},
-                    "reab_readap": {"origem": "reab_readap", "tipo": "string"},
-                    "info_cota": {"origem": "info_cota", "tipo": "string"},
-                    "observacao_def": {"origem": "observacao_def", "tipo": "string"},
-                    "dt_chegada": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "class_estrangeiro": {"origem": "class_estrangeiro", "tipo": "string"},
-                    "casado_br": {"origem": "casado_br", "tipo": "string"},
-                    "filhos_br": {"origem": "filhos_br", "tipo": "string"},
-                    "matricula": {"origem": "matricula", "tipo": "string"},
-                    "data_admissao": {"origem": "data_admissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "tipo_admissao": {"origem": "tipo_admissao", "tipo": "string"},
-                    "tipo_regime_jornada": {"origem": "tipo_regime_jornada", "tipo": "string"},
-                    "natureza_atividade": {"origem": "natureza_atividade", "tipo": "string"},
-                    "cnpj_empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "cod_categoria": {"origem": "cod_categoria", "tipo": "string"},
-                    "cod_cargo": {"origem": "cod_cargo", "tipo": "string"},
-                    "cod_funcao": {"origem": "cod_funcao", "tipo": "string"},
-                    "cod_lotacao": {"origem": "cod_lotacao", "tipo": "string"},
-                    "salario_contratual": {"origem": "salario_contratual", "tipo": "decimal"},
-                    "und_sal_fixo": {"origem": "und_sal_fixo", "tipo": "string"},
-                    "tipo_contrato": {"origem": "tipo_contrato", "tipo": "string"},
-                    "duracao_contrato": {"origem": "duracao_contrato", "tipo": "string"},
-                    "passaporte_numero": {"origem": "passaporte_numero", "tipo": "string"},
-                    "passaporte_pais_origem": {"origem": "passaporte_pais_origem", "tipo": "string"},
-                    "passaporte_data_emissao": {"origem": "passaporte_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "passaporte_validade": {"origem": "passaporte_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "ric_numero": {"origem": "ric_numero", "tipo": "string"},
-                    "ric_orgao": {"origem": "ric_orgao", "tipo": "string"},
-                    "ric_uf": {"origem": "ric_uf", "tipo": "string"},
-                    "ric_data_emissao": {"origem": "ric_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "pis_numero": {"origem": "pis_numero", "tipo": "string"},
-                    "pis_data_emissao": {"origem": "pis_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "titulo_eleitor_numero": {"origem": "titulo_eleitor_numero", "tipo": "string"},
-                    "titulo_eleitor_zona": {"origem": "titulo_eleitor_zona", "tipo": "string"},
-                    "titulo_eleitor_secao": {"origem": "titulo_eleitor_secao", "tipo": "string"},
-                    "titulo_eleitor_cod_munic": {"origem": "titulo_eleitor_cod_munic", "tipo": "string"},
-                    "titulo_eleitor_nm_cidade": {"origem": "titulo_eleitor_nm_cidade", "tipo": "string"},
-                    "titulo_eleitor_uf": {"origem": "titulo_eleitor_uf", "tipo": "string"},
-                    "titulo_eleitor_data_emissao": {"origem": "titulo_eleitor_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_numero": {"origem": "cert_militar_numero", "tipo": "string"},
-                    "cert_militar_data_exped": {"origem": "cert_militar_data_exped", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_regiao": {"origem": "cert_militar_regiao", "tipo": "string"},
-                    "cert_militar_tipo": {"origem": "cert_militar_tipo", "tipo": "string"},
-                    "cert_militar_numero2": {"origem": "cert_militar_numero2", "tipo": "string"},
-                    "cert_militar_serie": {"origem": "cert_militar_serie", "tipo": "string"},
-                    "cert_militar_data_exped2": {"origem": "cert_militar_data_exped2", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_categoria": {"origem": "cert_militar_categoria", "tipo": "string"},
-                    "cert_militar_observacoes": {"origem": "cert_militar_observacoes", "tipo": "string"},
-                    "profissao": {"origem": "profissao", "tipo": "string"},
-                    "conselho_numero": {"origem": "conselho_numero", "tipo": "string"},
-                    "conselho_orgao": {"origem": "conselho_orgao", "tipo": "string"},
-                    "conselho_uf": {"origem": "conselho_uf", "tipo": "string"},
-                    "conselho_data_emissao": {"origem": "conselho_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "conselho_data_validade": {"origem": "conselho_data_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "conselho_observacoes": {"origem": "conselho_observacoes", "tipo": "string"},
-                    "banco_forma_pagamento": {"origem": "banco_forma_pagamento", "tipo": "string"},
-                    "banco_codigo": {"origem": "banco_codigo", "tipo": "string"},
-                    "banco_agencia": {"origem": "banco_agencia", "tipo": "string"},
-                    "banco_agencia_dv": {"origem": "banco_agencia_dv", "tipo": "string"},
-                    "banco_conta": {"origem": "banco_conta", "tipo": "string"},
-                    "banco_conta_dv": {"origem": "banco_conta_dv", "tipo": "string"},
-                    "banco_tipo_conta": {"origem": "banco_tipo_conta", "tipo": "string"},
-                    "banco_tipo_operacao": {"origem": "banco_tipo_operacao", "tipo": "string"},
-                    "peso": {"origem": "peso", "tipo": "string"},
-                    "altura": {"origem": "altura", "tipo": "string"},
-                    "tamanho_calca": {"origem": "tamanho_calca", "tipo": "string"},
-                    "tamanho_camisa": {"origem": "tamanho_camisa", "tipo": "string"},
-                    "tamanho_calcado": {"origem": "tamanho_calcado", "tipo": "string"},
-                    "cns_numero": {"origem": "cns_numero", "tipo": "string"},
-                    "observacoes_gerais": {"origem": "observacoes_gerais", "tipo": "string"},
-                    # --- FIM CAMPOS EXPANDIDOS S-2200 ---
-                }
+    Returns:
+        DefinicaoCampo equivalente, com tipo e formato internados e caminhos
+        e valores válidos em tuplas
+    """
+    valores = dict(definicao)
+    for chave in ("tipo", "formato"):
+        if chave in valores:
+            valores[chave] = sys.intern(valores[chave])
+    if "caminho_json" in valores:
+        valores["caminho_json"] = _normalizar_caminho(valores["caminho_json"])
+    if "caminho_json_alternativos" in valores:
+        valores["caminho_json_alternativos"] = tuple(
+            _normalizar_caminho(caminho) for caminho in valores["caminho_json_alternativos"]
+        )
+    if "valores_validos" in valores:
+        valores["valores_validos"] = tuple(valores["valores_validos"])
+    caminhos = valores.get("caminho_json_alternativos", ())
+    if "caminho_json" in valores:
+        caminhos = (valores["caminho_json"],) + caminhos
+    if caminhos:
+        valores["extrator"] = _compilar_extrator(caminhos)
+    return DefinicaoCampo(**valores)
+
+
+def _congelar(valor: Any) -> Any:
+    """
+    Envolve recursivamente os dicionários de um mapeamento em MappingProxyType (somente leitura)
+    
+    Args:
+        valor: Valor do mapeamento (dicionários são congelados, demais valores mantidos)
+        
+    Returns:
+        Visão somente leitura do valor
+    """
+    if isinstance(valor, dict):
+        return MappingProxyType({chave: _congelar(item) for chave, item in valor.items()})
+    return valor
+
+
+# Mapeamentos entre campos eSocial e templates Empresa, por template. Dados estáticos,
+# montados uma única vez na importação do módulo e compartilhados por todas as instâncias
+_MAPEAMENTOS: Dict[str, Dict] = {
+    "01_CONVTRABALHADOR": {
+        "fonte_principal": "esocial_s2200",
+        "fontes_adicionais": ["esocial_s2205", "esocial_s2206"],
+        "campos": {
+            # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "2 B-Código referência": {
+                "origem": "cnpj_empregador",
+                "caminho_json_alternativos": [
+                    ["evtAdmissao", "ideEmpregador", "nrInsc", "_text"],
+                    ["evtAltCadastral", "ideEmpregador", "nrInsc", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
             },
-            
-            "02_CONVCONTRATO": {
-                "fonte_principal": "esocial_s2200",
-                "fontes_adicionais": ["esocial_s2205", "esocial_s2206"],
-                "campos": {
-                    # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "2 B-Código referência": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "3 C-CPF trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
-                    "4 D-Nome trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "5 E-Data nascimento trabalhador": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6 F-Apelido trabalhador": {"origem": "nome_social", "tipo": "string"},
-                    "7 G-Nome social trabalhador": {"origem": "nome_social", "tipo": "string"},
-                    "8 H-Nome mae trabalhador": {"origem": "nm_mae", "tipo": "string"},
-                    "9 I-Nome pai trabalhador": {"origem": "nm_pai", "tipo": "string"},
-                    "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string"},
-                    "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
-                    "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
-                    "13 M-Estado civil do trabalhador": {"origem": "estado_civil", "tipo": "string"},
-                    "14 N-Indicativo de deficiência": {"origem": "def_fisica", "tipo": "string"},
-                    "15 O-Indicativo de deficiência física": {"origem": "def_fisica", "tipo": "string"},
-                    "16 P-Indicativo de deficiência visual": {"origem": "def_visual", "tipo": "string"},
-                    "17 Q-Indicativo de deficiência auditiva": {"origem": "def_auditiva", "tipo": "string"},
-                    "18 R-Indicativo de deficiência mental": {"origem": "def_mental", "tipo": "string"},
-                    "19 S-Indicativo de deficiência intelectual": {"origem": "def_intelectual", "tipo": "string"},
-                    "20 T-Trabalhador reabilitado ou adaptado": {"origem": "reab_readap", "tipo": "string"},
-                    "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "info_cota", "tipo": "string"},
-                    "22 V-Tipo sanguíneo": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tipoSangue", "_text"], "tipo": "string"},
-                    "23 W-Nome da cidade de  nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmCid", "_text"], "tipo": "string"},
-                    "24 X-UF da cidade de nascimento": {"origem": "uf_nasc", "tipo": "string"},
-                    "25 Y-Código do país de nascimento": {"origem": "pais_nasc", "tipo": "string"},
-                    "26 Z-Nome do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
-                    "27 AA-Código de país de nacionalidade": {"origem": "pais_nac", "tipo": "string"},
-                    "28 AB-Nome do país denacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
-                    "29 AC-Código RAIS do país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "codRais", "_text"], "tipo": "string"},
-                    "30 AD-É aposentado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "aposentado", "_text"], "tipo": "string"},
-                    "31 AE-Data de aposentaria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "dtAposent", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "32 AF-Reside no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "residePais", "_text"], "tipo": "string"},
-                    "33 AG-Código do tipo de logradouro": {"origem": "tp_lograd", "tipo": "string"},
-                    "34 AH-Endereço do trabalhador": {"origem": "dsc_lograd", "tipo": "string"},
-                    "35 AI-Número de endereço do trabalhador": {"origem": "nr_lograd", "tipo": "string"},
-                    "36 AJ-Complemento do endereço de trabalhador": {"origem": "complemento", "tipo": "string"},
-                    "37 AK-CEP do trabalhador": {"origem": "cep", "tipo": "string"},
-                    "38 AL-Bairro do trabalhador": {"origem": "bairro", "tipo": "string"},
-                    "39 AM-Código da cidade de residência do trabalhador": {"origem": "cod_munic", "tipo": "string"},
-                    "40 NA-Nome da cidade de residência do trabalhador": {"origem": "nm_cidade", "tipo": "string"},
-                    "41 AO-UF de residência": {"origem": "uf_resid", "tipo": "string"},
-                    "42 AP-Referência do endereço do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "referencia", "_text"], "tipo": "string"},
-                    "43 AQ-Telefone": {"origem": "fone_princ", "tipo": "string"},
-                    "44 AR-Telefone 2": {"origem": "fone_alt", "tipo": "string"},
-                    "45 AS-Email": {"origem": "email_princ", "tipo": "string"},
-                    "46 AT-Email alternativo": {"origem": "email_alt", "tipo": "string"},
-                    "47 AU-Contato de emergência": {"origem": "contato_emerg", "tipo": "string"},
-                    "48 AV-Telefone do contato de emergência": {"origem": "fone_emerg", "tipo": "string"},
-                    "49 AW-Parentesco do contato para emergência": {"origem": "parentesco_emerg", "tipo": "string"},
-                    "50 AX-Peso": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "peso", "_text"], "tipo": "string"},
-                    "51 AY-Altura": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "altura", "_text"], "tipo": "string"},
-                    "52 AZ-Calça": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalca", "_text"], "tipo": "string"},
-                    "53 BA-Camisa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCamisa", "_text"], "tipo": "string"},
-                    "54 BB-Calçado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalcado", "_text"], "tipo": "string"},
-                    "55 BC-Número do CNS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cns", "nrCns", "_text"], "tipo": "string"},
-                    "56 BD-Número do RG": {"origem": "nr_rg", "tipo": "string"},
-                    "57 BE-Órgão emissor do RG": {"origem": "orgao_emissor_rg", "tipo": "string"},
-                    "58 BF-Data de emissão do RG": {"origem": "dt_exped_rg", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "59 BG-UF de emissão do RG": {"origem": "uf_rg", "tipo": "string"},
-                    "60 BH-Número do RNE": {"origem": "nr_rne", "tipo": "string"},
-                    "61 BI-Órgão emissor do RNE": {"origem": "orgao_emissor_rne", "tipo": "string"},
-                    "62 BJ-UF de emissão do RNE": {"origem": "uf_rne", "tipo": "string"},
-                    "63 BK-Data de emissão do RNE": {"origem": "dt_exped_rne", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "64 BL-Data da chegada no país": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "65 BM-Classificação estrangeiro": {"origem": "class_trab_estrang", "tipo": "string"},
-                    "66 BN-Estrangeiro casado com brasileiro": {"origem": "casado_br", "tipo": "string"},
-                    "67 BO-Estrangeiro com filhos brasileiros": {"origem": "filhos_br", "tipo": "string"},
-                    "68 BP-Número do passaporte": {"origem": "nr_passaporte", "tipo": "string"},
-                    "69 BQ-País de origem do passaporte": {"origem": "pais_origem_passaporte", "tipo": "string"},
-                    "70 BR-Data de emissão do passaporte": {"origem": "dt_exped_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "71 BS-Data de validade do passaporte": {"origem": "dt_valid_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "72 BT-Número do RIC": {"origem": "nr_ric", "tipo": "string"},
-                    "73 BU-Órgão emissor do RIC": {"origem": "orgao_emissor_ric", "tipo": "string"},
-                    "74 BV-UF de emissão do RIC": {"origem": "uf_ric", "tipo": "string"},
-                    "75 BW-Data de emissão do RIC": {"origem": "dt_exped_ric", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "76 BXPIS": {"origem": "nis_trabalhador", "tipo": "string"},
-                    "77 BY-Data de emissão do PIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "pis", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "78 BZ-Número da CTPS": {"origem": "nr_ctps", "tipo": "string"},
-                    "79 CA-Série da CTPS": {"origem": "serie_ctps", "tipo": "string"},
-                    "80 CB-UF da CTPS": {"origem": "uf_ctps", "tipo": "string"},
-                    "81 CC-Data de emissão da CTPS": {"origem": "dt_exped_ctps", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "82 CD-Número do título de eleitor": {"origem": "nr_titulo", "tipo": "string"},
-                    "83 CE-Zona do título de eleitor": {"origem": "zona_titulo", "tipo": "string"},
-                    "84 CF-Seção do título de eleitor": {"origem": "secao_titulo", "tipo": "string"},
-                    "85 CG-Código da cidade do título de eleitor": {"origem": "cod_munic_titulo", "tipo": "string"},
-                    "86 CH-Nome da cidade do título de eleitor": {"origem": "nm_cidade_titulo", "tipo": "string"},
-                    "87 CI-UF do título de eleitor": {"origem": "uf_titulo", "tipo": "string"},
-                    "88 CJ-Data de emissão do título de eleitor": {"origem": "dt_exped_titulo", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "89 CK-Número da CNH": {"origem": "nr_reg_cnh", "tipo": "string"},
-                    "90 CL-Categoria da CNH": {"origem": "categoria_cnh", "tipo": "string"},
-                    "91 CM-UF da CNH": {"origem": "uf_cnh", "tipo": "string"},
-                    "92 CN-Data de emissão da CNH": {"origem": "dt_exped_cnh", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "93 CO-Data de emissão da primeira CNH": {"origem": "dt_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "94 CP-Data de validade da CNH": {"origem": "dt_valid_cnh", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "95 CQ-Número do certificado de alistamento militar": {"origem": "nr_certidao", "tipo": "string"},
-                    "96 CR-Data de expedição da CAM": {"origem": "dt_exped_certidao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "97 CS-Região militar": {"origem": "regiao_militar", "tipo": "string"},
-                    "98 CT-Tipo de certificado militar": {"origem": "tipo_certidao", "tipo": "string"},
-                    "99 CU-Número do certificado militar": {"origem": "nr_certidao2", "tipo": "string"},
-                    "100 CV-Número de série do certificado militar": {"origem": "nr_serie", "tipo": "string"},
-                    "101 CW-Data de expedição do certificado militar": {"origem": "dt_exped_certidao2", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "102 CX-Categoria do certificado militar": {"origem": "categoria_certidao", "tipo": "string"},
-                    "103 CY-Observações sobre a situação militar": {"origem": "observacao_def", "tipo": "string"},
-                    "104 CZ-Profissão": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "profissao", "_text"], "tipo": "string"},
-                    "105 DA-Número de registro no conselho de classe": {"origem": "nr_registro_conselho", "tipo": "string"},
-                    "106 DB-Órgão emissor do registro de classe": {"origem": "orgao_emissor_conselho", "tipo": "string"},
-                    "107 DC-UF do conselho de classe": {"origem": "uf_conselho", "tipo": "string"},
-                    "108 DD-Data de emissão do registro no conselho": {"origem": "dt_exped_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "109 DE-Data de vencimento do registro no conselho": {"origem": "dt_validade_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "110 DF-Observações gerais": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "observacoes", "_text"], "tipo": "string"},
-                    "111 DG-País de residência no exterior": {"origem": "pais_resid", "tipo": "string"},
-                    "112 DH-Bairro de residência no exterior": {"origem": "bairro_ext", "tipo": "string"},
-                    "113 DI-Endereço de residência no exterior": {"origem": "dsc_lograd_ext", "tipo": "string"},
-                    "114 DJ-Número de residência no exterior": {"origem": "nr_lograd_ext", "tipo": "string"},
-                    "115 DK-Complemento no endereço de residência no exterior": {"origem": "complemento_ext", "tipo": "string"},
-                    "116 DL-Cidade de residência no exterior": {"origem": "nm_cidade_ext", "tipo": "string"},
-                    "117 DM-UF de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "uf", "_text"], "tipo": "string"},
-                    "118 DN-CEP de residência no exterior": {"origem": "cod_postal_ext", "tipo": "string"},
-                    "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
-                    "120 DP-Categoria": {"origem": "cod_categoria", "tipo": "string"},
-                    "121 DQ-Data de desligamento": {"origem": "dt_deslig", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "122 DR-Tipo pessoa origem": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "origem", "_text"], "tipo": "string"},
-                    "123 DS-Tipo pessoa destino": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "destino", "_text"], "tipo": "string"},
-                    "124 DT-Início de validade": {"origem": "dt_adm", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "125 DU-Forma de pagamento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "formaPagamento", "_text"], "tipo": "string"},
-                    "126 DV-Código do banco para pagamento pessoa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "codBanco", "_text"], "tipo": "string"},
-                    "127 DW-Agência sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrAgencia", "_text"], "tipo": "string"},
-                    "128 DX-Dígito da agência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvAgencia", "_text"], "tipo": "string"},
-                    "129 DY-Conta bancária sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrConta", "_text"], "tipo": "string"},
-                    "130 DZ-Dígito da conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvConta", "_text"], "tipo": "string"},
-                    "131 EA-Tipo de conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpConta", "_text"], "tipo": "string"},
-                    "132 EB-Tipo de operação": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpOperacao", "_text"], "tipo": "string"},
-                    "2 B-Código referência": {
-                        "origem": "cnpj_empregador",
-                        "caminho_json_alternativos": [
-                            ["evtAdmissao", "ideEmpregador", "nrInsc", "_text"],
-                            ["evtAltCadastral", "ideEmpregador", "nrInsc", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "3 C-CPF trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "cpfTrab", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "cpfTrab", "_text"],
-                            ["trabalhador", "cpf", "_text"],
-                            ["evtAltCadastral", "ideTrabalhador", "cpfTrab", "_text"],
-                            ["ideTrabalhador", "cpfTrab", "_text"],
-                            ["ideTrabalhador", "cpf", "_text"],
-                            ["cpfTrab", "_text"],
-                            ["cpf", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "4 D-Nome trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "nmTrab", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "nmTrab", "_text"],
-                            ["trabalhador", "nome", "_text"],
-                            ["evtAltCadastral", "alteracao", "dadosTrabalhador", "nmTrab", "_text"],
-                            ["alteracao", "dadosTrabalhador", "nmTrab", "_text"],
-                            ["evtAltContratual", "ideTrabalhador", "nmTrab", "_text"],
-                            ["ideTrabalhador", "nmTrab", "_text"],
-                            ["nome", "_text"]
-                        ],
-                        "tipo": "string", "obrigatorio": True, "valor_padrao": ""
-                    },
-                    "5 E-Data nascimento trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "dtNascto", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "nascimento", "dtNascto", "_text"],
-                            ["trabalhador", "dtNascto", "_text"],
-                            ["nascimento", "dtNascto", "_text"],
-                            ["dtNascto", "_text"],
-                            ["trabalhador", "dataNascimento", "_text"],
-                            ["dataNascimento", "_text"]
-                        ],
-                        "tipo": "data", "formato": "YYYY-MM-DD", "valor_padrao": ""
-                    },
-                    "6 F-Apelido trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
-                    "7 G-Nome social trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
-                    "8 H-Nome mae trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmMae", "_text"], "tipo": "string"},
-                    "9 I-Nome pai trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmPai", "_text"], "tipo": "string"},
-                    "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string", "valores_validos": ["M", "F"]},
-                    "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
-                    "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
-                    "Solteiro3 M-Estado civil do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "estCiv", "_text"], "tipo": "string"},
-                    "76 BXPIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nisTrab", "_text"], "tipo": "string"},
-                    "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
-                    "120 DP-Categoria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "codCateg", "_text"], "tipo": "string"},
-                    "124 DT-Início de validade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoRegimeTrab", "infoCeletista", "dtAdm", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "33 AG-Código do tipo de logradouro": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "tpLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "tpLograd", "_text"],
-                            ["endereco", "brasil", "tpLograd", "_text"],
-                            ["trabalhador", "endereco", "tpLograd", "_text"],
-                            ["endereco", "tpLograd", "_text"],
-                            ["tpLograd", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "34 AH-Endereço do trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "dscLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "dscLograd", "_text"],
-                            ["endereco", "brasil", "dscLograd", "_text"],
-                            ["trabalhador", "endereco", "dscLograd", "_text"],
-                            ["endereco", "dscLograd", "_text"],
-                            ["dscLograd", "_text"],
-                            ["trabalhador", "endereco", "logradouro", "_text"],
-                            ["endereco", "logradouro", "_text"],
-                            ["logradouro", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "35 AI-Número de endereço do trabalhador": {
-                        "origem": "json_data",
-                        "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "nrLograd", "_text"],
-                        "caminho_json_alternativos": [
-                            ["trabalhador", "endereco", "brasil", "nrLograd", "_text"],
-                            ["endereco", "brasil", "nrLograd", "_text"],
-                            ["trabalhador", "endereco", "nrLograd", "_text"],
-                            ["endereco", "nrLograd", "_text"],
-                            ["nrLograd", "_text"],
-                            ["trabalhador", "endereco", "numero", "_text"],
-                            ["endereco", "numero", "_text"],
-                            ["numero", "_text"]
-                        ],
-                        "tipo": "string", "valor_padrao": ""
-                    },
-                    "36 AJ-Complemento do endereço de trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "complemento", "_text"], "tipo": "string"},
-                    "37 AK-CEP do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "cep", "_text"], "tipo": "string"},
-                    "38 AL-Bairro do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "bairro", "_text"], "tipo": "string"},
-                    "39 AM-Código da cidade de residência do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "codMunic", "_text"], "tipo": "string"},
-                    "41 AO-UF de residência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "uf", "_text"], "tipo": "string"},
-                    "43 AQ-Telefone": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "fonePrinc", "_text"], "tipo": "string"},
-                    "45 AS-Email": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "emailPrinc", "_text"], "tipo": "string"},
-                    "78 BZ-Número da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "nrCtps", "_text"], "tipo": "string"},
-                    "79 CA-Série da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "serieCtps", "_text"], "tipo": "string"},
-                    "80 CB-UF da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "ufCtps", "_text"], "tipo": "string"},
-                    "56 BD-Número do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "nrRg", "_text"], "tipo": "string"},
-                    "57 BE-Órgão emissor do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "orgaoEmissor", "_text"], "tipo": "string"},
-                    "58 BF-Data de emissão do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "24 X-UF da cidade de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "uf", "_text"], "tipo": "string"},
-                    "25 Y-Código do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
-                    "27 AA-Código de país de nacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
-                    "111 DG-País de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "paisResid", "_text"], "tipo": "string"},
-                    "112 DH-Bairro de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "bairro", "_text"], "tipo": "string"},
-                    "113 DI-Endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "dscLograd", "_text"], "tipo": "string"},
-                    "114 DJ-Número de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nrLograd", "_text"], "tipo": "string"},
-                    "115 DK-Complemento no endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "complemento", "_text"], "tipo": "string"},
-                    "116 DL-Cidade de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nmCid", "_text"], "tipo": "string"},
-                    "118 DN-CEP de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "codPostal", "_text"], "tipo": "string"},
-                    "14 N-Indicativo de deficiência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
-                    "15 O-Indicativo de deficiência física": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
-                    "16 P-Indicativo de deficiência visual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defVisual", "_text"], "tipo": "string"},
-                    "17 Q-Indicativo de deficiência auditiva": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defAuditiva", "_text"], "tipo": "string"},
-                    "18 R-Indicativo de deficiência mental": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defMental", "_text"], "tipo": "string"},
-                    "19 S-Indicativo de deficiência intelectual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defIntelectual", "_text"], "tipo": "string"},
-                    "20 T-Trabalhador reabilitado ou adaptado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "reabReadap", "_text"], "tipo": "string"},
-                    "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "infoCota", "_text"], "tipo": "string"},
-                    "103 CY-Observações sobre a situação militar": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "observacao", "_text"], "tipo": "string"},
-                    "89 CK-Número da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "nrRegCnh", "_text"], "tipo": "string"},
-                    "90 CL-Categoria da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "categoriaCnh", "_text"], "tipo": "string"},
-                    "91 CM-UF da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "ufCnh", "_text"], "tipo": "string"},
-                    "92 CN-Data de emissão da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtExped", "_text"], "tipo": "string"},
-                    "93 CO-Data de emissão da primeira CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtPriHab", "_text"], "tipo": "string"},
-                    "94 CP-Data de validade da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtValid", "_text"], "tipo": "string"},
-                    "60 BH-Número do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "nrRne", "_text"], "tipo": "string"},
-                    "61 BI-Órgão emissor do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "orgaoEmissor", "_text"], "tipo": "string"},
-                    "63 BK-Data de emissão do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "64 BL-Data da chegada no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "dtChegada", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "65 BM-Classificação estrangeiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "classTrabEstrang", "_text"], "tipo": "string"},
-                    "66 BN-Estrangeiro casado com brasileiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "casadoBr", "_text"], "tipo": "string"},
-                    "67 BO-Estrangeiro com filhos brasileiros": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "filhosBr", "_text"], "tipo": "string"},
-                    # --- INÍCIO CAMPOS EXPANDIDOS S-2200 ---
-                    "cpf_trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
-                    "nis_trabalhador": {"origem": "nis_trabalhador", "tipo": "string"},
-                    "nome_trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "sexo": {"origem": "sexo", "tipo": "string"},
-                    "raca_cor": {"origem": "raca_cor", "tipo": "string"},
-                    "estado_civil": {"origem": "estado_civil", "tipo": "string"},
-                    "grau_instrucao": {"origem": "grau_instrucao", "tipo": "string"},
-                    "data_nascimento": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "nm_mae": {"origem": "nm_mae", "tipo": "string"},
-                    "nm_pai": {"origem": "nm_pai", "tipo": "string"},
-                    "uf_nasc": {"origem": "uf_nasc", "tipo": "string"},
-                    "pais_nasc": {"origem": "pais_nasc", "tipo": "string"},
-                    "pais_nac": {"origem": "pais_nac", "tipo": "string"},
-                    "tp_lograd": {"origem": "tp_lograd", "tipo": "string"},
-                    "dsc_lograd": {"origem": "dsc_lograd", "tipo": "string"},
-                    "nr_lograd": {"origem": "nr_lograd", "tipo": "string"},
-                    "complemento": {"origem": "complemento", "tipo": "string"},
-                    "cep": {"origem": "cep", "tipo": "string"},
-                    "bairro": {"origem": "bairro", "tipo": "string"},
-                    "cod_munic": {"origem": "cod_munic", "tipo": "string"},
-                    "nm_cidade": {"origem": "nm_cidade", "tipo": "string"},
-                    "uf_resid": {"origem": "uf_resid", "tipo": "string"},
-                    "pais_resid": {"origem": "pais_resid", "tipo": "string"},
-                    "bairro_ext": {"origem": "bairro_ext", "tipo": "string"},
-                    "dsc_lograd_ext": {"origem": "dsc_lograd_ext", "tipo": "string"},
-                    "nr_lograd_ext": {"origem": "nr_lograd_ext", "tipo": "string"},
-                    "complemento_ext": {"origem": "complemento_ext", "tipo": "string"},
-                    "nm_cidade_ext": {"origem": "nm_cidade_ext", "tipo": "string"},
-                    "cod_postal_ext": {"origem": "cod_postal_ext", "tipo": "string"},
-                    "fone_princ": {"origem": "fone_princ", "tipo": "string"},
-                    "fone_alt": {"origem": "fone_alt", "tipo": "string"},
-                    "email_princ": {"origem": "email_princ", "tipo": "string"},
-                    "email_alt": {"origem": "email_alt", "tipo": "string"},
-                    "contato_emerg": {"origem": "contato_emerg", "tipo": "string"},
-                    "fone_emerg": {"origem": "fone_emerg", "tipo": "string"},
-                    "parentesco_emerg": {"origem": "parentesco_emerg", "tipo": "string"},
-                    "ctps_numero": {"origem": "ctps_numero", "tipo": "string"},
-                    "ctps_serie": {"origem": "ctps_serie", "tipo": "string"},
-                    "ctps_uf": {"origem": "ctps_uf", "tipo": "string"},
-                    "rg_numero": {"origem": "rg_numero", "tipo": "string"},
-                    "rg_orgao": {"origem": "rg_orgao", "tipo": "string"},
-                    "rg_data": {"origem": "rg_data", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "rg_uf": {"origem": "rg_uf", "tipo": "string"},
-                    "rne_numero": {"origem": "rne_numero", "tipo": "string"},
-                    "rne_orgao": {"origem": "rne_orgao", "tipo": "string"},
-                    "rne_uf": {"origem": "rne_uf", "tipo": "string"},
-                    "cnh_numero": {"origem": "cnh_numero", "tipo": "string"},
-                    "cnh_categoria": {"origem": "cnh_categoria", "tipo": "string"},
-                    "cnh_uf": {"origem": "cnh_uf", "tipo": "string"},
-                    "cnh_data": {"origem": "cnh_data", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cnh_pri_hab": {"origem": "cnh_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cnh_validade": {"origem": "cnh_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "def_fisica": {"origem": "def_fisica", "tipo": "string"},
-                    "def_visual": {"origem": "def_visual", "tipo": "string"},
-                    "def_auditiva": {"origem": "def_auditiva", "tipo": "string"},
-                    "def_mental": {"origem": "def_mental", "tipo": "string"},
-                    "def_intelectual": {"origem": "def_intelectual", "tipo": "string"},
-                    "reab_readap": {"origem": "reab_readap", "tipo": "string"},
-                    "info_cota": {"origem": "info_cota", "tipo": "string"},
-                    "observacao_def": {"origem": "observacao_def", "tipo": "string"},
-                    "dt_chegada": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "class_estrangeiro": {"origem": "class_estrangeiro", "tipo": "string"},
-                    "casado_br": {"origem": "casado_br", "tipo": "string"},
-                    "filhos_br": {"origem": "filhos_br", "tipo": "string"},
-                    "matricula": {"origem": "matricula", "tipo": "string"},
-                    "data_admissao": {"origem": "data_admissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "tipo_admissao": {"origem": "tipo_admissao", "tipo": "string"},
-                    "tipo_regime_jornada": {"origem": "tipo_regime_jornada", "tipo": "string"},
-                    "natureza_atividade": {"origem": "natureza_atividade", "tipo": "string"},
-                    "cnpj_empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "cod_categoria": {"origem": "cod_categoria", "tipo": "string"},
-                    "cod_cargo": {"origem": "cod_cargo", "tipo": "string"},
-                    "cod_funcao": {"origem": "cod_funcao", "tipo": "string"},
-                    "cod_lotacao": {"origem": "cod_lotacao", "tipo": "string"},
-                    "salario_contratual": {"origem": "salario_contratual", "tipo": "decimal"},
-                    "und_sal_fixo": {"origem": "und_sal_fixo", "tipo": "string"},
-                    "tipo_contrato": {"origem": "tipo_contrato", "tipo": "string"},
-                    "duracao_contrato": {"origem": "duracao_contrato", "tipo": "string"},
-                    "passaporte_numero": {"origem": "passaporte_numero", "tipo": "string"},
-                    "passaporte_pais_origem": {"origem": "passaporte_pais_origem", "tipo": "string"},
-                    "passaporte_data_emissao": {"origem": "passaporte_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "passaporte_validade": {"origem": "passaporte_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "ric_numero": {"origem": "ric_numero", "tipo": "string"},
-                    "ric_orgao": {"origem": "ric_orgao", "tipo": "string"},
-                    "ric_uf": {"origem": "ric_uf", "tipo": "string"},
-                    "ric_data_emissao": {"origem": "ric_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "pis_numero": {"origem": "pis_numero", "tipo": "string"},
-                    "pis_data_emissao": {"origem": "pis_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "titulo_eleitor_numero": {"origem": "titulo_eleitor_numero", "tipo": "string"},
-                    "titulo_eleitor_zona": {"origem": "titulo_eleitor_zona", "tipo": "string"},
-                    "titulo_eleitor_secao": {"origem": "titulo_eleitor_secao", "tipo": "string"},
-                    "titulo_eleitor_cod_munic": {"origem": "titulo_eleitor_cod_munic", "tipo": "string"},
-                    "titulo_eleitor_nm_cidade": {"origem": "titulo_eleitor_nm_cidade", "tipo": "string"},
-                    "titulo_eleitor_uf": {"origem": "titulo_eleitor_uf", "tipo": "string"},
-                    "titulo_eleitor_data_emissao": {"origem": "titulo_eleitor_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_numero": {"origem": "cert_militar_numero", "tipo": "string"},
-                    "cert_militar_data_exped": {"origem": "cert_militar_data_exped", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_regiao": {"origem": "cert_militar_regiao", "tipo": "string"},
-                    "cert_militar_tipo": {"origem": "cert_militar_tipo", "tipo": "string"},
-                    "cert_militar_numero2": {"origem": "cert_militar_numero2", "tipo": "string"},
-                    "cert_militar_serie": {"origem": "cert_militar_serie", "tipo": "string"},
-                    "cert_militar_data_exped2": {"origem": "cert_militar_data_exped2", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "cert_militar_categoria": {"origem": "cert_militar_categoria", "tipo": "string"},
-                    "cert_militar_observacoes": {"origem": "cert_militar_observacoes", "tipo": "string"},
-                    "profissao": {"origem": "profissao", "tipo": "string"},
-                    "conselho_numero": {"origem": "conselho_numero", "tipo": "string"},
-                    "conselho_orgao": {"origem": "conselho_orgao", "tipo": "string"},
-                    "conselho_uf": {"origem": "conselho_uf", "tipo": "string"},
-                    "conselho_data_emissao": {"origem": "conselho_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "conselho_data_validade": {"origem": "conselho_data_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "conselho_observacoes": {"origem": "conselho_observacoes", "tipo": "string"},
-                    "banco_forma_pagamento": {"origem": "banco_forma_pagamento", "tipo": "string"},
-                    "banco_codigo": {"origem": "banco_codigo", "tipo": "string"},
-                    "banco_agencia": {"origem": "banco_agencia", "tipo": "string"},
-                    "banco_agencia_dv": {"origem": "banco_agencia_dv", "tipo": "string"},
-                    "banco_conta": {"origem": "banco_conta", "tipo": "string"},
-                    "banco_conta_dv": {"origem": "banco_conta_dv", "tipo": "string"},
-                    "banco_tipo_conta": {"origem": "banco_tipo_conta", "tipo": "string"},
-                    "banco_tipo_operacao": {"origem": "banco_tipo_operacao", "tipo": "string"},
-                    "peso": {"origem": "peso", "tipo": "string"},
-                    "altura": {"origem": "altura", "tipo": "string"},
-                    "tamanho_calca": {"origem": "tamanho_calca", "tipo": "string"},
-                    "tamanho_camisa": {"origem": "tamanho_camisa", "tipo": "string"},
-                    "tamanho_calcado": {"origem": "tamanho_calcado", "tipo": "string"},
-                    "cns_numero": {"origem": "cns_numero", "tipo": "string"},
-                    "observacoes_gerais": {"origem": "observacoes_gerais", "tipo": "string"},
-                    # --- FIM CAMPOS EXPANDIDOS S-2200 ---
-                }
+            "3 C-CPF trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "cpfTrab", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "cpfTrab", "_text"],
+                    ["trabalhador", "cpf", "_text"],
+                    ["evtAltCadastral", "ideTrabalhador", "cpfTrab", "_text"],
+                    ["ideTrabalhador", "cpfTrab", "_text"],
+                    ["ideTrabalhador", "cpf", "_text"],
+                    ["cpfTrab", "_text"],
+                    ["cpf", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
             },
-            
-            "03_CONVCONTRATOALT": {
-                "fonte_principal": "esocial_s2205",
-                "fontes_adicionais": ["esocial_s2206"],
-                "campos": {
-                    # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "2 B-Nome do trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "3 C -Código do contrato": {"origem": "matricula", "tipo": "string"},
-                    "4 D-Tipo de transferência": {"origem": "json_data", "caminho_json": ["altContratual", "tpRegJor", "_text"], "tipo": "string"},
-                    "5 E-Data da alteração": {"origem": "json_data", "caminho_json": ["alteracao", "dtAlteracao", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6 F-Alteração registrada em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
-                    "7 G-ID do novo empregador": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "codCateg", "_text"], "tipo": "string"},
-                    "8 H-Código do novo estabelecimento": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "localTrabalho", "localTrabGeral", "nrInsc", "_text"], "tipo": "string"},
-                    "9 I-Código do novo departamento": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "localTrabalho", "localTrabGeral", "descComp", "_text"], "tipo": "string"},
-                    "10 J-Código do novo cargo": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "codCargo", "_text"], "tipo": "string"},
-                    "11 K-Valor do novo salário": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "remuneracao", "vrSalFx", "_text"], "tipo": "decimal"},
-                    "12 L-Tipo do novo salário": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "remuneracao", "undSalFixo", "_text"], "tipo": "string"},
-                    "13 M-Código do motivo de reajuste": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "motivoReajuste", "_text"], "tipo": "string"},
-                    "14 N-Código da nova jornada de trabalho": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "horContratual", "tpJornada", "_text"], "tipo": "string"},
-                    "15 O-Código do novo sindicato": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "sindicato", "cnpjSindicato", "_text"], "tipo": "string"}
-                }
+            "4 D-Nome trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "nmTrab", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "nmTrab", "_text"],
+                    ["trabalhador", "nome", "_text"],
+                    ["evtAltCadastral", "alteracao", "dadosTrabalhador", "nmTrab", "_text"],
+                    ["alteracao", "dadosTrabalhador", "nmTrab", "_text"],
+                    ["evtAltContratual", "ideTrabalhador", "nmTrab", "_text"],
+                    ["ideTrabalhador", "nmTrab", "_text"],
+                    ["nome", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
             },
-            "04_CONVDEPENDENTE": {
-                "fonte_principal": "esocial_dependentes",
-                "fontes_adicionais": [],
-                "campos": {
-                    "1 A-ID do empregador": {
-                        "origem": "cnpj_empregador",
-                        "tipo": "string", 
-                        "obrigatorio": True, 
-                        "valor_padrao": ""
-                    },
-                    "2 B  - Código do trabalhador": {
-                        "origem": "cpf_trabalhador",
-                        "tipo": "string", 
-                        "obrigatorio": True, 
-                        "valor_padrao": ""
-                    },
-                    "3 C  - Código do tipo de dependente": {
-                        "origem": "tipo_dependente",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "4 D  - Código do dependente": {
-                        "origem": "cpf_dependente",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "5 E  - Nome do dependente": {
-                        "origem": "nome_dependente",
-                        "tipo": "string", 
-                        "obrigatorio": True, 
-                        "valor_padrao": ""
-                    },
-                    "6 F  - Início da vigência": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtIniVig", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "7 G  - Término da vigência": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtFimVig", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "8 H  - Sexo do dependente": {
-                        "origem": "sexo_dependente",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "9 I  - Data de nascimento do dependente": {
-                        "origem": "data_nascimento",
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "10 J  - Nome da mãe": {
-                        "origem": "json_data",
-                        "caminho_json": ["nmMae", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "11 K  - CPF do dependente": {
-                        "origem": "cpf_dependente",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "12 L  - Paga salário família": {
-                        "origem": "dep_sf",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "13 M  - Data de baixa do salário  família": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtBaixaSF", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "14 N  - Dependente para IRRF": {
-                        "origem": "dep_irrf",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "15 O  - Data de baixa de dependente para IRRF": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtBaixaIRRF", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "16 P  - Filho deficiente recebe salário família": {
-                        "origem": "json_data",
-                        "caminho_json": ["defSF", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "17 Q  - Código da cidade de nascimento": {
-                        "origem": "json_data",
-                        "caminho_json": ["codMunic", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "18 R  - Número da certidão de nascimento do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["numCert", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "19 S  - Nome do cartório de registro": {
-                        "origem": "json_data",
-                        "caminho_json": ["nmCartorio", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "20 T  - Número de registro": {
-                        "origem": "json_data",
-                        "caminho_json": ["numReg", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "21 U  - Número no livro de registro": {
-                        "origem": "json_data",
-                        "caminho_json": ["numLivro", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "22 V  - Número na folha de registro": {
-                        "origem": "json_data",
-                        "caminho_json": ["numFolha", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "23 W  - Data de registro em cartório": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtRegCartorio", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "24 X  - Data de entrega do documento": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtEntDoc", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "25 Y  - Endereço do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["endDep", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "26 Z  - Número de endereço": {
-                        "origem": "json_data",
-                        "caminho_json": ["numEnd", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "27 AA  - Bairro": {
-                        "origem": "json_data",
-                        "caminho_json": ["bairro", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "28 AB  - Código da cidade": {
-                        "origem": "json_data",
-                        "caminho_json": ["codMunic", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "29 AC  - CEP do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["cep", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "30 AD  - Telefone 1 do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["fone1", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "31 AE  - Telefone 2 do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["fone2", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "32 AF  - Observações": {
-                        "origem": "descr_dep",
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "33 AG  - Data de registro": {
-                        "origem": "json_data",
-                        "caminho_json": ["dtRegistro", "_text"],
-                        "tipo": "data", 
-                        "formato": "YYYY-MM-DD", 
-                        "valor_padrao": ""
-                    },
-                    "34 AH  - Número do cartão nacional de saúde": {
-                        "origem": "json_data",
-                        "caminho_json": ["numCNS", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "35 AI  - Número da declaração de nascimento vivo": {
-                        "origem": "json_data",
-                        "caminho_json": ["numDNV", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "36 AJ  - Número do RG do dependente": {
-                        "origem": "json_data",
-                        "caminho_json": ["numRG", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "37 AK  - Origem": {
-                        "origem": "json_data",
-                        "caminho_json": ["origem", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    },
-                    "38 AL  - Destino": {
-                        "origem": "json_data",
-                        "caminho_json": ["destino", "_text"],
-                        "tipo": "string", 
-                        "valor_padrao": ""
-                    }
-                }
+            "5 E-Data nascimento trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "dtNascto", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "nascimento", "dtNascto", "_text"],
+                    ["trabalhador", "dtNascto", "_text"],
+                    ["nascimento", "dtNascto", "_text"],
+                    ["dtNascto", "_text"],
+                    ["trabalhador", "dataNascimento", "_text"],
+                    ["dataNascimento", "_text"]
+                ],
+                "tipo": "data", "formato": "YYYY-MM-DD", "valor_padrao": ""
             },
-            "05_FERIAS": {
-                "fonte_principal": "esocial_s2230",
-                "filtros": {"tipo_afastamento": "ferias"},
-                "campos": {
-                    "1 A-ID do empregador": {
-                        "origem": "cnpj_empregador",
-                        "caminho_json": ["evtAfastTemp", "ideEmpregador", "nrInsc", "_text"],
-                        "tipo": "string",
-                        "obrigatorio": True
-                    },
-                    "2 B-CPF trabalhador": {
-                        "origem": "cpf_trabalhador",
-                        "caminho_json": ["evtAfastTemp", "ideTrabalhador", "cpfTrab", "_text"],
-                        "tipo": "string",
-                        "obrigatorio": True
-                    },
-                    "3 C-Matrícula": {
-                        "origem": "matricula",
-                        "caminho_json": ["evtAfastTemp", "ideTrabalhador", "matricula", "_text"],
-                        "tipo": "string"
-                    },
-                    "4 D-Data início": {
-                        "origem": "data_inicio",
-                        "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "5 E-Data fim": {
-                        "origem": "data_fim",
-                        "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "6 F-Data início do abono": {
-                        "origem": "json_data",
-                        "caminho_json": ["iniAfastamento", "dtIniAbono", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "7 G-Data fim do abono": {
-                        "origem": "json_data",
-                        "caminho_json": ["fimAfastamento", "dtFimAbono", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "8 H-Período aquisitivo início": {
-                        "origem": "json_data",
-                        "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "9 I-Período aquisitivo fim": {
-                        "origem": "json_data",
-                        "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"],
-                        "tipo": "data",
-                        "formato": "YYYY-MM-DD"
-                    },
-                    "10 J-Número de dias de férias": {
-                        "origem": "json_data",
-                        "caminho_json": ["iniAfastamento", "qtdDiasFerias", "_text"],
-                        "tipo": "string"
-                    },
-                    "11 K-Indicativo de férias coletivas": {
-                        "origem": "json_data",
-                        "caminho_json": ["iniAfastamento", "indFeriasColetivas", "_text"],
-                        "tipo": "string"
-                    }
-                }
+            "6 F-Apelido trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
+            "7 G-Nome social trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
+            "8 H-Nome mae trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmMae", "_text"], "tipo": "string"},
+            "9 I-Nome pai trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmPai", "_text"], "tipo": "string"},
+            "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string", "valores_validos": ["M", "F"]},
+            "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
+            "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
+            "13 M-Estado civil do trabalhador": {"origem": "estado_civil", "tipo": "string"},
+            "14 N-Indicativo de deficiência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
+            "15 O-Indicativo de deficiência física": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
+            "16 P-Indicativo de deficiência visual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defVisual", "_text"], "tipo": "string"},
+            "17 Q-Indicativo de deficiência auditiva": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defAuditiva", "_text"], "tipo": "string"},
+            "18 R-Indicativo de deficiência mental": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defMental", "_text"], "tipo": "string"},
+            "19 S-Indicativo de deficiência intelectual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defIntelectual", "_text"], "tipo": "string"},
+            "20 T-Trabalhador reabilitado ou adaptado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "reabReadap", "_text"], "tipo": "string"},
+            "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "infoCota", "_text"], "tipo": "string"},
+            "22 V-Tipo sanguíneo": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tipoSangue", "_text"], "tipo": "string"},
+            "23 W-Nome da cidade de  nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmCid", "_text"], "tipo": "string"},
+            "24 X-UF da cidade de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "uf", "_text"], "tipo": "string"},
+            "25 Y-Código do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
+            "26 Z-Nome do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
+            "27 AA-Código de país de nacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
+            "28 AB-Nome do país denacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
+            "29 AC-Código RAIS do país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "codRais", "_text"], "tipo": "string"},
+            "30 AD-É aposentado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "aposentado", "_text"], "tipo": "string"},
+            "31 AE-Data de aposentaria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "dtAposent", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "32 AF-Reside no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "residePais", "_text"], "tipo": "string"},
+            "33 AG-Código do tipo de logradouro": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "tpLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "tpLograd", "_text"],
+                    ["endereco", "brasil", "tpLograd", "_text"],
+                    ["trabalhador", "endereco", "tpLograd", "_text"],
+                    ["endereco", "tpLograd", "_text"],
+                    ["tpLograd", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
             },
-            "06_CONVFICHA": {
-                "fonte_principal": "esocial_s1200",
-                "campos": {
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
-                    "2 B-Código do estabelecimento": {"origem": "estabelecimento", "tipo": "string"},
-                    "3 C - Código do tipo de cálculo": {"origem": "tipo_calculo", "tipo": "string"},
-                    "4 D  - Data do pagamento": {"origem": "data_pagamento", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "5 E  - Data inicial do cálculo": {"origem": "data_inicio_calculo", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6 F  - Data final do cálculo": {"origem": "data_fim_calculo", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "7 G  - Data de cálculo da folha": {"origem": "data_calculo_folha", "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "8 H  - Código do trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
-                    "9 I  - Nome do trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
-                    "10 J-Código do contrato": {"origem": "matricula", "tipo": "string"},
-                    "11 K-Código da categoria": {"origem": "cod_categoria", "tipo": "string"},
-                    "12 L-Código da rubrica": {"origem": "codigo_rubrica", "tipo": "string"},
-                    "13 M-Descrição da rubrica": {"origem": "descricao_rubrica", "tipo": "string"},
-                    "14 N-Código do estabelecimento": {"origem": "estabelecimento", "tipo": "string"},
-                    "15 O-Código da lotação tributária": {"origem": "lotacao_tributaria", "tipo": "string"},
-                    "16 P-Código da rubrica para o recibo": {"origem": "codigo_rubrica", "tipo": "string"},
-                    "17 Q-Descrição da rubrica para o recibo": {"origem": "descricao_rubrica", "tipo": "string"},
-                    "18 R-Qtde dependentes para IR": {"origem": "qtd_dep_ir", "tipo": "string"},
-                    "19 S  - Qtde dependentes para SF": {"origem": "qtd_dep_sf", "tipo": "string"},
-                    "20 T  - Código de exposição à agentes nocivos": {"origem": "cod_exposicao", "tipo": "string"},
-                    "21 U  - Grau de insalubridade": {"origem": "grau_insalubridade", "tipo": "string"},
-                    "22 V  - Tem periculosidade": {"origem": "tem_periculosidade", "tipo": "string"},
-                    "23 W  - Ensejo de aposentadoria especial": {"origem": "ensejo_aposentadoria", "tipo": "string"},
-                    "24 X  - Período de referência": {"origem": "periodo_apuracao", "tipo": "string"},
-                    "25 Y  - Sigla da rubrica": {"origem": "json_data", "caminho_json": ["cod", "_text"], "tipo": "string"},
-                    "26 Z  - Sigla da rubrica para o recibo": {"origem": "json_data", "caminho_json": ["cod", "_text"], "tipo": "string"},
-                    "27 AA  - Descrição da rubrica para o recibo": {"origem": "descricao_rubrica", "tipo": "string"},
-                    "28 AB  - Razão ou qtde": {"origem": "json_data", "caminho_json": ["qtdRubr", "_text"], "valor_padrao": "1", "tipo": "decimal"},
-                    "29 AC  - Valor da rubrica": {"origem": "json_data", "caminho_json": ["vrRubr", "_text"], "tipo": "decimal"},
-                    "30 AD  - Classe da rubrica": {"origem": "tipo_rubrica", "valor_padrao": "M", "tipo": "string"},
-                    "31 AE  - Período de referência": {"origem": "periodo_apuracao", "tipo": "string"}
-                }
+            "34 AH-Endereço do trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "dscLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "dscLograd", "_text"],
+                    ["endereco", "brasil", "dscLograd", "_text"],
+                    ["trabalhador", "endereco", "dscLograd", "_text"],
+                    ["endereco", "dscLograd", "_text"],
+                    ["dscLograd", "_text"],
+                    ["trabalhador", "endereco", "logradouro", "_text"],
+                    ["endereco", "logradouro", "_text"],
+                    ["logradouro", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
             },
-            "07_CARGOS": {
-                "fonte_principal": "esocial_s1030",
-                "campos": {
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
-                    "2 B-Código do cargo": {"origem": "codigo", "tipo": "string"},
-                    "3 C-Nome do cargo": {"origem": "descricao", "tipo": "string"},
-                    "4 D-ID do tipo de código": {"origem": "nivel_cargo", "tipo": "string"},
-                    "5 E-ID do nível organizacional": {"origem": "nivel_cargo", "tipo": "string"},
-                    "6 F-Código do CBO": {"origem": "cbo", "tipo": "string"},
-                    "7 G-Início da validade": {"origem": "inicio_validade", "tipo": "string"},
-                    "8 H-Término da validade": {"origem": "fim_validade", "tipo": "string"},
-                    "9 I-Descrição sumária": {"origem": "desc_sumaria", "tipo": "string"},
-                    "10 J-Permite acúmulo de cargo": {"origem": "permite_acumulo", "tipo": "string"},
-                    "11 L-Permite contagem especial do acúmulo de cargo": {"origem": "permite_contagem_esp", "tipo": "string"},
-                    "12 M-Cargo de dedicação exclusiva": {"origem": "dedicacao_exclusiva", "tipo": "string"},
-                    "13 N-Número da Lei que criou e/ou extinguiu e/ou restruturou o": {"origem": "num_lei", "tipo": "string"},
-                    "14 O-Data da Lei que criou e/ou extinguiu e/ou restruturou o ca": {"origem": "dt_lei", "tipo": "string"},
-                    "15 P-Situação gerada pela Lei": {"origem": "situacao_lei", "tipo": "string"},
-                    "16 Q-O cargo tem função": {"origem": "tem_funcao", "tipo": "string"}
-                }
+            "35 AI-Número de endereço do trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "nrLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "nrLograd", "_text"],
+                    ["endereco", "brasil", "nrLograd", "_text"],
+                    ["trabalhador", "endereco", "nrLograd", "_text"],
+                    ["endereco", "nrLograd", "_text"],
+                    ["nrLograd", "_text"],
+                    ["trabalhador", "endereco", "numero", "_text"],
+                    ["endereco", "numero", "_text"],
+                    ["numero", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
             },
-            "08_CONVAFASTAMENTO": {
-                "fonte_principal": "esocial_s2230",
-                "campos": {
-                    "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
-                    "2-Nome do trabalhador": {"origem": "cpf_trabalhador", "tipo": "string", "obrigatorio": True},
-                    "3-Código do contrato": {"origem": "matricula", "tipo": "string", "obrigatorio": True},
-                    "4-Código do motivo de afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "codMotAfast", "_text"], "tipo": "string"},
-                    "5-Data inicial de afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6-Data final de afastamento": {"origem": "json_data", "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "7-Observações do afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "observacao", "_text"], "tipo": "string"},
-                    "8-Descrição do motivo de afastamento": {"origem": "descricao_motivo", "tipo": "string"},
-                    "9-Mesmo motivo anterior": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMesmoMtv", "_text"], "tipo": "string"},
-                    "10-Tipo acidente trânsito": {"origem": "json_data", "caminho_json": ["iniAfastamento", "tpAcidTransito", "_text"], "tipo": "string"},
-                    "11-Período aquisitivo início": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "12-Período aquisitivo fim": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "13-Cessão CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "cnpjCess", "_text"], "tipo": "string"},
-                    "14-Cessão ônus": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "infOnus", "_text"], "tipo": "string"},
-                    "15-Mandato sindical CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "cnpjSind", "_text"], "tipo": "string"},
-                    "16-Mandato sindical ônus remuneração": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "infOnusRemun", "_text"], "tipo": "string"},
-                    "17-Mandato eletivo CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "cnpjMandElet", "_text"], "tipo": "string"},
-                    "18-Mandato eletivo remuneração cargo": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "indRemunCargo", "_text"], "tipo": "string"},
-                    "19-Retificação origem": {"origem": "json_data", "caminho_json": ["infoRetif", "origRetif", "_text"], "tipo": "string"},
-                    "20-Retificação tipo processo": {"origem": "json_data", "caminho_json": ["infoRetif", "tpProc", "_text"], "tipo": "string"},
-                    "21-Retificação número processo": {"origem": "json_data", "caminho_json": ["infoRetif", "nrProc", "_text"], "tipo": "string"}
-                }
+            "36 AJ-Complemento do endereço de trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "complemento", "_text"], "tipo": "string"},
+            "37 AK-CEP do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "cep", "_text"], "tipo": "string"},
+            "38 AL-Bairro do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "bairro", "_text"], "tipo": "string"},
+            "39 AM-Código da cidade de residência do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "codMunic", "_text"], "tipo": "string"},
+            "40 NA-Nome da cidade de residência do trabalhador": {"origem": "nm_cidade", "tipo": "string"},
+            "41 AO-UF de residência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "uf", "_text"], "tipo": "string"},
+            "42 AP-Referência do endereço do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "referencia", "_text"], "tipo": "string"},
+            "43 AQ-Telefone": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "fonePrinc", "_text"], "tipo": "string"},
+            "44 AR-Telefone 2": {"origem": "fone_alt", "tipo": "string"},
+            "45 AS-Email": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "emailPrinc", "_text"], "tipo": "string"},
+            "46 AT-Email alternativo": {"origem": "email_alt", "tipo": "string"},
+            "47 AU-Contato de emergência": {"origem": "contato_emerg", "tipo": "string"},
+            "48 AV-Telefone do contato de emergência": {"origem": "fone_emerg", "tipo": "string"},
+            "49 AW-Parentesco do contato para emergência": {"origem": "parentesco_emerg", "tipo": "string"},
+            "50 AX-Peso": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "peso", "_text"], "tipo": "string"},
+            "51 AY-Altura": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "altura", "_text"], "tipo": "string"},
+            "52 AZ-Calça": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalca", "_text"], "tipo": "string"},
+            "53 BA-Camisa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCamisa", "_text"], "tipo": "string"},
+            "54 BB-Calçado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalcado", "_text"], "tipo": "string"},
+            "55 BC-Número do CNS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cns", "nrCns", "_text"], "tipo": "string"},
+            "56 BD-Número do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "nrRg", "_text"], "tipo": "string"},
+            "57 BE-Órgão emissor do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "orgaoEmissor", "_text"], "tipo": "string"},
+            "58 BF-Data de emissão do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "59 BG-UF de emissão do RG": {"origem": "uf_rg", "tipo": "string"},
+            "60 BH-Número do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "nrRne", "_text"], "tipo": "string"},
+            "61 BI-Órgão emissor do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "orgaoEmissor", "_text"], "tipo": "string"},
+            "62 BJ-UF de emissão do RNE": {"origem": "uf_rne", "tipo": "string"},
+            "63 BK-Data de emissão do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "64 BL-Data da chegada no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "dtChegada", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "65 BM-Classificação estrangeiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "classTrabEstrang", "_text"], "tipo": "string"},
+            "66 BN-Estrangeiro casado com brasileiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "casadoBr", "_text"], "tipo": "string"},
+            "67 BO-Estrangeiro com filhos brasileiros": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "filhosBr", "_text"], "tipo": "string"},
+            "68 BP-Número do passaporte": {"origem": "nr_passaporte", "tipo": "string"},
+            "69 BQ-País de origem do passaporte": {"origem": "pais_origem_passaporte", "tipo": "string"},
+            "70 BR-Data de emissão do passaporte": {"origem": "dt_exped_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "71 BS-Data de validade do passaporte": {"origem": "dt_valid_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "72 BT-Número do RIC": {"origem": "nr_ric", "tipo": "string"},
+            "73 BU-Órgão emissor do RIC": {"origem": "orgao_emissor_ric", "tipo": "string"},
+            "74 BV-UF de emissão do RIC": {"origem": "uf_ric", "tipo": "string"},
+            "75 BW-Data de emissão do RIC": {"origem": "dt_exped_ric", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "76 BXPIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nisTrab", "_text"], "tipo": "string"},
+            "77 BY-Data de emissão do PIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "pis", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "78 BZ-Número da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "nrCtps", "_text"], "tipo": "string"},
+            "79 CA-Série da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "serieCtps", "_text"], "tipo": "string"},
+            "80 CB-UF da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "ufCtps", "_text"], "tipo": "string"},
+            "81 CC-Data de emissão da CTPS": {"origem": "dt_exped_ctps", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "82 CD-Número do título de eleitor": {"origem": "nr_titulo", "tipo": "string"},
+            "83 CE-Zona do título de eleitor": {"origem": "zona_titulo", "tipo": "string"},
+            "84 CF-Seção do título de eleitor": {"origem": "secao_titulo", "tipo": "string"},
+            "85 CG-Código da cidade do título de eleitor": {"origem": "cod_munic_titulo", "tipo": "string"},
+            "86 CH-Nome da cidade do título de eleitor": {"origem": "nm_cidade_titulo", "tipo": "string"},
+            "87 CI-UF do título de eleitor": {"origem": "uf_titulo", "tipo": "string"},
+            "88 CJ-Data de emissão do título de eleitor": {"origem": "dt_exped_titulo", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "89 CK-Número da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "nrRegCnh", "_text"], "tipo": "string"},
+            "90 CL-Categoria da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "categoriaCnh", "_text"], "tipo": "string"},
+            "91 CM-UF da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "ufCnh", "_text"], "tipo": "string"},
+            "92 CN-Data de emissão da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtExped", "_text"], "tipo": "string"},
+            "93 CO-Data de emissão da primeira CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtPriHab", "_text"], "tipo": "string"},
+            "94 CP-Data de validade da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtValid", "_text"], "tipo": "string"},
+            "95 CQ-Número do certificado de alistamento militar": {"origem": "nr_certidao", "tipo": "string"},
+            "96 CR-Data de expedição da CAM": {"origem": "dt_exped_certidao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "97 CS-Região militar": {"origem": "regiao_militar", "tipo": "string"},
+            "98 CT-Tipo de certificado militar": {"origem": "tipo_certidao", "tipo": "string"},
+            "99 CU-Número do certificado militar": {"origem": "nr_certidao2", "tipo": "string"},
+            "100 CV-Número de série do certificado militar": {"origem": "nr_serie", "tipo": "string"},
+            "101 CW-Data de expedição do certificado militar": {"origem": "dt_exped_certidao2", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "102 CX-Categoria do certificado militar": {"origem": "categoria_certidao", "tipo": "string"},
+            "103 CY-Observações sobre a situação militar": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "observacao", "_text"], "tipo": "string"},
+            "104 CZ-Profissão": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "profissao", "_text"], "tipo": "string"},
+            "105 DA-Número de registro no conselho de classe": {"origem": "nr_registro_conselho", "tipo": "string"},
+            "106 DB-Órgão emissor do registro de classe": {"origem": "orgao_emissor_conselho", "tipo": "string"},
+            "107 DC-UF do conselho de classe": {"origem": "uf_conselho", "tipo": "string"},
+            "108 DD-Data de emissão do registro no conselho": {"origem": "dt_exped_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "109 DE-Data de vencimento do registro no conselho": {"origem": "dt_validade_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "110 DF-Observações gerais": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "observacoes", "_text"], "tipo": "string"},
+            "111 DG-País de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "paisResid", "_text"], "tipo": "string"},
+            "112 DH-Bairro de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "bairro", "_text"], "tipo": "string"},
+            "113 DI-Endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "dscLograd", "_text"], "tipo": "string"},
+            "114 DJ-Número de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nrLograd", "_text"], "tipo": "string"},
+            "115 DK-Complemento no endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "complemento", "_text"], "tipo": "string"},
+            "116 DL-Cidade de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nmCid", "_text"], "tipo": "string"},
+            "117 DM-UF de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "uf", "_text"], "tipo": "string"},
+            "118 DN-CEP de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "codPostal", "_text"], "tipo": "string"},
+            "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
+            "120 DP-Categoria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "codCateg", "_text"], "tipo": "string"},
+            "121 DQ-Data de desligamento": {"origem": "dt_deslig", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "122 DR-Tipo pessoa origem": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "origem", "_text"], "tipo": "string"},
+            "123 DS-Tipo pessoa destino": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "destino", "_text"], "tipo": "string"},
+            "124 DT-Início de validade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoRegimeTrab", "infoCeletista", "dtAdm", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "125 DU-Forma de pagamento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "formaPagamento", "_text"], "tipo": "string"},
+            "126 DV-Código do banco para pagamento pessoa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "codBanco", "_text"], "tipo": "string"},
+            "127 DW-Agência sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrAgencia", "_text"], "tipo": "string"},
+            "128 DX-Dígito da agência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvAgencia", "_text"], "tipo": "string"},
+            "129 DY-Conta bancária sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrConta", "_text"], "tipo": "string"},
+            "130 DZ-Dígito da conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvConta", "_text"], "tipo": "string"},
+            "131 EA-Tipo de conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpConta", "_text"], "tipo": "string"},
+            "132 EB-Tipo de operação": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpOperacao", "_text"], "tipo": "string"},
+            # As definições ampliadas (caminhos alternativos) dos campos acima
+            # foram mescladas na posição original de cada chave.
+            "Solteiro3 M-Estado civil do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "estCiv", "_text"], "tipo": "string"},
+            # --- INÍCIO CAMPOS EXPANDIDOS S-2200 ---
+            "cpf_trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
+            "nis_trabalhador": {"origem": "nis_trabalhador", "tipo": "string"},
+            "nome_trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
+            "sexo": {"origem": "sexo", "tipo": "string"},
+            "raca_cor": {"origem": "raca_cor", "tipo": "string"},
+            "estado_civil": {"origem": "estado_civil", "tipo": "string"},
+            "grau_instrucao": {"origem": "grau_instrucao", "tipo": "string"},
+            "data_nascimento": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "nm_mae": {"origem": "nm_mae", "tipo": "string"},
+            "nm_pai": {"origem": "nm_pai", "tipo": "string"},
+            "uf_nasc": {"origem": "uf_nasc", "tipo": "string"},
+            "pais_nasc": {"origem": "pais_nasc", "tipo": "string"},
+            "pais_nac": {"origem": "pais_nac", "tipo": "string"},
+            "tp_lograd": {"origem": "tp_lograd", "tipo": "string"},
+            "dsc_lograd": {"origem": "dsc_lograd", "tipo": "string"},
+            "nr_lograd": {"origem": "nr_lograd", "tipo": "string"},
+            "complemento": {"origem": "complemento", "tipo": "string"},
+            "cep": {"origem": "cep", "tipo": "string"},
+            "bairro": {"origem": "bairro", "tipo": "string"},
+            "cod_munic": {"origem": "cod_munic", "tipo": "string"},
+            "nm_cidade": {"origem": "nm_cidade", "tipo": "string"},
+            "uf_resid": {"origem": "uf_resid", "tipo": "string"},
+            "pais_resid": {"origem": "pais_resid", "tipo": "string"},
+            "bairro_ext": {"origem": "bairro_ext", "tipo": "string"},
+            "dsc_lograd_ext": {"origem": "dsc_lograd_ext", "tipo": "string"},
+            "nr_lograd_ext": {"origem": "nr_lograd_ext", "tipo": "string"},
+            "complemento_ext": {"origem": "complemento_ext", "tipo": "string"},
+            "nm_cidade_ext": {"origem": "nm_cidade_ext", "tipo": "string"},
+            "cod_postal_ext": {"origem": "cod_postal_ext", "tipo": "string"},
+            "fone_princ": {"origem": "fone_princ", "tipo": "string"},
+            "fone_alt": {"origem": "fone_alt", "tipo": "string"},
+            "email_princ": {"origem": "email_princ", "tipo": "string"},
+            "email_alt": {"origem": "email_alt", "tipo": "string"},
+            "contato_emerg": {"origem": "contato_emerg", "tipo": "string"},
+            "fone_emerg": {"origem": "fone_emerg", "tipo": "string"},
+            "parentesco_emerg": {"origem": "parentesco_emerg", "tipo": "string"},
+            "ctps_numero": {"origem": "ctps_numero", "tipo": "string"},
+            "ctps_serie": {"origem": "ctps_serie", "tipo": "string"},
+            "ctps_uf": {"origem": "ctps_uf", "tipo": "string"},
+            "rg_numero": {"origem": "rg_numero", "tipo": "string"},
+            "rg_orgao": {"origem": "rg_orgao", "tipo": "string"},
+            "rg_data": {"origem": "rg_data", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "rg_uf": {"origem": "rg_uf", "tipo": "string"},
+            "rne_numero": {"origem": "rne_numero", "tipo": "string"},
+            "rne_orgao": {"origem": "rne_orgao", "tipo": "string"},
+            "rne_uf": {"origem": "rne_uf", "tipo": "string"},
+            "cnh_numero": {"origem": "cnh_numero", "tipo": "string"},
+            "cnh_categoria": {"origem": "cnh_categoria", "tipo": "string"},
+            "cnh_uf": {"origem": "cnh_uf", "tipo": "string"},
+            "cnh_data": {"origem": "cnh_data", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cnh_pri_hab": {"origem": "cnh_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cnh_validade": {"origem": "cnh_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "def_fisica": {"origem": "def_fisica", "tipo": "string"},
+            "def_visual": {"origem": "def_visual", "tipo": "string"},
+            "def_auditiva": {"origem": "def_auditiva", "tipo": "string"},
+            "def_mental": {"origem": "def_mental", "tipo": "string"},
+            "def_intelectual": {"origem": "def_intelectual", "tipo": "string"},
+            "reab_readap": {"origem": "reab_readap", "tipo": "string"},
+            "info_cota": {"origem": "info_cota", "tipo": "string"},
+            "observacao_def": {"origem": "observacao_def", "tipo": "string"},
+            "dt_chegada": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "class_estrangeiro": {"origem": "class_estrangeiro", "tipo": "string"},
+            "casado_br": {"origem": "casado_br", "tipo": "string"},
+            "filhos_br": {"origem": "filhos_br", "tipo": "string"},
+            "matricula": {"origem": "matricula", "tipo": "string"},
+            "data_admissao": {"origem": "data_admissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "tipo_admissao": {"origem": "tipo_admissao", "tipo": "string"},
+            "tipo_regime_jornada": {"origem": "tipo_regime_jornada", "tipo": "string"},
+            "natureza_atividade": {"origem": "natureza_atividade", "tipo": "string"},
+            "cnpj_empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "cod_categoria": {"origem": "cod_categoria", "tipo": "string"},
+            "cod_cargo": {"origem": "cod_cargo", "tipo": "string"},
+            "cod_funcao": {"origem": "cod_funcao", "tipo": "string"},
+            "cod_lotacao": {"origem": "cod_lotacao", "tipo": "string"},
+            "salario_contratual": {"origem": "salario_contratual", "tipo": "decimal"},
+            "und_sal_fixo": {"origem": "und_sal_fixo", "tipo": "string"},
+            "tipo_contrato": {"origem": "tipo_contrato", "tipo": "string"},
+            "duracao_contrato": {"origem": "duracao_contrato", "tipo": "string"},
+            "passaporte_numero": {"origem": "passaporte_numero", "tipo": "string"},
+            "passaporte_pais_origem": {"origem": "passaporte_pais_origem", "tipo": "string"},
+            "passaporte_data_emissao": {"origem": "passaporte_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "passaporte_validade": {"origem": "passaporte_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "ric_numero": {"origem": "ric_numero", "tipo": "string"},
+            "ric_orgao": {"origem": "ric_orgao", "tipo": "string"},
+            "ric_uf": {"origem": "ric_uf", "tipo": "string"},
+            "ric_data_emissao": {"origem": "ric_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "pis_numero": {"origem": "pis_numero", "tipo": "string"},
+            "pis_data_emissao": {"origem": "pis_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "titulo_eleitor_numero": {"origem": "titulo_eleitor_numero", "tipo": "string"},
+            "titulo_eleitor_zona": {"origem": "titulo_eleitor_zona", "tipo": "string"},
+            "titulo_eleitor_secao": {"origem": "titulo_eleitor_secao", "tipo": "string"},
+            "titulo_eleitor_cod_munic": {"origem": "titulo_eleitor_cod_munic", "tipo": "string"},
+            "titulo_eleitor_nm_cidade": {"origem": "titulo_eleitor_nm_cidade", "tipo": "string"},
+            "titulo_eleitor_uf": {"origem": "titulo_eleitor_uf", "tipo": "string"},
+            "titulo_eleitor_data_emissao": {"origem": "titulo_eleitor_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_numero": {"origem": "cert_militar_numero", "tipo": "string"},
+            "cert_militar_data_exped": {"origem": "cert_militar_data_exped", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_regiao": {"origem": "cert_militar_regiao", "tipo": "string"},
+            "cert_militar_tipo": {"origem": "cert_militar_tipo", "tipo": "string"},
+            "cert_militar_numero2": {"origem": "cert_militar_numero2", "tipo": "string"},
+            "cert_militar_serie": {"origem": "cert_militar_serie", "tipo": "string"},
+            "cert_militar_data_exped2": {"origem": "cert_militar_data_exped2", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_categoria": {"origem": "cert_militar_categoria", "tipo": "string"},
+            "cert_militar_observacoes": {"origem": "cert_militar_observacoes", "tipo": "string"},
+            "profissao": {"origem": "profissao", "tipo": "string"},
+            "conselho_numero": {"origem": "conselho_numero", "tipo": "string"},
+            "conselho_orgao": {"origem": "conselho_orgao", "tipo": "string"},
+            "conselho_uf": {"origem": "conselho_uf", "tipo": "string"},
+            "conselho_data_emissao": {"origem": "conselho_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "conselho_data_validade": {"origem": "conselho_data_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "conselho_observacoes": {"origem": "conselho_observacoes", "tipo": "string"},
+            "banco_forma_pagamento": {"origem": "banco_forma_pagamento", "tipo": "string"},
+            "banco_codigo": {"origem": "banco_codigo", "tipo": "string"},
+            "banco_agencia": {"origem": "banco_agencia", "tipo": "string"},
+            "banco_agencia_dv": {"origem": "banco_agencia_dv", "tipo": "string"},
+            "banco_conta": {"origem": "banco_conta", "tipo": "string"},
+            "banco_conta_dv": {"origem": "banco_conta_dv", "tipo": "string"},
+            "banco_tipo_conta": {"origem": "banco_tipo_conta", "tipo": "string"},
+            "banco_tipo_operacao": {"origem": "banco_tipo_operacao", "tipo": "string"},
+            "peso": {"origem": "peso", "tipo": "string"},
+            "altura": {"origem": "altura", "tipo": "string"},
+            "tamanho_calca": {"origem": "tamanho_calca", "tipo": "string"},
+            "tamanho_camisa": {"origem": "tamanho_camisa", "tipo": "string"},
+            "tamanho_calcado": {"origem": "tamanho_calcado", "tipo": "string"},
+            "cns_numero": {"origem": "cns_numero", "tipo": "string"},
+            "observacoes_gerais": {"origem": "observacoes_gerais", "tipo": "string"},
+            # --- FIM CAMPOS EXPANDIDOS S-2200 ---
+        }
+    },
+    
+    "02_CONVCONTRATO": {
+        "fonte_principal": "esocial_s2200",
+        "fontes_adicionais": ["esocial_s2205", "esocial_s2206"],
+        "campos": {
+            # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "2 B-Código referência": {
+                "origem": "cnpj_empregador",
+                "caminho_json_alternativos": [
+                    ["evtAdmissao", "ideEmpregador", "nrInsc", "_text"],
+                    ["evtAltCadastral", "ideEmpregador", "nrInsc", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
             },
-            "09_CONVATESTADO": {
-                "fonte_principal": "esocial_s2230",
-                "campos": {
-                    "1 - ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
-                    "9 - Código de identificação do contrato": {"origem": "matricula", "tipo": "string", "obrigatorio": True},
-                    "2 - Data da consulta": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "dtDiagnostico", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "4 - Data inicial": {"origem": "json_data", "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "6 - Data final": {"origem": "json_data", "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "8 - Qtde de dias do atestado": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "qtdDiasAfast", "_text"], "tipo": "string"},
-                    "10 - Código CID": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "codCID", "_text"], "tipo": "string"},
-                    "11 - MedicoTpCons": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "tpConsulta", "_text"], "tipo": "string"},
-                    "12 - Número de inscrição do médico": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "emitente", "nrOC", "_text"], "tipo": "string"},
-                    "13 - UF do CRM do médico": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "emitente", "ufOC", "_text"], "tipo": "string"},
-                    "14 - Mesmo motivo anterior": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMesmoMtv", "_text"], "tipo": "string"},
-                    "15 - Tipo acidente trânsito": {"origem": "json_data", "caminho_json": ["iniAfastamento", "tpAcidTransito", "_text"], "tipo": "string"},
-                    "16 - Observações do afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "observacao", "_text"], "tipo": "string"},
-                    "17 - Período aquisitivo início": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "18 - Período aquisitivo fim": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
-                    "19 - Cessão CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "cnpjCess", "_text"], "tipo": "string"},
-                    "20 - Cessão ônus": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "infOnus", "_text"], "tipo": "string"},
-                    "21 - Mandato sindical CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "cnpjSind", "_text"], "tipo": "string"},
-                    "22 - Mandato sindical ônus remuneração": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "infOnusRemun", "_text"], "tipo": "string"},
-                    "23 - Mandato eletivo CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "cnpjMandElet", "_text"], "tipo": "string"},
-                    "24 - Mandato eletivo remuneração cargo": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "indRemunCargo", "_text"], "tipo": "string"},
-                    "25 - Retificação origem": {"origem": "json_data", "caminho_json": ["infoRetif", "origRetif", "_text"], "tipo": "string"},
-                    "26 - Retificação tipo processo": {"origem": "json_data", "caminho_json": ["infoRetif", "tpProc", "_text"], "tipo": "string"},
-                    "27 - Retificação número processo": {"origem": "json_data", "caminho_json": ["infoRetif", "nrProc", "_text"], "tipo": "string"}
-                }
+            "3 C-CPF trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "cpfTrab", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "cpfTrab", "_text"],
+                    ["trabalhador", "cpf", "_text"],
+                    ["evtAltCadastral", "ideTrabalhador", "cpfTrab", "_text"],
+                    ["ideTrabalhador", "cpfTrab", "_text"],
+                    ["ideTrabalhador", "cpf", "_text"],
+                    ["cpfTrab", "_text"],
+                    ["cpf", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
+            },
+            "4 D-Nome trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "nmTrab", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "nmTrab", "_text"],
+                    ["trabalhador", "nome", "_text"],
+                    ["evtAltCadastral", "alteracao", "dadosTrabalhador", "nmTrab", "_text"],
+                    ["alteracao", "dadosTrabalhador", "nmTrab", "_text"],
+                    ["evtAltContratual", "ideTrabalhador", "nmTrab", "_text"],
+                    ["ideTrabalhador", "nmTrab", "_text"],
+                    ["nome", "_text"]
+                ],
+                "tipo": "string", "obrigatorio": True, "valor_padrao": ""
+            },
+            "5 E-Data nascimento trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "dtNascto", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "nascimento", "dtNascto", "_text"],
+                    ["trabalhador", "dtNascto", "_text"],
+                    ["nascimento", "dtNascto", "_text"],
+                    ["dtNascto", "_text"],
+                    ["trabalhador", "dataNascimento", "_text"],
+                    ["dataNascimento", "_text"]
+                ],
+                "tipo": "data", "formato": "YYYY-MM-DD", "valor_padrao": ""
+            },
+            "6 F-Apelido trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
+            "7 G-Nome social trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nmSoc", "_text"], "tipo": "string"},
+            "8 H-Nome mae trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmMae", "_text"], "tipo": "string"},
+            "9 I-Nome pai trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmPai", "_text"], "tipo": "string"},
+            "10 J-Sexo trabalhador": {"origem": "sexo", "tipo": "string", "valores_validos": ["M", "F"]},
+            "11 K-Grau de instrução": {"origem": "grau_instrucao", "tipo": "string"},
+            "12 L-Raça/Cor do trabalhador": {"origem": "raca_cor", "tipo": "string"},
+            "13 M-Estado civil do trabalhador": {"origem": "estado_civil", "tipo": "string"},
+            "14 N-Indicativo de deficiência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
+            "15 O-Indicativo de deficiência física": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defFisica", "_text"], "tipo": "string"},
+            "16 P-Indicativo de deficiência visual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defVisual", "_text"], "tipo": "string"},
+            "17 Q-Indicativo de deficiência auditiva": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defAuditiva", "_text"], "tipo": "string"},
+            "18 R-Indicativo de deficiência mental": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defMental", "_text"], "tipo": "string"},
+            "19 S-Indicativo de deficiência intelectual": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "defIntelectual", "_text"], "tipo": "string"},
+            "20 T-Trabalhador reabilitado ou adaptado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "reabReadap", "_text"], "tipo": "string"},
+            "21 U-Trabalhador faz parte de cota de deficiente": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "infoCota", "_text"], "tipo": "string"},
+            "22 V-Tipo sanguíneo": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tipoSangue", "_text"], "tipo": "string"},
+            "23 W-Nome da cidade de  nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "nmCid", "_text"], "tipo": "string"},
+            "24 X-UF da cidade de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "uf", "_text"], "tipo": "string"},
+            "25 Y-Código do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
+            "26 Z-Nome do país de nascimento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNascto", "_text"], "tipo": "string"},
+            "27 AA-Código de país de nacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
+            "28 AB-Nome do país denacionalidade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "paisNac", "_text"], "tipo": "string"},
+            "29 AC-Código RAIS do país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nascimento", "codRais", "_text"], "tipo": "string"},
+            "30 AD-É aposentado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "aposentado", "_text"], "tipo": "string"},
+            "31 AE-Data de aposentaria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "dtAposent", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "32 AF-Reside no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "residePais", "_text"], "tipo": "string"},
+            "33 AG-Código do tipo de logradouro": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "tpLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "tpLograd", "_text"],
+                    ["endereco", "brasil", "tpLograd", "_text"],
+                    ["trabalhador", "endereco", "tpLograd", "_text"],
+                    ["endereco", "tpLograd", "_text"],
+                    ["tpLograd", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
             },
+            "34 AH-Endereço do trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "dscLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "dscLograd", "_text"],
+                    ["endereco", "brasil", "dscLograd", "_text"],
+                    ["trabalhador", "endereco", "dscLograd", "_text"],
+                    ["endereco", "dscLograd", "_text"],
+                    ["dscLograd", "_text"],
+                    ["trabalhador", "endereco", "logradouro", "_text"],
+                    ["endereco", "logradouro", "_text"],
+                    ["logradouro", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
+            },
+            "35 AI-Número de endereço do trabalhador": {
+                "origem": "json_data",
+                "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "nrLograd", "_text"],
+                "caminho_json_alternativos": [
+                    ["trabalhador", "endereco", "brasil", "nrLograd", "_text"],
+                    ["endereco", "brasil", "nrLograd", "_text"],
+                    ["trabalhador", "endereco", "nrLograd", "_text"],
+                    ["endereco", "nrLograd", "_text"],
+                    ["nrLograd", "_text"],
+                    ["trabalhador", "endereco", "numero", "_text"],
+                    ["endereco", "numero", "_text"],
+                    ["numero", "_text"]
+                ],
+                "tipo": "string", "valor_padrao": ""
+            },
+            "36 AJ-Complemento do endereço de trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "complemento", "_text"], "tipo": "string"},
+            "37 AK-CEP do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "cep", "_text"], "tipo": "string"},
+            "38 AL-Bairro do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "bairro", "_text"], "tipo": "string"},
+            "39 AM-Código da cidade de residência do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "codMunic", "_text"], "tipo": "string"},
+            "40 NA-Nome da cidade de residência do trabalhador": {"origem": "nm_cidade", "tipo": "string"},
+            "41 AO-UF de residência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "uf", "_text"], "tipo": "string"},
+            "42 AP-Referência do endereço do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "brasil", "referencia", "_text"], "tipo": "string"},
+            "43 AQ-Telefone": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "fonePrinc", "_text"], "tipo": "string"},
+            "44 AR-Telefone 2": {"origem": "fone_alt", "tipo": "string"},
+            "45 AS-Email": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "contato", "emailPrinc", "_text"], "tipo": "string"},
+            "46 AT-Email alternativo": {"origem": "email_alt", "tipo": "string"},
+            "47 AU-Contato de emergência": {"origem": "contato_emerg", "tipo": "string"},
+            "48 AV-Telefone do contato de emergência": {"origem": "fone_emerg", "tipo": "string"},
+            "49 AW-Parentesco do contato para emergência": {"origem": "parentesco_emerg", "tipo": "string"},
+            "50 AX-Peso": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "peso", "_text"], "tipo": "string"},
+            "51 AY-Altura": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "altura", "_text"], "tipo": "string"},
+            "52 AZ-Calça": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalca", "_text"], "tipo": "string"},
+            "53 BA-Camisa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCamisa", "_text"], "tipo": "string"},
+            "54 BB-Calçado": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "tamanhoCalcado", "_text"], "tipo": "string"},
+            "55 BC-Número do CNS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cns", "nrCns", "_text"], "tipo": "string"},
+            "56 BD-Número do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "nrRg", "_text"], "tipo": "string"},
+            "57 BE-Órgão emissor do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "orgaoEmissor", "_text"], "tipo": "string"},
+            "58 BF-Data de emissão do RG": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rg", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "59 BG-UF de emissão do RG": {"origem": "uf_rg", "tipo": "string"},
+            "60 BH-Número do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "nrRne", "_text"], "tipo": "string"},
+            "61 BI-Órgão emissor do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "orgaoEmissor", "_text"], "tipo": "string"},
+            "62 BJ-UF de emissão do RNE": {"origem": "uf_rne", "tipo": "string"},
+            "63 BK-Data de emissão do RNE": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "rne", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "64 BL-Data da chegada no país": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "dtChegada", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "65 BM-Classificação estrangeiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "classTrabEstrang", "_text"], "tipo": "string"},
+            "66 BN-Estrangeiro casado com brasileiro": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "casadoBr", "_text"], "tipo": "string"},
+            "67 BO-Estrangeiro com filhos brasileiros": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "trabEstrangeiro", "filhosBr", "_text"], "tipo": "string"},
+            "68 BP-Número do passaporte": {"origem": "nr_passaporte", "tipo": "string"},
+            "69 BQ-País de origem do passaporte": {"origem": "pais_origem_passaporte", "tipo": "string"},
+            "70 BR-Data de emissão do passaporte": {"origem": "dt_exped_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "71 BS-Data de validade do passaporte": {"origem": "dt_valid_passaporte", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "72 BT-Número do RIC": {"origem": "nr_ric", "tipo": "string"},
+            "73 BU-Órgão emissor do RIC": {"origem": "orgao_emissor_ric", "tipo": "string"},
+            "74 BV-UF de emissão do RIC": {"origem": "uf_ric", "tipo": "string"},
+            "75 BW-Data de emissão do RIC": {"origem": "dt_exped_ric", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "76 BXPIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "nisTrab", "_text"], "tipo": "string"},
+            "77 BY-Data de emissão do PIS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "pis", "dtExped", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "78 BZ-Número da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "nrCtps", "_text"], "tipo": "string"},
+            "79 CA-Série da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "serieCtps", "_text"], "tipo": "string"},
+            "80 CB-UF da CTPS": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "ctps", "ufCtps", "_text"], "tipo": "string"},
+            "81 CC-Data de emissão da CTPS": {"origem": "dt_exped_ctps", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "82 CD-Número do título de eleitor": {"origem": "nr_titulo", "tipo": "string"},
+            "83 CE-Zona do título de eleitor": {"origem": "zona_titulo", "tipo": "string"},
+            "84 CF-Seção do título de eleitor": {"origem": "secao_titulo", "tipo": "string"},
+            "85 CG-Código da cidade do título de eleitor": {"origem": "cod_munic_titulo", "tipo": "string"},
+            "86 CH-Nome da cidade do título de eleitor": {"origem": "nm_cidade_titulo", "tipo": "string"},
+            "87 CI-UF do título de eleitor": {"origem": "uf_titulo", "tipo": "string"},
+            "88 CJ-Data de emissão do título de eleitor": {"origem": "dt_exped_titulo", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "89 CK-Número da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "nrRegCnh", "_text"], "tipo": "string"},
+            "90 CL-Categoria da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "categoriaCnh", "_text"], "tipo": "string"},
+            "91 CM-UF da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "ufCnh", "_text"], "tipo": "string"},
+            "92 CN-Data de emissão da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtExped", "_text"], "tipo": "string"},
+            "93 CO-Data de emissão da primeira CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtPriHab", "_text"], "tipo": "string"},
+            "94 CP-Data de validade da CNH": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "documentos", "cnh", "dtValid", "_text"], "tipo": "string"},
+            "95 CQ-Número do certificado de alistamento militar": {"origem": "nr_certidao", "tipo": "string"},
+            "96 CR-Data de expedição da CAM": {"origem": "dt_exped_certidao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "97 CS-Região militar": {"origem": "regiao_militar", "tipo": "string"},
+            "98 CT-Tipo de certificado militar": {"origem": "tipo_certidao", "tipo": "string"},
+            "99 CU-Número do certificado militar": {"origem": "nr_certidao2", "tipo": "string"},
+            "100 CV-Número de série do certificado militar": {"origem": "nr_serie", "tipo": "string"},
+            "101 CW-Data de expedição do certificado militar": {"origem": "dt_exped_certidao2", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "102 CX-Categoria do certificado militar": {"origem": "categoria_certidao", "tipo": "string"},
+            "103 CY-Observações sobre a situação militar": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "infoDeficiencia", "observacao", "_text"], "tipo": "string"},
+            "104 CZ-Profissão": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "profissao", "_text"], "tipo": "string"},
+            "105 DA-Número de registro no conselho de classe": {"origem": "nr_registro_conselho", "tipo": "string"},
+            "106 DB-Órgão emissor do registro de classe": {"origem": "orgao_emissor_conselho", "tipo": "string"},
+            "107 DC-UF do conselho de classe": {"origem": "uf_conselho", "tipo": "string"},
+            "108 DD-Data de emissão do registro no conselho": {"origem": "dt_exped_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "109 DE-Data de vencimento do registro no conselho": {"origem": "dt_validade_conselho", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "110 DF-Observações gerais": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "observacoes", "_text"], "tipo": "string"},
+            "111 DG-País de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "paisResid", "_text"], "tipo": "string"},
+            "112 DH-Bairro de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "bairro", "_text"], "tipo": "string"},
+            "113 DI-Endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "dscLograd", "_text"], "tipo": "string"},
+            "114 DJ-Número de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nrLograd", "_text"], "tipo": "string"},
+            "115 DK-Complemento no endereço de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "complemento", "_text"], "tipo": "string"},
+            "116 DL-Cidade de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "nmCid", "_text"], "tipo": "string"},
+            "117 DM-UF de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "uf", "_text"], "tipo": "string"},
+            "118 DN-CEP de residência no exterior": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "endereco", "exterior", "codPostal", "_text"], "tipo": "string"},
+            "119 DO-Cadastrado em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
+            "120 DP-Categoria": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "codCateg", "_text"], "tipo": "string"},
+            "121 DQ-Data de desligamento": {"origem": "dt_deslig", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "122 DR-Tipo pessoa origem": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "origem", "_text"], "tipo": "string"},
+            "123 DS-Tipo pessoa destino": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "sucessaoVinc", "destino", "_text"], "tipo": "string"},
+            "124 DT-Início de validade": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoRegimeTrab", "infoCeletista", "dtAdm", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "125 DU-Forma de pagamento": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "formaPagamento", "_text"], "tipo": "string"},
+            "126 DV-Código do banco para pagamento pessoa": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "codBanco", "_text"], "tipo": "string"},
+            "127 DW-Agência sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrAgencia", "_text"], "tipo": "string"},
+            "128 DX-Dígito da agência": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvAgencia", "_text"], "tipo": "string"},
+            "129 DY-Conta bancária sem dígito": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "nrConta", "_text"], "tipo": "string"},
+            "130 DZ-Dígito da conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "dvConta", "_text"], "tipo": "string"},
+            "131 EA-Tipo de conta": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpConta", "_text"], "tipo": "string"},
+            "132 EB-Tipo de operação": {"origem": "json_data", "caminho_json": ["evtAdmissao", "vinculo", "infoContrato", "localTrab", "infoLocalTrab", "endereco", "brasil", "banco", "tpOperacao", "_text"], "tipo": "string"},
+            # As definições ampliadas (caminhos alternativos) dos campos acima
+            # foram mescladas na posição original de cada chave.
+            "Solteiro3 M-Estado civil do trabalhador": {"origem": "json_data", "caminho_json": ["evtAdmissao", "trabalhador", "estCiv", "_text"], "tipo": "string"},
+            # --- INÍCIO CAMPOS EXPANDIDOS S-2200 ---
+            "cpf_trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
+            "nis_trabalhador": {"origem": "nis_trabalhador", "tipo": "string"},
+            "nome_trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
+            "sexo": {"origem": "sexo", "tipo": "string"},
+            "raca_cor": {"origem": "raca_cor", "tipo": "string"},
+            "estado_civil": {"origem": "estado_civil", "tipo": "string"},
+            "grau_instrucao": {"origem": "grau_instrucao", "tipo": "string"},
+            "data_nascimento": {"origem": "data_nascimento", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "nm_mae": {"origem": "nm_mae", "tipo": "string"},
+            "nm_pai": {"origem": "nm_pai", "tipo": "string"},
+            "uf_nasc": {"origem": "uf_nasc", "tipo": "string"},
+            "pais_nasc": {"origem": "pais_nasc", "tipo": "string"},
+            "pais_nac": {"origem": "pais_nac", "tipo": "string"},
+            "tp_lograd": {"origem": "tp_lograd", "tipo": "string"},
+            "dsc_lograd": {"origem": "dsc_lograd", "tipo": "string"},
+            "nr_lograd": {"origem": "nr_lograd", "tipo": "string"},
+            "complemento": {"origem": "complemento", "tipo": "string"},
+            "cep": {"origem": "cep", "tipo": "string"},
+            "bairro": {"origem": "bairro", "tipo": "string"},
+            "cod_munic": {"origem": "cod_munic", "tipo": "string"},
+            "nm_cidade": {"origem": "nm_cidade", "tipo": "string"},
+            "uf_resid": {"origem": "uf_resid", "tipo": "string"},
+            "pais_resid": {"origem": "pais_resid", "tipo": "string"},
+            "bairro_ext": {"origem": "bairro_ext", "tipo": "string"},
+            "dsc_lograd_ext": {"origem": "dsc_lograd_ext", "tipo": "string"},
+            "nr_lograd_ext": {"origem": "nr_lograd_ext", "tipo": "string"},
+            "complemento_ext": {"origem": "complemento_ext", "tipo": "string"},
+            "nm_cidade_ext": {"origem": "nm_cidade_ext", "tipo": "string"},
+            "cod_postal_ext": {"origem": "cod_postal_ext", "tipo": "string"},
+            "fone_princ": {"origem": "fone_princ", "tipo": "string"},
+            "fone_alt": {"origem": "fone_alt", "tipo": "string"},
+            "email_princ": {"origem": "email_princ", "tipo": "string"},
+            "email_alt": {"origem": "email_alt", "tipo": "string"},
+            "contato_emerg": {"origem": "contato_emerg", "tipo": "string"},
+            "fone_emerg": {"origem": "fone_emerg", "tipo": "string"},
+            "parentesco_emerg": {"origem": "parentesco_emerg", "tipo": "string"},
+            "ctps_numero": {"origem": "ctps_numero", "tipo": "string"},
+            "ctps_serie": {"origem": "ctps_serie", "tipo": "string"},
+            "ctps_uf": {"origem": "ctps_uf", "tipo": "string"},
+            "rg_numero": {"origem": "rg_numero", "tipo": "string"},
+            "rg_orgao": {"origem": "rg_orgao", "tipo": "string"},
+            "rg_data": {"origem": "rg_data", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "rg_uf": {"origem": "rg_uf", "tipo": "string"},
+            "rne_numero": {"origem": "rne_numero", "tipo": "string"},
+            "rne_orgao": {"origem": "rne_orgao", "tipo": "string"},
+            "rne_uf": {"origem": "rne_uf", "tipo": "string"},
+            "cnh_numero": {"origem": "cnh_numero", "tipo": "string"},
+            "cnh_categoria": {"origem": "cnh_categoria", "tipo": "string"},
+            "cnh_uf": {"origem": "cnh_uf", "tipo": "string"},
+            "cnh_data": {"origem": "cnh_data", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cnh_pri_hab": {"origem": "cnh_pri_hab", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cnh_validade": {"origem": "cnh_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "def_fisica": {"origem": "def_fisica", "tipo": "string"},
+            "def_visual": {"origem": "def_visual", "tipo": "string"},
+            "def_auditiva": {"origem": "def_auditiva", "tipo": "string"},
+            "def_mental": {"origem": "def_mental", "tipo": "string"},
+            "def_intelectual": {"origem": "def_intelectual", "tipo": "string"},
+            "reab_readap": {"origem": "reab_readap", "tipo": "string"},
+            "info_cota": {"origem": "info_cota", "tipo": "string"},
+            "observacao_def": {"origem": "observacao_def", "tipo": "string"},
+            "dt_chegada": {"origem": "dt_chegada", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "class_estrangeiro": {"origem": "class_estrangeiro", "tipo": "string"},
+            "casado_br": {"origem": "casado_br", "tipo": "string"},
+            "filhos_br": {"origem": "filhos_br", "tipo": "string"},
+            "matricula": {"origem": "matricula", "tipo": "string"},
+            "data_admissao": {"origem": "data_admissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "tipo_admissao": {"origem": "tipo_admissao", "tipo": "string"},
+            "tipo_regime_jornada": {"origem": "tipo_regime_jornada", "tipo": "string"},
+            "natureza_atividade": {"origem": "natureza_atividade", "tipo": "string"},
+            "cnpj_empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "cod_categoria": {"origem": "cod_categoria", "tipo": "string"},
+            "cod_cargo": {"origem": "cod_cargo", "tipo": "string"},
+            "cod_funcao": {"origem": "cod_funcao", "tipo": "string"},
+            "cod_lotacao": {"origem": "cod_lotacao", "tipo": "string"},
+            "salario_contratual": {"origem": "salario_contratual", "tipo": "decimal"},
+            "und_sal_fixo": {"origem": "und_sal_fixo", "tipo": "string"},
+            "tipo_contrato": {"origem": "tipo_contrato", "tipo": "string"},
+            "duracao_contrato": {"origem": "duracao_contrato", "tipo": "string"},
+            "passaporte_numero": {"origem": "passaporte_numero", "tipo": "string"},
+            "passaporte_pais_origem": {"origem": "passaporte_pais_origem", "tipo": "string"},
+            "passaporte_data_emissao": {"origem": "passaporte_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "passaporte_validade": {"origem": "passaporte_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "ric_numero": {"origem": "ric_numero", "tipo": "string"},
+            "ric_orgao": {"origem": "ric_orgao", "tipo": "string"},
+            "ric_uf": {"origem": "ric_uf", "tipo": "string"},
+            "ric_data_emissao": {"origem": "ric_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "pis_numero": {"origem": "pis_numero", "tipo": "string"},
+            "pis_data_emissao": {"origem": "pis_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "titulo_eleitor_numero": {"origem": "titulo_eleitor_numero", "tipo": "string"},
+            "titulo_eleitor_zona": {"origem": "titulo_eleitor_zona", "tipo": "string"},
+            "titulo_eleitor_secao": {"origem": "titulo_eleitor_secao", "tipo": "string"},
+            "titulo_eleitor_cod_munic": {"origem": "titulo_eleitor_cod_munic", "tipo": "string"},
+            "titulo_eleitor_nm_cidade": {"origem": "titulo_eleitor_nm_cidade", "tipo": "string"},
+            "titulo_eleitor_uf": {"origem": "titulo_eleitor_uf", "tipo": "string"},
+            "titulo_eleitor_data_emissao": {"origem": "titulo_eleitor_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_numero": {"origem": "cert_militar_numero", "tipo": "string"},
+            "cert_militar_data_exped": {"origem": "cert_militar_data_exped", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_regiao": {"origem": "cert_militar_regiao", "tipo": "string"},
+            "cert_militar_tipo": {"origem": "cert_militar_tipo", "tipo": "string"},
+            "cert_militar_numero2": {"origem": "cert_militar_numero2", "tipo": "string"},
+            "cert_militar_serie": {"origem": "cert_militar_serie", "tipo": "string"},
+            "cert_militar_data_exped2": {"origem": "cert_militar_data_exped2", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "cert_militar_categoria": {"origem": "cert_militar_categoria", "tipo": "string"},
+            "cert_militar_observacoes": {"origem": "cert_militar_observacoes", "tipo": "string"},
+            "profissao": {"origem": "profissao", "tipo": "string"},
+            "conselho_numero": {"origem": "conselho_numero", "tipo": "string"},
+            "conselho_orgao": {"origem": "conselho_orgao", "tipo": "string"},
+            "conselho_uf": {"origem": "conselho_uf", "tipo": "string"},
+            "conselho_data_emissao": {"origem": "conselho_data_emissao", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "conselho_data_validade": {"origem": "conselho_data_validade", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "conselho_observacoes": {"origem": "conselho_observacoes", "tipo": "string"},
+            "banco_forma_pagamento": {"origem": "banco_forma_pagamento", "tipo": "string"},
+            "banco_codigo": {"origem": "banco_codigo", "tipo": "string"},
+            "banco_agencia": {"origem": "banco_agencia", "tipo": "string"},
+            "banco_agencia_dv": {"origem": "banco_agencia_dv", "tipo": "string"},
+            "banco_conta": {"origem": "banco_conta", "tipo": "string"},
+            "banco_conta_dv": {"origem": "banco_conta_dv", "tipo": "string"},
+            "banco_tipo_conta": {"origem": "banco_tipo_conta", "tipo": "string"},
+            "banco_tipo_operacao": {"origem": "banco_tipo_operacao", "tipo": "string"},
+            "peso": {"origem": "peso", "tipo": "string"},
+            "altura": {"origem": "altura", "tipo": "string"},
+            "tamanho_calca": {"origem": "tamanho_calca", "tipo": "string"},
+            "tamanho_camisa": {"origem": "tamanho_camisa", "tipo": "string"},
+            "tamanho_calcado": {"origem": "tamanho_calcado", "tipo": "string"},
+            "cns_numero": {"origem": "cns_numero", "tipo": "string"},
+            "observacoes_gerais": {"origem": "observacoes_gerais", "tipo": "string"},
+            # --- FIM CAMPOS EXPANDIDOS S-2200 ---
         }
+    },
     
-    def _extrair_valor_json_com_alternativos(self, json_data: str, definicao_campo: Dict[str, Any]) -> Any:
+    "03_CONVCONTRATOALT": {
+        "fonte_principal": "esocial_s2205",
+        "fontes_adicionais": ["esocial_s2206"],
+        "campos": {
+            # --- CAMPOS PRINCIPAIS MAPEADOS DIRETAMENTE DO BANCO ---
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "2 B-Nome do trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
+            "3 C -Código do contrato": {"origem": "matricula", "tipo": "string"},
+            "4 D-Tipo de transferência": {"origem": "json_data", "caminho_json": ["altContratual", "tpRegJor", "_text"], "tipo": "string"},
+            "5 E-Data da alteração": {"origem": "json_data", "caminho_json": ["alteracao", "dtAlteracao", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "6 F-Alteração registrada em": {"origem": "data_importacao", "tipo": "datetime", "formato": "YYYY-MM-DDTHH:mm:ss"},
+            "7 G-ID do novo empregador": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "codCateg", "_text"], "tipo": "string"},
+            "8 H-Código do novo estabelecimento": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "localTrabalho", "localTrabGeral", "nrInsc", "_text"], "tipo": "string"},
+            "9 I-Código do novo departamento": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "localTrabalho", "localTrabGeral", "descComp", "_text"], "tipo": "string"},
+            "10 J-Código do novo cargo": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "codCargo", "_text"], "tipo": "string"},
+            "11 K-Valor do novo salário": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "remuneracao", "vrSalFx", "_text"], "tipo": "decimal"},
+            "12 L-Tipo do novo salário": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "remuneracao", "undSalFixo", "_text"], "tipo": "string"},
+            "13 M-Código do motivo de reajuste": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "motivoReajuste", "_text"], "tipo": "string"},
+            "14 N-Código da nova jornada de trabalho": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "horContratual", "tpJornada", "_text"], "tipo": "string"},
+            "15 O-Código do novo sindicato": {"origem": "json_data", "caminho_json": ["altContratual", "infoContrato", "sindicato", "cnpjSindicato", "_text"], "tipo": "string"}
+        }
+    },
+    "04_CONVDEPENDENTE": {
+        "fonte_principal": "esocial_dependentes",
+        "fontes_adicionais": [],
+        "campos": {
+            "1 A-ID do empregador": {
+                "origem": "cnpj_empregador",
+                "tipo": "string", 
+                "obrigatorio": True, 
+                "valor_padrao": ""
+            },
+            "2 B  - Código do trabalhador": {
+                "origem": "cpf_trabalhador",
+                "tipo": "string", 
+                "obrigatorio": True, 
+                "valor_padrao": ""
+            },
+            "3 C  - Código do tipo de dependente": {
+                "origem": "tipo_dependente",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "4 D  - Código do dependente": {
+                "origem": "cpf_dependente",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "5 E  - Nome do dependente": {
+                "origem": "nome_dependente",
+                "tipo": "string", 
+                "obrigatorio": True, 
+                "valor_padrao": ""
+            },
+            "6 F  - Início da vigência": {
+                "origem": "json_data",
+                "caminho_json": ["dtIniVig", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "7 G  - Término da vigência": {
+                "origem": "json_data",
+                "caminho_json": ["dtFimVig", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "8 H  - Sexo do dependente": {
+                "origem": "sexo_dependente",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "9 I  - Data de nascimento do dependente": {
+                "origem": "data_nascimento",
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "10 J  - Nome da mãe": {
+                "origem": "json_data",
+                "caminho_json": ["nmMae", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "11 K  - CPF do dependente": {
+                "origem": "cpf_dependente",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "12 L  - Paga salário família": {
+                "origem": "dep_sf",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "13 M  - Data de baixa do salário  família": {
+                "origem": "json_data",
+                "caminho_json": ["dtBaixaSF", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "14 N  - Dependente para IRRF": {
+                "origem": "dep_irrf",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "15 O  - Data de baixa de dependente para IRRF": {
+                "origem": "json_data",
+                "caminho_json": ["dtBaixaIRRF", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "16 P  - Filho deficiente recebe salário família": {
+                "origem": "json_data",
+                "caminho_json": ["defSF", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "17 Q  - Código da cidade de nascimento": {
+                "origem": "json_data",
+                "caminho_json": ["codMunic", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "18 R  - Número da certidão de nascimento do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["numCert", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "19 S  - Nome do cartório de registro": {
+                "origem": "json_data",
+                "caminho_json": ["nmCartorio", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "20 T  - Número de registro": {
+                "origem": "json_data",
+                "caminho_json": ["numReg", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "21 U  - Número no livro de registro": {
+                "origem": "json_data",
+                "caminho_json": ["numLivro", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "22 V  - Número na folha de registro": {
+                "origem": "json_data",
+                "caminho_json": ["numFolha", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "23 W  - Data de registro em cartório": {
+                "origem": "json_data",
+                "caminho_json": ["dtRegCartorio", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "24 X  - Data de entrega do documento": {
+                "origem": "json_data",
+                "caminho_json": ["dtEntDoc", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "25 Y  - Endereço do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["endDep", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "26 Z  - Número de endereço": {
+                "origem": "json_data",
+                "caminho_json": ["numEnd", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "27 AA  - Bairro": {
+                "origem": "json_data",
+                "caminho_json": ["bairro", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "28 AB  - Código da cidade": {
+                "origem": "json_data",
+                "caminho_json": ["codMunic", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "29 AC  - CEP do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["cep", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "30 AD  - Telefone 1 do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["fone1", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "31 AE  - Telefone 2 do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["fone2", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "32 AF  - Observações": {
+                "origem": "descr_dep",
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "33 AG  - Data de registro": {
+                "origem": "json_data",
+                "caminho_json": ["dtRegistro", "_text"],
+                "tipo": "data", 
+                "formato": "YYYY-MM-DD", 
+                "valor_padrao": ""
+            },
+            "34 AH  - Número do cartão nacional de saúde": {
+                "origem": "json_data",
+                "caminho_json": ["numCNS", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "35 AI  - Número da declaração de nascimento vivo": {
+                "origem": "json_data",
+                "caminho_json": ["numDNV", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "36 AJ  - Número do RG do dependente": {
+                "origem": "json_data",
+                "caminho_json": ["numRG", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "37 AK  - Origem": {
+                "origem": "json_data",
+                "caminho_json": ["origem", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            },
+            "38 AL  - Destino": {
+                "origem": "json_data",
+                "caminho_json": ["destino", "_text"],
+                "tipo": "string", 
+                "valor_padrao": ""
+            }
+        }
+    },
+    "05_FERIAS": {
+        "fonte_principal": "esocial_s2230",
+        "filtros": {"tipo_afastamento": "ferias"},
+        "campos": {
+            "1 A-ID do empregador": {
+                "origem": "cnpj_empregador",
+                "caminho_json": ["evtAfastTemp", "ideEmpregador", "nrInsc", "_text"],
+                "tipo": "string",
+                "obrigatorio": True
+            },
+            "2 B-CPF trabalhador": {
+                "origem": "cpf_trabalhador",
+                "caminho_json": ["evtAfastTemp", "ideTrabalhador", "cpfTrab", "_text"],
+                "tipo": "string",
+                "obrigatorio": True
+            },
+            "3 C-Matrícula": {
+                "origem": "matricula",
+                "caminho_json": ["evtAfastTemp", "ideTrabalhador", "matricula", "_text"],
+                "tipo": "string"
+            },
+            "4 D-Data início": {
+                "origem": "data_inicio",
+                "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "5 E-Data fim": {
+                "origem": "data_fim",
+                "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "6 F-Data início do abono": {
+                "origem": "json_data",
+                "caminho_json": ["iniAfastamento", "dtIniAbono", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "7 G-Data fim do abono": {
+                "origem": "json_data",
+                "caminho_json": ["fimAfastamento", "dtFimAbono", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "8 H-Período aquisitivo início": {
+                "origem": "json_data",
+                "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "9 I-Período aquisitivo fim": {
+                "origem": "json_data",
+                "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"],
+                "tipo": "data",
+                "formato": "YYYY-MM-DD"
+            },
+            "10 J-Número de dias de férias": {
+                "origem": "json_data",
+                "caminho_json": ["iniAfastamento", "qtdDiasFerias", "_text"],
+                "tipo": "string"
+            },
+            "11 K-Indicativo de férias coletivas": {
+                "origem": "json_data",
+                "caminho_json": ["iniAfastamento", "indFeriasColetivas", "_text"],
+                "tipo": "string"
+            }
+        }
+    },
+    "06_CONVFICHA": {
+        "fonte_principal": "esocial_s1200",
+        "campos": {
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
+            "2 B-Código do estabelecimento": {"origem": "estabelecimento", "tipo": "string"},
+            "3 C - Código do tipo de cálculo": {"origem": "tipo_calculo", "tipo": "string"},
+            "4 D  - Data do pagamento": {"origem": "data_pagamento", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "5 E  - Data inicial do cálculo": {"origem": "data_inicio_calculo", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "6 F  - Data final do cálculo": {"origem": "data_fim_calculo", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "7 G  - Data de cálculo da folha": {"origem": "data_calculo_folha", "tipo": "data", "formato": "YYYY-MM-DD"},
+            "8 H  - Código do trabalhador": {"origem": "cpf_trabalhador", "tipo": "string"},
+            "9 I  - Nome do trabalhador": {"origem": "nome_trabalhador", "tipo": "string"},
+            "10 J-Código do contrato": {"origem": "matricula", "tipo": "string"},
+            "11 K-Código da categoria": {"origem": "cod_categoria", "tipo": "string"},
+            "12 L-Código da rubrica": {"origem": "codigo_rubrica", "tipo": "string"},
+            "13 M-Descrição da rubrica": {"origem": "descricao_rubrica", "tipo": "string"},
+            "14 N-Código do estabelecimento": {"origem": "estabelecimento", "tipo": "string"},
+            "15 O-Código da lotação tributária": {"origem": "lotacao_tributaria", "tipo": "string"},
+            "16 P-Código da rubrica para o recibo": {"origem": "codigo_rubrica", "tipo": "string"},
+            "17 Q-Descrição da rubrica para o recibo": {"origem": "descricao_rubrica", "tipo": "string"},
+            "18 R-Qtde dependentes para IR": {"origem": "qtd_dep_ir", "tipo": "string"},
+            "19 S  - Qtde dependentes para SF": {"origem": "qtd_dep_sf", "tipo": "string"},
+            "20 T  - Código de exposição à agentes nocivos": {"origem": "cod_exposicao", "tipo": "string"},
+            "21 U  - Grau de insalubridade": {"origem": "grau_insalubridade", "tipo": "string"},
+            "22 V  - Tem periculosidade": {"origem": "tem_periculosidade", "tipo": "string"},
+            "23 W  - Ensejo de aposentadoria especial": {"origem": "ensejo_aposentadoria", "tipo": "string"},
+            "24 X  - Período de referência": {"origem": "periodo_apuracao", "tipo": "string"},
+            "25 Y  - Sigla da rubrica": {"origem": "json_data", "caminho_json": ["cod", "_text"], "tipo": "string"},
+            "26 Z  - Sigla da rubrica para o recibo": {"origem": "json_data", "caminho_json": ["cod", "_text"], "tipo": "string"},
+            "27 AA  - Descrição da rubrica para o recibo": {"origem": "descricao_rubrica", "tipo": "string"},
+            "28 AB  - Razão ou qtde": {"origem": "json_data", "caminho_json": ["qtdRubr", "_text"], "valor_padrao": "1", "tipo": "decimal"},
+            "29 AC  - Valor da rubrica": {"origem": "json_data", "caminho_json": ["vrRubr", "_text"], "tipo": "decimal"},
+            "30 AD  - Classe da rubrica": {"origem": "tipo_rubrica", "valor_padrao": "M", "tipo": "string"},
+            "31 AE  - Período de referência": {"origem": "periodo_apuracao", "tipo": "string"}
+        }
+    },
+    "07_CARGOS": {
+        "fonte_principal": "esocial_s1030",
+        "campos": {
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string"},
+            "2 B-Código do cargo": {"origem": "codigo", "tipo": "string"},
+            "3 C-Nome do cargo": {"origem": "descricao", "tipo": "string"},
+            "4 D-ID do tipo de código": {"origem": "nivel_cargo", "tipo": "string"},
+            "5 E-ID do nível organizacional": {"origem": "nivel_cargo", "tipo": "string"},
+            "6 F-Código do CBO": {"origem": "cbo", "tipo": "string"},
+            "7 G-Início da validade": {"origem": "inicio_validade", "tipo": "string"},
+            "8 H-Término da validade": {"origem": "fim_validade", "tipo": "string"},
+            "9 I-Descrição sumária": {"origem": "desc_sumaria", "tipo": "string"},
+            "10 J-Permite acúmulo de cargo": {"origem": "permite_acumulo", "tipo": "string"},
+            "11 L-Permite contagem especial do acúmulo de cargo": {"origem": "permite_contagem_esp", "tipo": "string"},
+            "12 M-Cargo de dedicação exclusiva": {"origem": "dedicacao_exclusiva", "tipo": "string"},
+            "13 N-Número da Lei que criou e/ou extinguiu e/ou restruturou o": {"origem": "num_lei", "tipo": "string"},
+            "14 O-Data da Lei que criou e/ou extinguiu e/ou restruturou o ca": {"origem": "dt_lei", "tipo": "string"},
+            "15 P-Situação gerada pela Lei": {"origem": "situacao_lei", "tipo": "string"},
+            "16 Q-O cargo tem função": {"origem": "tem_funcao", "tipo": "string"}
+        }
+    },
+    "08_CONVAFASTAMENTO": {
+        "fonte_principal": "esocial_s2230",
+        "campos": {
+            "1 A-ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
+            "2-Nome do trabalhador": {"origem": "cpf_trabalhador", "tipo": "string", "obrigatorio": True},
+            "3-Código do contrato": {"origem": "matricula", "tipo": "string", "obrigatorio": True},
+            "4-Código do motivo de afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "codMotAfast", "_text"], "tipo": "string"},
+            "5-Data inicial de afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "6-Data final de afastamento": {"origem": "json_data", "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "7-Observações do afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "observacao", "_text"], "tipo": "string"},
+            "8-Descrição do motivo de afastamento": {"origem": "descricao_motivo", "tipo": "string"},
+            "9-Mesmo motivo anterior": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMesmoMtv", "_text"], "tipo": "string"},
+            "10-Tipo acidente trânsito": {"origem": "json_data", "caminho_json": ["iniAfastamento", "tpAcidTransito", "_text"], "tipo": "string"},
+            "11-Período aquisitivo início": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "12-Período aquisitivo fim": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "13-Cessão CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "cnpjCess", "_text"], "tipo": "string"},
+            "14-Cessão ônus": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "infOnus", "_text"], "tipo": "string"},
+            "15-Mandato sindical CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "cnpjSind", "_text"], "tipo": "string"},
+            "16-Mandato sindical ônus remuneração": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "infOnusRemun", "_text"], "tipo": "string"},
+            "17-Mandato eletivo CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "cnpjMandElet", "_text"], "tipo": "string"},
+            "18-Mandato eletivo remuneração cargo": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "indRemunCargo", "_text"], "tipo": "string"},
+            "19-Retificação origem": {"origem": "json_data", "caminho_json": ["infoRetif", "origRetif", "_text"], "tipo": "string"},
+            "20-Retificação tipo processo": {"origem": "json_data", "caminho_json": ["infoRetif", "tpProc", "_text"], "tipo": "string"},
+            "21-Retificação número processo": {"origem": "json_data", "caminho_json": ["infoRetif", "nrProc", "_text"], "tipo": "string"}
+        }
+    },
+    "09_CONVATESTADO": {
+        "fonte_principal": "esocial_s2230",
+        "campos": {
+            "1 - ID do empregador": {"origem": "cnpj_empregador", "tipo": "string", "obrigatorio": True},
+            "9 - Código de identificação do contrato": {"origem": "matricula", "tipo": "string", "obrigatorio": True},
+            "2 - Data da consulta": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "dtDiagnostico", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "4 - Data inicial": {"origem": "json_data", "caminho_json": ["iniAfastamento", "dtIniAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "6 - Data final": {"origem": "json_data", "caminho_json": ["fimAfastamento", "dtTermAfast", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "8 - Qtde de dias do atestado": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "qtdDiasAfast", "_text"], "tipo": "string"},
+            "10 - Código CID": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "codCID", "_text"], "tipo": "string"},
+            "11 - MedicoTpCons": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "tpConsulta", "_text"], "tipo": "string"},
+            "12 - Número de inscrição do médico": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "emitente", "nrOC", "_text"], "tipo": "string"},
+            "13 - UF do CRM do médico": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoAtestado", 0, "emitente", "ufOC", "_text"], "tipo": "string"},
+            "14 - Mesmo motivo anterior": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMesmoMtv", "_text"], "tipo": "string"},
+            "15 - Tipo acidente trânsito": {"origem": "json_data", "caminho_json": ["iniAfastamento", "tpAcidTransito", "_text"], "tipo": "string"},
+            "16 - Observações do afastamento": {"origem": "json_data", "caminho_json": ["iniAfastamento", "observacao", "_text"], "tipo": "string"},
+            "17 - Período aquisitivo início": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtInicio", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "18 - Período aquisitivo fim": {"origem": "json_data", "caminho_json": ["iniAfastamento", "perAquis", "dtFim", "_text"], "tipo": "data", "formato": "YYYY-MM-DD"},
+            "19 - Cessão CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "cnpjCess", "_text"], "tipo": "string"},
+            "20 - Cessão ônus": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoCessao", "infOnus", "_text"], "tipo": "string"},
+            "21 - Mandato sindical CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "cnpjSind", "_text"], "tipo": "string"},
+            "22 - Mandato sindical ônus remuneração": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandSind", "infOnusRemun", "_text"], "tipo": "string"},
+            "23 - Mandato eletivo CNPJ": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "cnpjMandElet", "_text"], "tipo": "string"},
+            "24 - Mandato eletivo remuneração cargo": {"origem": "json_data", "caminho_json": ["iniAfastamento", "infoMandElet", "indRemunCargo", "_text"], "tipo": "string"},
+            "25 - Retificação origem": {"origem": "json_data", "caminho_json": ["infoRetif", "origRetif", "_text"], "tipo": "string"},
+            "26 - Retificação tipo processo": {"origem": "json_data", "caminho_json": ["infoRetif", "tpProc", "_text"], "tipo": "string"},
+            "27 - Retificação número processo": {"origem": "json_data", "caminho_json": ["infoRetif", "nrProc", "_text"], "tipo": "string"}
+        }
+    },
+}
+
+for _mapeamento in _MAPEAMENTOS.values():
+    _mapeamento["campos"] = {
+        campo: _criar_definicao_campo(definicao)
+        for campo, definicao in _mapeamento["campos"].items()
+    }
+
+# Somente leitura: as definições e extratores acima dependem do mapeamento inalterado
+_MAPEAMENTOS = _congelar(_MAPEAMENTOS)
+
+
+def _indexar_campos(campos: Mapping[str, DefinicaoCampo]
+                    ) -> Tuple[Dict[str, None], Dict[str, List[str]], List[Tuple[str, DefinicaoCampo]]]:
+    """
+    Monta os índices usados por projetar_registro para os campos de um template
+    
+    Args:
+        campos: Definições dos campos do template
+        
+    Returns:
+        Tupla (projeção vazia campo -> None na ordem do template, coluna do banco ->
+        campos que a consomem, campos lidos do json_data com suas definições)
+    """
+    por_origem: Dict[str, List[str]] = {}
+    campos_json: List[Tuple[str, DefinicaoCampo]] = []
+    for campo, definicao in campos.items():
+        if definicao.origem == "json_data":
+            campos_json.append((campo, definicao))
+        else:
+            por_origem.setdefault(definicao.origem, []).append(campo)
+    return dict.fromkeys(campos), por_origem, campos_json
+
+
+# Índices dos templates de _MAPEAMENTOS, montados uma única vez, junto aos campos de
+# que foram derivados
+_INDICES_CAMPOS = {
+    template: (mapeamento["campos"], _indexar_campos(mapeamento["campos"]))
+    for template, mapeamento in _MAPEAMENTOS.items()
+}
+
+
+class MapeadorCamposEmpresa:
+    """
+    Mapeador de campos entre dados eSocial e templates da Empresa
+    """
+    
+    def __init__(self):
+        """Inicializa o mapeador com as definições de campo"""
+        self.mapeamentos = self._definir_mapeamentos()
+        # Índices de projetar_registro por template; refeitos se os campos do template mudarem
+        self._indices_campos = dict(_INDICES_CAMPOS)
+        # Último json_data carregado: os campos de um mesmo registro são lidos em sequência
+        self._ultimo_json_texto: Optional[str] = None
+        self._ultimo_json_dados: Any = None
+    
+    def _definir_mapeamentos(self) -> Mapping[str, Mapping]:
+        """
+        Define os mapeamentos entre campos eSocial e templates Empresa
+        
+        Returns:
+            Mapeamentos por template (_MAPEAMENTOS, somente leitura e
+            compartilhado entre as instâncias)
+        """
+        return _MAPEAMENTOS
+    
+    def _extrair_valor_json_com_alternativos(self, json_data: str, definicao_campo: DefinicaoCampo) -> Any:
         """
         Extrai valor de um campo JSON usando caminho principal e alternativos, com fallback para valor padrão.
         """
-        caminhos = []
-        if "caminho_json" in definicao_campo:
-            caminhos.append(definicao_campo["caminho_json"])
-        caminhos += definicao_campo.get("caminho_json_alternativos", [])
-        for caminho in caminhos:
-            valor = self._extrair_valor_json(json_data, caminho)
-            if valor is not None and (not isinstance(valor, str) or valor.strip()):
+        extrator = definicao_campo.extrator
+        if extrator is None:
+            caminhos = definicao_campo.caminho_json_alternativos
+            if definicao_campo.caminho_json is not None:
+                caminhos = (definicao_campo.caminho_json,) + caminhos
+            if not caminhos:
+                return definicao_campo.valor_padrao
+            extrator = _compilar_extrator(caminhos)
+        if json_data:
+            dados = self._carregar_json(json_data) if isinstance(json_data, str) else json_data
+            valor = extrator(dados)
+            if valor is not None:
                 return valor
         # Fallback para valor padrão
-        return definicao_campo.get("valor_padrao", None)
+        return definicao_campo.valor_padrao
+
+    def _carregar_json(self, json_texto: str) -> Any:
+        """
+        Carrega o json_data de um registro, reaproveitando o resultado da chamada anterior
+        quando o texto é o mesmo (um registro é carregado uma vez, não uma vez por campo)
+        
+        Args:
+            json_texto: String JSON do registro
+            
+        Returns:
+            JSON carregado (não deve ser alterado) ou None se inválido
+        """
+        if json_texto != self._ultimo_json_texto:
+            try:
+                dados = json.loads(json_texto)
+            except json.JSONDecodeError:
+                dados = None
+            self._ultimo_json_texto = json_texto
+            self._ultimo_json_dados = dados
+        return self._ultimo_json_dados
 
     def obter_valor_campo(self, template: str, campo: str, registro_bd: Dict[str, Any]) -> Any:
         """
@@ -1320,11 +1386,46 @@ class MapeadorCamposEmpresa:
             return None
         definicao_campo = mapeamento_template["campos"][campo]
         # Obter valor baseado na origem
-        if definicao_campo["origem"] == "json_data":
+        if definicao_campo.origem == "json_data":
             json_str = registro_bd.get("json_data") or ""
             return self._extrair_valor_json_com_alternativos(json_str, definicao_campo)
         else:
-            return registro_bd.get(definicao_campo["origem"])
+            return registro_bd.get(definicao_campo.origem)
+    
+    def projetar_registro(self, template: str, registro_bd: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Obtém os valores de todos os campos do template para um registro, com o mesmo
+        resultado de obter_valor_campo campo a campo: cada coluna do banco é lida uma vez
+        e distribuída aos campos que a consomem
+        
+        Os campos vêm de self.mapeamentos. Os índices são refeitos quando o dicionário de
+        campos de um template é substituído; alterações feitas nele sem substituí-lo não
+        são detectadas.
+        
+        Args:
+            template: Nome do template
+            registro_bd: Registro do banco de dados
+            
+        Returns:
+            Dicionário campo -> valor, na ordem do mapeamento (vazio se o template não existe)
+        """
+        if template not in self.mapeamentos:
+            return {}
+        campos_template = self.mapeamentos[template]["campos"]
+        indexado = self._indices_campos.get(template)
+        if indexado is None or indexado[0] is not campos_template:
+            indexado = self._indices_campos[template] = (campos_template, _indexar_campos(campos_template))
+        projecao_vazia, por_origem, campos_json = indexado[1]
+        projecao = projecao_vazia.copy()
+        for origem, campos in por_origem.items():
+            valor = registro_bd.get(origem)
+            if valor is not None:
+                for campo in campos:
+                    projecao[campo] = valor
+        json_str = registro_bd.get("json_data") or ""
+        for campo, definicao_campo in campos_json:
+            projecao[campo] = self._extrair_valor_json_com_alternativos(json_str, definicao_campo)
+        return projecao
     
     def _extrair_valor_json(self, json_data: str, caminho: List[str]) -> Any:
         """
@@ -1811,21 +1912,21 @@ class MapeadorCamposEmpresa:
         mapeamento = self.mapeamentos[template]
         
         for campo, definicao in mapeamento.get("campos", {}).items():
-            if definicao.get("obrigatorio", False):
+            if definicao.obrigatorio:
                 valor = self.obter_valor_campo(template, campo, registro_bd)
                 if valor is None or (isinstance(valor, str) and not valor.strip()):
                     campos_ausentes.append(campo)
                     
         return campos_ausentes
     
-    def formatar_valor(self, valor: Any, definicao_campo: Dict[str, Any]) -> Any:
+    def formatar_valor(self, valor: Any, definicao_campo: DefinicaoCampo) -> Any:
         """
         Formata um valor de acordo com a definição do campo (padrão Empresa: datas DD/MM/YYYY, números 2 casas e vírgula)
         """
         if valor is None:
             return None
-        tipo = definicao_campo.get("tipo", "string")
-        formato = definicao_campo.get("formato")
+        tipo = definicao_campo.tipo
+        formato = definicao_campo.formato
         from datetime import datetime
         try:
             if tipo == "string":
@@ -1982,7 +2083,7 @@ class MapeadorCamposEmpresa:
             return True
             
         definicao_campo = mapeamento_template["campos"][campo]
-        valores_validos = definicao_campo.get("valores_validos")
+        valores_validos = definicao_campo.valores_validos
         
         if valores_validos and valor is not None:
             return str(valor) in valores_validos
@@ -2007,15 +2108,15 @@ class MapeadorCamposEmpresa:
         
         stats = {
             "total_campos": len(campos),
-            "campos_obrigatorios": len([c for c in campos.values() if c.get("obrigatorio", False)]),
-            "campos_com_json_path": len([c for c in campos.values() if "caminho_json" in c]),
-            "campos_com_validacao": len([c for c in campos.values() if "valores_validos" in c]),
+            "campos_obrigatorios": len([c for c in campos.values() if c.obrigatorio]),
+            "campos_com_json_path": len([c for c in campos.values() if c.caminho_json is not None]),
+            "campos_com_validacao": len([c for c in campos.values() if c.valores_validos is not None]),
             "tipos_de_dados": {}
         }
         
         # Contar tipos de dados
         for campo in campos.values():
-            tipo = campo.get("tipo", "string")
+            tipo = campo.tipo
             stats["tipos_de_dados"][tipo] = stats["tipos_de_dados"].get(tipo, 0) + 1
             
         return stats
@@ -2159,15 +2260,15 @@ class MapeadorCamposEmpresa:
         
         relatorio.append("=== CAMPOS OBRIGATÓRIOS ===")
         campos = mapeamento.get("campos", {})
-        obrigatorios = [nome for nome, def_campo in campos.items() if def_campo.get("obrigatorio", False)]
+        obrigatorios = [nome for nome, def_campo in campos.items() if def_campo.obrigatorio]
         for campo in obrigatorios:
             relatorio.append(f"- {campo}")
         relatorio.append("")
         
         relatorio.append("=== CAMPOS SEM JSON PATH ===")
-        sem_path = [nome for nome, def_campo in campos.items() if "caminho_json" not in def_campo]
+        sem_path = [nome for nome, def_campo in campos.items() if def_campo.caminho_json is None]
         for campo in sem_path:
-            relatorio.append(f"- {campo}: {campos[campo].get('origem', 'N/A')}")
+            relatorio.append(f"- {campo}: {campos[campo].origem}")
         
         return "\n".join(relatorio)
     
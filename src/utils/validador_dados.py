@@ -5,8 +5,11 @@ Módulo para validação de dados do eSocial
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union, Tuple
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Padrões de validação comuns
@@ -15,10 +18,15 @@ PADRAO_CNPJ = r'^\d{14}$'
 PADRAO_DATA = r'^\d{4}-\d{2}-\d{2}$'
 PADRAO_PIS = r'^\d{11}$'
 
+# Tamanho do cache de documentos já validados: o CNPJ do empregador se repete em
+# todos os registros, e CPFs de trabalhadores e dependentes em vários eventos
+TAMANHO_CACHE_DOCUMENTOS = 65536
+
 class ValidadorDados:
     """Classe para validação de dados do eSocial antes de inserção ou processamento"""
     
     @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE_DOCUMENTOS)
     def validar_cpf(cpf: str) -> bool:
         """
         Valida se o CPF tem formato válido
@@ -67,6 +75,7 @@ class ValidadorDados:
         return True
     
     @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE_DOCUMENTOS)
     def validar_cnpj(cnpj: str) -> bool:
         """
         Valida se o CNPJ tem formato válido
@@ -135,7 +144,7 @@ class ValidadorDados:
             return True  # Data vazia é considerada válida (pode ser um campo opcional)
             
         # Verificar formato
-        if not re.match(PADRAO_DATA, data_str):
+        if not re.fullmatch(PADRAO_DATA, data_str):
             return False
             
         # Verificar se é uma data válida
@@ -338,6 +347,47 @@ class ValidadorDados:
         
         return (len(erros) == 0, erros)
     
+    @classmethod
+    def validar_s1030_df(cls, df: pd.DataFrame) -> pd.Series:
+        """
+        Valida em lote, coluna a coluna, registros S-1030 (Tabela de Cargos)
+        
+        Aplica as mesmas regras de validar_registro_s1030 sobre todas as linhas de
+        uma vez. Apenas as linhas marcadas como inválidas precisam passar pela
+        validação registro a registro, que produz as mensagens de erro.
+        
+        Args:
+            df: DataFrame com as colunas dos registros S-1030
+            
+        Returns:
+            Série booleana, alinhada ao índice do DataFrame, indicando as linhas válidas
+        """
+        def coluna(nome):
+            if nome not in df:
+                return pd.Series('', index=df.index)
+            return df[nome].fillna('').astype(str)
+        
+        def datas_validas(datas):
+            convertidas = pd.to_datetime(datas.where(datas.str.fullmatch(PADRAO_DATA), ''),
+                                         format="%Y-%m-%d", errors='coerce')
+            anos_validos = convertidas.dt.year.between(1900, datetime.now().year + 1)
+            return datas.eq('') | anos_validos
+        
+        codigo = coluna('codigo')
+        cbo = coluna('cbo')
+        inicio_validade = coluna('inicio_validade')
+        fim_validade = coluna('fim_validade')
+        cnpj = coluna('cnpj_empregador')
+        
+        validos = codigo.ne('') & cbo.str.len().isin((0, 6))
+        validos &= datas_validas(inicio_validade) & datas_validas(fim_validade)
+        validos &= fim_validade.eq('') | inicio_validade.eq('') | fim_validade.ge(inicio_validade)
+        
+        # O CNPJ se repete em todas as linhas de um arquivo: cada valor distinto é validado uma vez
+        cnpjs_validos = {valor: not valor or cls.validar_cnpj(valor) for valor in cnpj.unique()}
+        validos &= cnpj.map(cnpjs_validos).astype(bool)
+        return validos
+    
     @classmethod
     def validar_registro_s2299(cls, dados: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -375,6 +425,34 @@ class ValidadorDados:
         
         return (len(erros) == 0, erros)
     
+    @classmethod
+    def registro_s2299_valido(cls, dados: Dict[str, Any]) -> bool:
+        """
+        Verifica se um registro S-2299 passa em validar_registro_s2299, sem montar mensagens
+        
+        Aplica as mesmas regras, retornando na primeira falha; a data, a verificação
+        mais cara, fica por último.
+        
+        Args:
+            dados: Dicionário com os dados a serem validados
+            
+        Returns:
+            True se o registro for válido, False caso contrário
+        """
+        data_desligamento = dados.get('data_desligamento', '')
+        if not data_desligamento or not dados.get('motivo_desligamento', ''):
+            return False
+        
+        cpf = dados.get('cpf_trabalhador', '')
+        if cpf and not cls.validar_cpf(cpf):
+            return False
+        
+        cnpj = dados.get('cnpj_empregador', '')
+        if cnpj and not cls.validar_cnpj(cnpj):
+            return False
+        
+        return cls.validar_data(data_desligamento)
+    
     @classmethod
     def sanitizar_dados(cls, dados: Dict[str, Any], tipo_registro: str) -> Dict[str, Any]:
         """
@@ -428,9 +506,12 @@ class ValidadorDados:
             # Sanitizar valores monetários
             for campo in ['valor_rescisao', 'valor_multa_fgts']:
                 if campo in dados and dados[campo]:
+                    valor = dados[campo]
+                    # Valores já convertidos pelo processador dispensam a ida e volta por str
+                    if isinstance(valor, float):
+                        continue
                     try:
-                        valor = float(str(dados[campo]).replace(',', '.'))
-                        dados_sanitizados[campo] = valor
+                        dados_sanitizados[campo] = float(str(valor).replace(',', '.'))
                     except (ValueError, TypeError):
                         dados_sanitizados[campo] = 0.0
         
@@ -261,6 +261,11 @@ class TestConfiguracoes:
         assert str(self.config.CAMINHO_ENTRADA) == '/tmp/novo/input'
         assert str(self.config.CAMINHO_SAIDA) == '/tmp/novo/output'
         assert str(self.config.CAMINHO_BANCO_DADOS) == '/tmp/novo/db.db'
+        assert self.config.CONFIG_PROCESSAMENTO['processamento_paralelo'] is False
+        
+        self.config.atualizar_de_args({'processos': 4})
+        assert self.config.CONFIG_PROCESSAMENTO['processamento_paralelo'] is True
+        assert self.config.CONFIG_PROCESSAMENTO['num_processos'] == 4
 
     def test_atualizar_log_level(self):
         """Testa atualização do nível de log"""
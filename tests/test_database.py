@@ -72,3 +72,18 @@ class TestDatabase:
         assert len(resultado) == 2
         assert resultado[0]['codigo'] == 'C001'
         assert resultado[1]['codigo'] == 'C002'
+    
+    def test_insert_data_em_lotes(self):
+        """Testa a inserção em massa com vários comandos de múltiplas linhas"""
+        dados = [
+            {'periodo_apuracao': '2024-01', 'cpf_trabalhador': '12345678901', 'codigo_rubrica': f'R{i}',
+             'valor_rubrica': str(i)}
+            for i in range(2500)
+        ]
+        
+        assert self.db.inserir_dados('esocial_s1200', dados) == 2500
+        
+        resultado = self.db.executar_query(
+            "SELECT COUNT(*) AS total, SUM(valor_rubrica) AS soma FROM esocial_s1200")
+        assert resultado[0]['total'] == 2500
+        assert resultado[0]['soma'] == sum(range(2500))
@@ -64,6 +64,27 @@ class TestExportadorGenerico:
         assert resultado[0]['campo_texto'] == 'Texto teste'  # Mantem como esta
         assert resultado[0]['campo_sem_formato'] == 'Valor sem formato'  # Sem formato
     
+    def test_exportar_parquet(self, tmp_path):
+        """Testa a exportação de uma consulta para Parquet, ou a recusa sem o pyarrow"""
+        from exportadores import exportador_generico
+        
+        self.exportador.caminho_saida = tmp_path
+        self.mock_db.executar_query.return_value = [
+            {'cpf_trabalhador': '12345678901', 'valor_rubrica': 1500.5},
+            {'cpf_trabalhador': '98765432100', 'valor_rubrica': 0.0},
+        ]
+        
+        resultado = self.exportador.exportar_parquet("SELECT * FROM esocial_s1200", "s1200.parquet")
+        
+        assert resultado == exportador_generico.PARQUET_DISPONIVEL
+        if resultado:
+            import pandas as pd
+            df = pd.read_parquet(tmp_path / "s1200.parquet")
+            assert list(df['cpf_trabalhador']) == ['12345678901', '98765432100']
+        else:
+            assert not (tmp_path / "s1200.parquet").exists()
+            self.mock_db.executar_query.assert_not_called()
+    
     def test_exportar_para_csv(self):
         """Testa exportação para CSV"""
         dados = [
@@ -12,6 +12,8 @@ import tempfile
 # Adicionar diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.mapeador_campos_empresa import DefinicaoCampo
+
 try:
     from exportadores.exportador_templates_empresa import ExportadorTemplatesEmpresa
 except ImportError:
@@ -202,6 +204,14 @@ class TestExportadorTemplatesEmpresa:
         assert self.exportador._formatar_valor(2.5) == '2,50'  # Formato brasileiro
         assert self.exportador._formatar_valor(' abc ') == 'abc'
         assert self.exportador._formatar_valor({'x': 1}) == "{'x': 1}"
+    def test_extrair_valor_json_recursivo(self):
+        """Testa extração de valores JSON com caminhos compilados e sob demanda"""
+        dados = {'evtAdmissao': {'trabalhador': {'cpfTrab': {'_text': '12345678901'}, 'sexo': 'M'}}}
+        assert self.exportador._extrair_valor_json_recursivo(dados, ['evtAdmissao', 'trabalhador', 'cpfTrab']) == '12345678901'
+        assert self.exportador._extrair_valor_json_recursivo(dados, ['evtAdmissao', 'trabalhador', 'sexo']) == 'M'
+        assert self.exportador._extrair_valor_json_recursivo(dados, ['evtAdmissao', 'inexistente']) is None
+        assert self.exportador._extrair_valor_json_recursivo(dados, ['evtAdmissao', 'trabalhador', 'sexo', 'x']) is None
+        assert self.exportador._extrair_valor_json_recursivo({}, ['evtAdmissao']) is None
     def test_integracao_exportacao_todos_templates(self):
         """Testa integração/exportação real de todos os templates obrigatórios com dados simulados"""
         # Simula dados reais para cada template (reduzido para economizar espaço)
@@ -322,7 +332,7 @@ def test_exporta_trabalhador_multiversao(caplog, versao, colunas, obrigatorios,
         mock_config.COLUNAS_TEMPLATES = {'01_CONVTRABALHADOR.csv': colunas}
         class MapeadorMock:
             def obter_mapeamento_template(self, chave):
-                return {'campos': {c: {'obrigatorio': c in obrigatorios} for c in colunas}}
+                return {'campos': {c: DefinicaoCampo(origem=c, obrigatorio=c in obrigatorios) for c in colunas}}
         exportador = ExportadorTemplatesEmpresa(mock_bd, mock_config)
         exportador.mapeador = MapeadorMock()
         nome = '01_CONVTRABALHADOR.csv'
@@ -295,6 +295,18 @@ class TestGerenciadorBancoDadosAvancado:
         
         assert registros_inseridos == 0
 
+    def test_inserir_linhas(self):
+        """Testa inserção de registros já organizados em tuplas de valores"""
+        colunas = ('cpf_trabalhador', 'nome_trabalhador')
+        linhas = [('12345678901', 'João'), ('98765432100', 'Maria')]
+        
+        assert self.gerenciador.inserir_linhas('esocial_s2200', colunas, linhas) == 2
+        assert self.gerenciador.inserir_linhas('esocial_s2200', colunas, []) == 0
+        
+        resultado = self.gerenciador.executar_query(
+            "SELECT cpf_trabalhador, nome_trabalhador FROM esocial_s2200 ORDER BY cpf_trabalhador")
+        assert [(r['cpf_trabalhador'], r['nome_trabalhador']) for r in resultado] == sorted(linhas)
+
     def test_inserir_dados_tabela_inexistente(self):
         """Testa inserção em tabela inexistente"""
         dados = {'id': 1, 'nome': 'João'}
@@ -3,6 +3,7 @@ Teste de integração: Importação de XMLs do eSocial para SQLite
 """
 
 import sys
+import shutil
 import pytest
 from pathlib import Path
 from banco_dados.gerenciador_banco_dados import GerenciadorBancoDados
@@ -57,6 +58,47 @@ def test_importa_xml_para_sqlite(processador, banco_memoria, xml_file, tabela, c
         resultado = banco_memoria.executar_query(f"SELECT * FROM {tabela}")
         assert len(resultado) == esperado_count, f"Registros esperados: {esperado_count}, encontrados: {len(resultado)} em {tabela} após importação do XML"
 
+def test_processamento_paralelo_equivale_ao_sequencial(tmp_path):
+    """Testa que o processamento paralelo do diretório grava os mesmos registros que o sequencial"""
+    diretorio = tmp_path / "xml"
+    shutil.copytree(Path(__file__).parent / "data" / "xml", diretorio)
+    # Lotes com um evento válido e um sem infoLotacao: os registros do evento válido são mantidos
+    conteudo = (diretorio / "S-1020.xml").read_text(encoding="utf-8")
+    fim = conteudo.index("</eSocial>")
+    evento_sem_lotacao = '<evtTabLotacao Id="ID0"><ideEmpregador><nrInsc>1</nrInsc></ideEmpregador></evtTabLotacao>'
+    for numero in (1, 2):
+        (diretorio / f"S-1020_lote{numero}.xml").write_text(
+            conteudo[:fim] + evento_sem_lotacao + conteudo[fim:], encoding="utf-8")
+    tabelas = ["esocial_s1020", "esocial_s1030", "esocial_s1200", "esocial_s2200",
+               "esocial_s2205", "esocial_s2206", "esocial_s2230", "esocial_dependentes"]
+    contagens = []
+    for paralelo in (False, True):
+        config = Configuracoes()
+        config.CONFIG_PROCESSAMENTO = dict(config.CONFIG_PROCESSAMENTO, processamento_paralelo=paralelo, num_processos=2)
+        db = GerenciadorBancoDados(Path(":memory:"))
+        try:
+            processados = ProcessadorXML(db, config).processar_diretorio(diretorio)
+            contagens.append((processados, [len(db.executar_query(f"SELECT * FROM {tabela}")) for tabela in tabelas]))
+        finally:
+            db.close()
+    assert contagens[0] == contagens[1]
+    assert contagens[0][0] > 0
+
+def test_insercoes_em_lote_entre_arquivos():
+    """Testa que processar_diretorio grava os registros de vários arquivos em uma chamada por tabela"""
+    from unittest.mock import MagicMock
+    diretorio = Path(__file__).parent / "data" / "xml"
+    bd = MagicMock(spec=GerenciadorBancoDados)
+    bd.inserir_linhas.side_effect = lambda tabela, colunas, linhas: len(linhas)
+    processador = ProcessadorXML(bd, {'tamanho_lote': 100000})
+    
+    assert processador.processar_diretorio(diretorio) > 0
+    
+    chamadas = [(args[0], args[1]) for args, _ in bd.inserir_linhas.call_args_list]
+    assert chamadas
+    assert len(chamadas) == len(set(chamadas))
+    assert processador._total_pendente == 0
+
 # Teste para layouts futuros/opcionais (exemplo S-1010, S-1050, S-1070)
 import pytest
 @pytest.mark.parametrize("xml_file, tabela", [
@@ -8,11 +8,13 @@ import os
 import json
 from pathlib import Path
 
+import pytest
+
 # Adicionar diretório src ao path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from src.utils.mapeador_campos_empresa import MapeadorCamposEmpresa
+from src.utils.mapeador_campos_empresa import DefinicaoCampo, MapeadorCamposEmpresa
 from banco_dados.gerenciador_banco_dados import GerenciadorBancoDados
 from configuracao.configuracoes import Configuracoes
 
@@ -115,6 +117,107 @@ def test_mapeamento_json_structure():
     print("   Estrutura JSON funcionando corretamente")
 
 
+def test_mapeamentos_compartilhados():
+    """Testa que o mapeamento estático é montado uma única vez e compartilhado entre instâncias"""
+    primeiro = MapeadorCamposEmpresa()
+    segundo = MapeadorCamposEmpresa()
+    
+    assert primeiro.mapeamentos is segundo.mapeamentos
+    assert "01_CONVTRABALHADOR" in primeiro.listar_templates()
+    
+    with pytest.raises(TypeError):
+        primeiro.mapeamentos["01_CONVTRABALHADOR"]["campos"]["novo campo"] = None
+
+
+def test_mapeamento_sem_chaves_duplicadas():
+    """Testa que nenhum dicionário literal do mapeamento repete chaves (a última sobrescreveria as anteriores)"""
+    import ast
+    from collections import Counter
+    
+    caminho = project_root / "src" / "utils" / "mapeador_campos_empresa.py"
+    arvore = ast.parse(caminho.read_text(encoding="utf-8"))
+    duplicadas = []
+    for no in ast.walk(arvore):
+        if isinstance(no, ast.Dict):
+            contagem = Counter(chave.value for chave in no.keys if isinstance(chave, ast.Constant))
+            duplicadas += [chave for chave, total in contagem.items() if total > 1]
+    
+    assert duplicadas == []
+
+
+def test_definicoes_campo():
+    """Testa que as definições de campo são DefinicaoCampo com caminhos em tuplas"""
+    campos = MapeadorCamposEmpresa().mapeamentos["01_CONVTRABALHADOR"]["campos"]
+    
+    cpf = campos["3 C-CPF trabalhador"]
+    assert isinstance(cpf, DefinicaoCampo)
+    assert cpf.origem == "json_data"
+    assert cpf.obrigatorio is True
+    assert cpf.caminho_json == ("evtAdmissao", "trabalhador", "cpfTrab", "_text")
+    assert ("cpfTrab", "_text") in cpf.caminho_json_alternativos
+    nome = campos["4 D-Nome trabalhador"]
+    assert nome.caminho_json[0] is cpf.caminho_json[0]
+    assert nome.caminho_json[-1] is cpf.caminho_json_alternativos[-1][-1]
+    
+    empregador = campos["1 A-ID do empregador"]
+    assert empregador.caminho_json is None
+    assert empregador.valor_padrao is None
+    assert campos["10 J-Sexo trabalhador"].valores_validos == ("M", "F")
+
+
+def test_extrator_compilado_com_alternativos():
+    """Testa que o extrator compilado tenta os caminhos alternativos em ordem"""
+    mapeador = MapeadorCamposEmpresa()
+    cpf = mapeador.mapeamentos["01_CONVTRABALHADOR"]["campos"]["3 C-CPF trabalhador"]
+    
+    assert cpf.extrator({"evtAdmissao": {"trabalhador": {"cpfTrab": {"_text": "111"}}}}) == "111"
+    assert cpf.extrator({"trabalhador": {"cpfTrab": {"_text": " "}, "cpf": {"_text": "222"}}}) == "222"
+    assert cpf.extrator({"outro": {}}) is None
+    assert mapeador._extrair_valor_json_com_alternativos('{"cpf": {"_text": "333"}}', cpf) == "333"
+    assert mapeador._extrair_valor_json_com_alternativos("json inválido", cpf) == ""
+
+
+def test_json_carregado_uma_vez_por_registro(monkeypatch):
+    """Testa que o json_data de um registro é carregado uma única vez para todos os campos"""
+    mapeador = MapeadorCamposEmpresa()
+    registro = {"json_data": json.dumps({"evtAdmissao": {"trabalhador": {
+        "cpfTrab": {"_text": "12345678901"}, "nmTrab": {"_text": "Fulano"}}}})}
+    chamadas = []
+    carregar = json.loads
+    monkeypatch.setattr(json, "loads", lambda texto: chamadas.append(texto) or carregar(texto))
+    
+    assert mapeador.obter_valor_campo("01_CONVTRABALHADOR", "3 C-CPF trabalhador", registro) == "12345678901"
+    assert mapeador.obter_valor_campo("01_CONVTRABALHADOR", "4 D-Nome trabalhador", registro) == "Fulano"
+    assert len(chamadas) == 1
+
+
+def test_projetar_registro_equivale_a_obter_valor_campo():
+    """Testa que a projeção do registro coincide com a leitura campo a campo"""
+    mapeador = MapeadorCamposEmpresa()
+    registro = {
+        "cnpj_empregador": "12345678000199",
+        "sexo": "F",
+        "json_data": json.dumps({"evtAdmissao": {"trabalhador": {"cpfTrab": {"_text": "12345678901"}}}}),
+    }
+    
+    for template in mapeador.listar_templates():
+        projecao = mapeador.projetar_registro(template, registro)
+        campos = mapeador.mapeamentos[template]["campos"]
+        assert list(projecao) == list(campos)
+        for campo in campos:
+            assert projecao[campo] == mapeador.obter_valor_campo(template, campo, registro)
+    
+    assert mapeador.projetar_registro("TEMPLATE_INEXISTENTE", registro) == {}
+    
+    # Mapeamentos substituídos na instância também são seguidos pela projeção
+    mapeador.mapeamentos = {"TESTE": {"campos": {
+        "Sexo": DefinicaoCampo(origem="sexo"),
+        "CPF": DefinicaoCampo(origem="json_data", caminho_json=("evtAdmissao", "trabalhador", "cpfTrab")),
+    }}}
+    assert mapeador.projetar_registro("TESTE", registro) == {"Sexo": "F", "CPF": "12345678901"}
+    assert mapeador.projetar_registro("01_CONVTRABALHADOR", registro) == {}
+
+
 if __name__ == "__main__":
     # Detectar se está sendo executado como script ou teste
     if len(sys.argv) > 1 and sys.argv[1] == "--test":
@@ -13,7 +13,8 @@ import xml.etree.ElementTree as ET
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Importar o processador de XML
-from processadores.processador_xml import ProcessadorXML, identificar_layout
+from processadores.processador_xml import ProcessadorXML, identificar_layout, identificar_layout_arquivo
+from banco_dados.gerenciador_banco_dados import GerenciadorBancoDados
 
 # Only include supported layouts in the test
 ESOCIAL_EVENT_PATTERNS = {
@@ -106,8 +107,8 @@ class TestProcessadorXML:
         # Testar processamento
         resultado = self.processador._processar_arquivo(xml_path)
         
-        # Verificar se o processamento foi bem-sucedido
-        assert resultado is True
+        # Verificar se o processamento foi bem-sucedido e retornou o layout do arquivo
+        assert resultado == "S-2200"
         
         # Verificar se o handler correto foi chamado
         assert self.processador.processadores["S-2200"].called
@@ -143,3 +144,131 @@ class TestProcessadorXML:
             
             # O layout deve ser reconhecido independente da versão
             assert layout is not None, f"Falhou na versão {version}"
+
+    def test_json_data_opcional(self):
+        """Testa que json_data deixa de ser gerado quando 'armazenar_json' está desabilitado"""
+        for xml_file, tabela_esperada in (("S-1020.xml", "esocial_s1020"),
+                                          ("S-1200.xml", "esocial_s1200"),
+                                          ("S-2200.xml", "esocial_s2200")):
+            xml_path = self.dir_teste / xml_file
+            if not xml_path.exists():
+                pytest.skip("Arquivo XML de teste não encontrado")
+            
+            for armazenar_json in (True, False):
+                mock_bd = MagicMock(spec=GerenciadorBancoDados)
+                mock_bd.inserir_linhas.side_effect = lambda tabela, colunas, linhas: len(linhas)
+                processador = ProcessadorXML(mock_bd, {'armazenar_json': armazenar_json})
+                assert processador.processar_arquivo(str(xml_path))
+                
+                registros = [dict(zip(chamada.args[1], linha)) for chamada in mock_bd.inserir_linhas.call_args_list
+                             if chamada.args[0] == tabela_esperada for linha in chamada.args[2]]
+                assert registros
+                assert all((registro['json_data'] is not None) == armazenar_json for registro in registros)
+    
+    def test_elemento_para_dict_reaproveita_subarvores(self):
+        """Testa que subárvores já convertidas são reaproveitadas pelo cache de conversão"""
+        root = ET.fromstring(
+            '<evtAdmissao><trabalhador><dependente><nmDep>Ana</nmDep></dependente>'
+            '<dependente><nmDep>Rui</nmDep></dependente></trabalhador></evtAdmissao>'
+        )
+        cache = {}
+        evento = self.processador._elemento_para_dict(root, cache)
+        dependentes = root.findall('.//dependente')
+        
+        assert self.processador._elemento_para_dict(dependentes[1], cache) is evento['trabalhador']['dependente'][1]
+        assert self.processador._elemento_para_dict(dependentes[0]) == {'nmDep': {'_text': 'Ana'}}
+    
+    def test_resultado_independe_do_namespace(self):
+        """Testa que o namespace resolvido em cache produz os mesmos registros de um documento sem namespace"""
+        xml_path = self.dir_teste / "S-2200.xml"
+        if not xml_path.exists():
+            pytest.skip("Arquivo XML de teste não encontrado")
+        
+        conteudo = xml_path.read_text(encoding='utf-8')
+        sem_namespace = conteudo.replace(
+            ' xmlns="http://www.esocial.gov.br/schema/evt/evtAdmissao/v_S_01_00_00"', '')
+        assert sem_namespace != conteudo
+        
+        registros = []
+        for texto in (conteudo, sem_namespace):
+            mock_bd = MagicMock()
+            processador = ProcessadorXML(mock_bd, self.mock_config)
+            root = ET.fromstring(texto.encode('utf-8'))
+            assert processador._processar_s2200(root[0], xml_path)
+            registros.append([c.args for c in mock_bd.inserir_dados.call_args_list])
+        
+        assert registros[0] == registros[1]
+    
+    def test_eventos_do_arquivo_inseridos_em_lote(self, tmp_path):
+        """Testa que os registros de todos os eventos de um arquivo são gravados em uma única inserção por tabela"""
+        xml_path = self.dir_teste / "S-2200.xml"
+        if not xml_path.exists():
+            pytest.skip("Arquivo XML de teste não encontrado")
+        
+        conteudo = xml_path.read_text(encoding='utf-8')
+        inicio = conteudo.index('<evtAdmissao')
+        fim = conteudo.index('</evtAdmissao>') + len('</evtAdmissao>')
+        lote = tmp_path / "S-2200-lote.xml"
+        lote.write_text(conteudo[:inicio] + conteudo[inicio:fim] * 3 + conteudo[fim:], encoding='utf-8')
+        
+        mock_bd = MagicMock(spec=GerenciadorBancoDados)
+        mock_bd.inserir_linhas.side_effect = lambda tabela, colunas, linhas: len(linhas)
+        processador = ProcessadorXML(mock_bd, self.mock_config)
+        assert processador.processar_arquivo(str(lote))
+        
+        chamadas = [c.args for c in mock_bd.inserir_linhas.call_args_list if c.args[0] == "esocial_s2200"]
+        assert len(chamadas) == 1
+        assert len(chamadas[0][2]) == 3
+    
+    def test_elemento_para_dict_arvore_profunda(self):
+        """Testa que a conversão iterativa não depende do limite de recursão"""
+        profundidade = sys.getrecursionlimit() + 100
+        root = ET.fromstring('<a>' * profundidade + 'fim' + '</a>' * profundidade)
+        
+        resultado = self.processador._elemento_para_dict(root)
+        for _ in range(profundidade - 1):
+            resultado = resultado['a']
+        assert resultado == {'_text': 'fim'}
+    
+    def test_s2299_nao_converte_evento_em_json(self):
+        """Testa que o S-2299, que não é gravado, não converte o evento inteiro em JSON"""
+        xml_path = self.dir_teste / "S-2299.xml"
+        if not xml_path.exists():
+            pytest.skip("Arquivo XML de teste não encontrado")
+        
+        processador = ProcessadorXML(MagicMock(), {'armazenar_json': True})
+        root = ET.parse(xml_path).getroot()
+        eventos = list(root) if root.tag.endswith('eSocial') else [root]
+        with patch.object(processador, '_elemento_para_dict') as mock_conversao:
+            assert all(processador._processar_s2299(evento, xml_path) for evento in eventos)
+        assert not mock_conversao.called
+    
+    def test_extrair_dados_xml(self, tmp_path):
+        """Testa a conversão do arquivo inteiro em dicionário, com filhos repetidos, texto e atributos"""
+        xml_path = tmp_path / "evento.xml"
+        xml_path.write_text(
+            '<eSocial xmlns="http://www.esocial.gov.br/schema/evt/evtAdmissao/v_S_01_00_00">'
+            '<evtAdmissao Id="ID1"><dependente><nmDep>Ana</nmDep></dependente>'
+            '<dependente><nmDep>Rui</nmDep></dependente><dependente/></evtAdmissao></eSocial>',
+            encoding='utf-8')
+        
+        dados = self.processador.extrair_dados_xml(str(xml_path))
+        
+        evento = dados['eSocial']['evtAdmissao']
+        assert evento['Id'] == "ID1"
+        assert evento['dependente'] == [{'nmDep': {'_text': 'Ana'}}, {'nmDep': {'_text': 'Rui'}}, {}]
+    
+    def test_detectar_layout_xml_em_cache(self, tmp_path):
+        """Testa que o layout de um arquivo inalterado não é relido e que um arquivo alterado é"""
+        xml_path = tmp_path / "evento.xml"
+        xml_path.write_text('<eSocial><evtAfastTemp><ideVinculo/></evtAfastTemp></eSocial>', encoding='utf-8')
+        
+        with patch('processadores.processador_xml.identificar_layout_arquivo',
+                   wraps=identificar_layout_arquivo) as mock_identificar:
+            assert self.processador.detectar_layout_xml(str(xml_path)) == "S-2230"
+            assert self.processador.detectar_layout_xml(str(xml_path)) == "S-2230"
+            assert mock_identificar.call_count == 1
+            
+            xml_path.write_text('<eSocial><evtAdmissao><trabalhador/></evtAdmissao></eSocial>', encoding='utf-8')
+            assert self.processador.detectar_layout_xml(str(xml_path)) == "S-2200"
+            assert mock_identificar.call_count == 2
@@ -26,6 +26,11 @@ class TestValidadorDados(unittest.TestCase):
         self.assertFalse(ValidadorDados.validar_cpf("123.456.789-10"))
         self.assertFalse(ValidadorDados.validar_cpf("12345678910"))
         self.assertFalse(ValidadorDados.validar_cpf(""))
+        
+        # CPFs repetidos são respondidos pelo cache
+        acertos = ValidadorDados.validar_cpf.cache_info().hits
+        self.assertTrue(ValidadorDados.validar_cpf("12345678909"))
+        self.assertEqual(ValidadorDados.validar_cpf.cache_info().hits, acertos + 1)
 
     def test_validar_cnpj(self):
         """Testa validação de CNPJ"""
@@ -133,6 +138,47 @@ class TestValidadorDados(unittest.TestCase):
         self.assertFalse(valido)
         self.assertEqual(len(erros), 4) # 4 erros
 
+    def test_validar_s1030_df(self):
+        """Testa que a validação em lote concorda com a validação por registro S-1030"""
+        import pandas as pd
+        registros = [
+            {'codigo': 'CARGO1', 'cbo': '123456', 'inicio_validade': '2020-01-01',
+             'fim_validade': '', 'cnpj_empregador': '11222333000181'},
+            {'codigo': '', 'cbo': '123456', 'inicio_validade': '', 'fim_validade': '',
+             'cnpj_empregador': ''},
+            {'codigo': 'CARGO3', 'cbo': '1234', 'inicio_validade': '', 'fim_validade': '',
+             'cnpj_empregador': ''},
+            {'codigo': 'CARGO4', 'cbo': '', 'inicio_validade': '2020-02-30', 'fim_validade': '',
+             'cnpj_empregador': ''},
+            {'codigo': 'CARGO5', 'cbo': '', 'inicio_validade': '2021-01-01',
+             'fim_validade': '2020-01-01', 'cnpj_empregador': ''},
+            {'codigo': 'CARGO6', 'cbo': '', 'inicio_validade': '2020-01', 'fim_validade': '',
+             'cnpj_empregador': '11111111111111'},
+            {'codigo': 'CARGO7', 'cbo': '', 'inicio_validade': '2020-01-01\n', 'fim_validade': '',
+             'cnpj_empregador': ''},
+        ]
+        validos = ValidadorDados.validar_s1030_df(pd.DataFrame(registros))
+        esperados = [ValidadorDados.validar_registro_s1030(registro)[0] for registro in registros]
+        self.assertEqual(validos.tolist(), esperados)
+        self.assertEqual(esperados, [True, False, False, False, False, False, False])
+
+    def test_registro_s2299_valido(self):
+        """Testa que a verificação rápida concorda com a validação completa do S-2299"""
+        valido = {'cpf_trabalhador': '12345678909', 'data_desligamento': '2024-06-09',
+                  'motivo_desligamento': '02', 'cnpj_empregador': '11222333000181'}
+        registros = [
+            valido,
+            dict(valido, cpf_trabalhador=''),
+            dict(valido, cpf_trabalhador='12345678910'),
+            dict(valido, data_desligamento=''),
+            dict(valido, data_desligamento='2024-13-09'),
+            dict(valido, motivo_desligamento=''),
+            dict(valido, cnpj_empregador='11111111111111'),
+        ]
+        esperados = [ValidadorDados.validar_registro_s2299(registro)[0] for registro in registros]
+        self.assertEqual([ValidadorDados.registro_s2299_valido(registro) for registro in registros], esperados)
+        self.assertEqual(esperados, [True, True, False, False, False, False, False])
+
     # def test_validar_registro_s2299(self):
     #     """Testa validação de registro S-2299"""
     #     dados = {
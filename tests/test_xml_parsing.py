@@ -18,8 +18,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from processadores.processador_xml import (
     identificar_layout, ProcessadorXML, extrair_tipo_evento,
     extrair_namespace_dinamico, obter_namespaces_dinamicos, 
-    encontrar_elemento, encontrar_todos_elementos, obter_texto_elemento
+    encontrar_elemento, encontrar_todos_elementos, obter_texto_elemento,
+    iterar_eventos_esocial, extrair_textos_por_escopo, listar_arquivos_xml,
+    encontrar_primeiro_esocial, coletar_itens_remuneracao, coletar_rubricas_rescisao,
+    layout_pelo_nome_arquivo, identificar_layout_com_dica, mapear_campos,
+    converter_decimal, serializar_json, identificar_layout_arquivo,
+    _inicializar_processo_trabalho, _processar_arquivo_em_processo
 )
+from banco_dados.gerenciador_banco_dados import GerenciadorBancoDados
 
 class TestXmlParsing:
     """Tests for XML parsing functionality"""
@@ -163,3 +169,239 @@ class TestXmlParsing:
                 
                 # Verify processor was created correctly
                 assert processor is not None, f"Processor creation failed for {xml_file}"
+
+    def test_streaming_eventos_esocial(self):
+        """Test that each child of <eSocial> is yielded once and released after processing"""
+        file_path = self.xml_dir / "S-1000_multiplos.xml"
+        
+        recibos = []
+        raiz_final = None
+        for raiz, evento in iterar_eventos_esocial(file_path):
+            assert evento is not raiz
+            recibos.append(obter_texto_elemento(evento, "nrRecibo"))
+            raiz_final = raiz
+        
+        assert recibos == ["1", "2"]
+        # Only the last (cleared) event may remain attached to the root
+        assert len(raiz_final) <= 1
+    
+    def test_leitura_integral_arquivo_pequeno(self):
+        """Test that a small file read at once yields the same events as streaming"""
+        file_path = self.xml_dir / "S-1000_multiplos.xml"
+        tamanho = file_path.stat().st_size
+        
+        integral = [obter_texto_elemento(evento, "nrRecibo") for _, evento in iterar_eventos_esocial(file_path, tamanho)]
+        streaming = [obter_texto_elemento(evento, "nrRecibo") for _, evento in iterar_eventos_esocial(file_path)]
+        
+        assert integral == streaming == ["1", "2"]
+    
+    def test_arquivo_grande_truncado_nao_grava_eventos(self, tmp_path):
+        """Test that a large file malformed partway through writes none of its events"""
+        conteudo = (self.xml_dir / "S-1020.xml").read_text(encoding="utf-8")
+        inicio = conteudo.index("<evtTabLotacao")
+        evento = conteudo[inicio:conteudo.index("</eSocial>")]
+        cabecalho = conteudo[:inicio]
+        repeticoes = 1024 * 1024 // len(evento) + 2
+        file_path = tmp_path / "S-1020_truncado.xml"
+        file_path.write_text(cabecalho + evento * repeticoes + evento[:len(evento) // 2], encoding="utf-8")
+        
+        mock_db = MagicMock(spec=GerenciadorBancoDados)
+        processor = ProcessadorXML(mock_db, {})
+        assert not processor.processar_arquivo(str(file_path))
+        mock_db.inserir_linhas.assert_not_called()
+        assert (processor.arquivos_processados, processor.arquivos_com_erro) == (0, 1)
+        
+        _inicializar_processo_trabalho({})
+        resultado, insercoes, processados, com_erro = _processar_arquivo_em_processo(file_path)
+        assert resultado is None and insercoes == []
+        assert (processados, com_erro) == (0, 1)
+    
+    def test_streaming_evento_unico(self, tmp_path):
+        """Test that a file whose root is not <eSocial> is yielded as a whole"""
+        file_path = tmp_path / "S-2230.xml"
+        file_path.write_text(
+            '<evtAfastTemp><ideVinculo><cpfTrab>12345678901</cpfTrab></ideVinculo></evtAfastTemp>',
+            encoding='utf-8'
+        )
+        
+        eventos = list(iterar_eventos_esocial(file_path))
+        
+        assert len(eventos) == 1
+        raiz, evento = eventos[0]
+        assert evento is raiz
+        assert obter_texto_elemento(raiz, "cpfTrab") == "12345678901"
+    
+    def test_identificar_layout_arquivo(self, tmp_path):
+        """Test that streaming layout detection matches the tree-based one and stops at the first event"""
+        for xml_file in ("S-1020.xml", "S-2200.xml", "S-2230.xml", "S-1000.xml"):
+            file_path = self.xml_dir / xml_file
+            if file_path.exists():
+                assert identificar_layout_arquivo(file_path) == identificar_layout(ET.parse(file_path).getroot())
+        
+        # Reading stops at the first supported event, so the rest of the file is never parsed
+        file_path = tmp_path / "lote.xml"
+        file_path.write_text('<eSocial><evtAdmissao><cpfTrab>1</cpfTrab></evtAdmissao><evtRemun>', encoding='utf-8')
+        assert identificar_layout_arquivo(file_path) == "S-2200"
+    
+    def test_extrair_textos_por_escopo(self):
+        """Test that scoped single-pass extraction matches nested descendant lookups"""
+        evento = ET.fromstring(
+            '<alteracao><ideLotacao><codLotacao>L1</codLotacao><iniValid>2023-01</iniValid></ideLotacao>'
+            '<dadosLotacao><fpasLotacao><fpas>515</fpas><infoProcJudTerceiros>'
+            '<procJudTerceiro><codSusp>9</codSusp></procJudTerceiro></infoProcJudTerceiros></fpasLotacao>'
+            '</dadosLotacao><novaValidade><iniValid>2024-01</iniValid></novaValidade></alteracao>'
+        )
+        
+        textos = extrair_textos_por_escopo(evento, {
+            'ideLotacao': None,
+            'novaValidade': None,
+            'dadosLotacao': None,
+            'fpasLotacao': 'dadosLotacao',
+            'infoProcJudTerceiros': 'fpasLotacao',
+            'procJudTerceiro': 'infoProcJudTerceiros',
+            'dadosOpPort': 'dadosLotacao',
+        })
+        
+        assert textos['ideLotacao']['iniValid'] == "2023-01"
+        assert textos['novaValidade']['iniValid'] == "2024-01"
+        assert textos['fpasLotacao']['fpas'] == "515"
+        assert textos['infoProcJudTerceiros']['codSusp'] == "9"
+        assert textos['procJudTerceiro']['codSusp'] == "9"
+        assert 'dadosOpPort' not in textos
+        
+        # The None scope collects the first descendant of each name under the root itself
+        textos = extrair_textos_por_escopo(evento, {None: None, 'novaValidade': None})
+        assert textos[None]['iniValid'] == "2023-01"
+        assert textos[None]['codSusp'] == "9"
+        assert textos['novaValidade'] == {'iniValid': "2024-01"}
+        
+        # Only the named categorical elements are interned
+        textos = extrair_textos_por_escopo(evento, {None: None}, frozenset({'fpas'}))
+        assert textos[None]['fpas'] is sys.intern("515")
+        assert textos[None]['codLotacao'] == "L1"
+    
+    def test_mapear_campos(self):
+        """Test that a field schema maps scoped texts to columns, leaving missing fields empty"""
+        textos = {'ideCargo': {'codCargo': 'C1', 'iniValid': '2023-01'}}
+        campos = (
+            ('ideCargo', 'codCargo', 'codigo'),
+            ('ideCargo', 'fimValid', 'fim_validade'),
+            ('dadosCargo', 'nmCargo', 'descricao'),
+        )
+        
+        registro = mapear_campos(textos, campos)
+        
+        assert registro == {'codigo': 'C1', 'fim_validade': '', 'descricao': ''}
+        assert list(registro) == ['codigo', 'fim_validade', 'descricao']
+    
+    def test_converter_decimal(self):
+        """Test decimal conversion with dot or comma separators and invalid values"""
+        assert converter_decimal("1500.50") == 1500.5
+        assert converter_decimal("1500,50") == 1500.5
+        assert converter_decimal("") == 0.0
+        assert converter_decimal("abc") == 0.0
+        assert converter_decimal("1.500,50") == 0.0
+    
+    def test_serializar_json(self):
+        """Test that json_data is serialized in the compact format with accents preserved"""
+        dados = {'nmTrab': {'_text': 'João'}, 'dependente': [{'nmDep': {'_text': 'Ana'}}]}
+        
+        assert serializar_json(dados) == '{"nmTrab":{"_text":"João"},"dependente":[{"nmDep":{"_text":"Ana"}}]}'
+    
+    def test_filtro_arquivos_diretorio(self, tmp_path):
+        """Test recursive XML listing and the supported file name filter"""
+        (tmp_path / "sub").mkdir()
+        for nome in ["S-2200.xml", "s_1200_jan.xml", "sub/S1020.xml", "S-1000.xml", "S-2230.txt"]:
+            (tmp_path / nome).write_text("<x/>", encoding="utf-8")
+        
+        assert sorted(a.name for a in listar_arquivos_xml(tmp_path)) == [
+            "S-1000.xml", "S-2200.xml", "S1020.xml", "s_1200_jan.xml"]
+        
+        processor = ProcessadorXML(MagicMock(), {})
+        with patch.object(ProcessadorXML, '_processar_arquivo', return_value=None) as mock_processar:
+            processor.processar_diretorio(tmp_path)
+        assert sorted(c.args[0].name for c in mock_processar.call_args_list) == [
+            "S-2200.xml", "S1020.xml", "s_1200_jan.xml"]
+    
+    def test_encontrar_primeiro_esocial(self):
+        """Test the bounded search for the <eSocial> element"""
+        ns = "http://www.esocial.gov.br/schema/evt/evtAdmissao/v_S_01_02_00"
+        lote = ET.fromstring(
+            f'<retorno><eventos><evento><eSocial xmlns="{ns}"><evtAdmissao/></eSocial></evento></eventos></retorno>')
+        esocial = encontrar_primeiro_esocial(lote)
+        assert esocial is not None and esocial.tag == f"{{{ns}}}eSocial"
+        assert encontrar_primeiro_esocial(esocial) is esocial
+        assert encontrar_primeiro_esocial(ET.fromstring('<evtAdmissao><a><b/></a></evtAdmissao>')) is None
+        assert encontrar_primeiro_esocial(lote, profundidade_maxima=2) is None
+    
+    def test_arquivo_latin1_sem_declaracao(self, tmp_path):
+        """Test that an ISO-8859-1 file without encoding declaration is reread with the detected encoding"""
+        file_path = tmp_path / "S-2230.xml"
+        file_path.write_bytes(
+            '<evtAfastTemp><ideVinculo><cpfTrab>12345678901</cpfTrab></ideVinculo>'
+            '<infoAfastamento><iniAfastamento><dtIniAfast>2024-01-10</dtIniAfast>'
+            '<codMotAfast>01</codMotAfast><observacao>Afastamento médico</observacao>'
+            '</iniAfastamento></infoAfastamento></evtAfastTemp>'.encode('latin-1')
+        )
+        mock_db = MagicMock(spec=GerenciadorBancoDados)
+        mock_db.inserir_linhas.side_effect = lambda tabela, colunas, linhas: len(linhas)
+        processor = ProcessadorXML(mock_db, {})
+        
+        assert processor.processar_arquivo(str(file_path))
+        tabela, colunas, linhas = mock_db.inserir_linhas.call_args.args
+        assert tabela == "esocial_s2230"
+        assert dict(zip(colunas, linhas[0]))['cpf_trabalhador'] == "12345678901"
+    
+    def test_coletar_itens_remuneracao(self):
+        """Test single-pass S-1200 collection of context blocks and itensRemun"""
+        evento = ET.fromstring(
+            '<evtRemun><ideEvento><perApur>2024-01</perApur></ideEvento>'
+            '<ideTrabalhador><cpfTrab>12345678901</cpfTrab></ideTrabalhador>'
+            '<dmDev><ideDmDev>A</ideDmDev><codCateg>101</codCateg>'
+            '<infoPerApur><ideEstabLot><nrInsc>111</nrInsc><remunPerApur><matricula>M1</matricula>'
+            '<itensRemun><codRubr>R1</codRubr><vrRubr>10.5</vrRubr></itensRemun>'
+            '<itensRemun><codRubr>R2</codRubr><vrRubr>20</vrRubr></itensRemun>'
+            '</remunPerApur></ideEstabLot></infoPerApur>'
+            '<infoPerAnt><ideEstabLot><remunPerApur><itensRemun><codRubr>X</codRubr></itensRemun>'
+            '</remunPerApur></ideEstabLot></infoPerAnt></dmDev>'
+            '<dmDev><ideDmDev>B</ideDmDev><infoPerApur><ideEstabLot><remunPerApur>'
+            '<itensRemun><codRubr>R3</codRubr></itensRemun></remunPerApur></ideEstabLot></infoPerApur></dmDev>'
+            '</evtRemun>'
+        )
+        
+        contexto, itens = coletar_itens_remuneracao(evento)
+        
+        assert contexto['ideEvento']['perApur'] == "2024-01"
+        assert contexto['ideTrabalhador']['cpfTrab'] == "12345678901"
+        assert [item['codRubr'] for _, _, _, item, _ in itens] == ["R1", "R2", "R3"]
+        assert [dm['ideDmDev'] for dm, _, _, _, _ in itens] == ["A", "A", "B"]
+        assert itens[0][1]['nrInsc'] == "111" and itens[0][2]['matricula'] == "M1"
+        assert itens[0][4].tag == "itensRemun"
+    
+    def test_coletar_rubricas_rescisao(self):
+        """Test single-pass S-2299 collection of the itensRemun inside each dmDev"""
+        verbas = ET.fromstring(
+            '<verbasResc><dmDev><ideDmDev>A</ideDmDev><infoPerApur><ideEstabLot>'
+            '<detVerbas><itensRemun><codRubr>R1</codRubr><vrRubr>10,5</vrRubr></itensRemun>'
+            '<itensRemun><codRubr>R2</codRubr></itensRemun></detVerbas>'
+            '</ideEstabLot></infoPerApur></dmDev>'
+            '<itensRemun><codRubr>FORA</codRubr></itensRemun>'
+            '<dmDev><itensRemun><codRubr>R3</codRubr><vrRubr>1</vrRubr></itensRemun></dmDev>'
+            '</verbasResc>'
+        )
+        
+        itens = coletar_rubricas_rescisao(verbas)
+        
+        assert [item['codRubr'] for item in itens] == ["R1", "R2", "R3"]
+        assert itens[0]['vrRubr'] == "10,5"
+        assert 'vrRubr' not in itens[1]
+    
+    def test_layout_pelo_nome_arquivo(self):
+        """Test the layout hint taken from the file name, accepted only when the event confirms it"""
+        assert layout_pelo_nome_arquivo("S-2200_dependentes.xml") == "S-2200"
+        assert layout_pelo_nome_arquivo("s_1200.xml") == "S-1200"
+        assert layout_pelo_nome_arquivo("S-1000.xml") is None
+        
+        evento = ET.fromstring('<evtAltCadastral><ideEvento/></evtAltCadastral>')
+        assert identificar_layout_com_dica(evento, "S-2205") == "S-2205"
+        assert identificar_layout_com_dica(evento, "S-2200") == "S-2205"